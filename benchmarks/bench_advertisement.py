@@ -0,0 +1,140 @@
+"""Micro-benchmark for advertisement handling.
+
+Feeds the advertisements of 20 devices at 15 per second each, 300 per
+second in total as a busy Bluetooth stack delivers them, to
+``DataCoordinator._async_handle_bluetooth_event``.  Payloads repeat and the
+RSSI jitters by a few dBm, as it does for stationary sensors.  Compares
+dropping repeated raw advertisements before parsing against parsing every
+advertisement, as it was before.  Requires Home Assistant.  Run from the
+repository root::
+
+    python -m benchmarks.bench_advertisement
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from bleak.backends.device import BLEDevice
+from bleak.backends.scanner import AdvertisementData
+
+from custom_components.ld2410 import api
+from custom_components.ld2410.coordinator import _LOGGER, DataCoordinator
+
+DEVICES = 20
+ADVERTISEMENT_RATE = 15
+# Simulated seconds of advertisements
+DURATION = 60
+MANUFACTURER_DATA = {
+    256: b"D\x02\x101\x07$\x00\xaa\xbb\xcc\xdd\xee\xff",
+    1494: b"\x08\x00JLAISDK",
+}
+
+
+class _LegacyDataCoordinator(DataCoordinator):
+    """Coordinator parsing every advertisement as before the fast path."""
+
+    def _async_handle_bluetooth_event(
+        self, service_info: Any, change: Any = None
+    ) -> None:
+        self.ble_device = service_info.device
+        if not (
+            adv := api.parse_advertisement_data(
+                service_info.device, service_info.advertisement, self.model
+            )
+        ):
+            return
+        if "modelName" in adv.data:
+            self._ready_event.set()
+        _LOGGER.debug("%s: Device data: %s", self.ble_device.address, self.device.data)
+        if not self.device.advertisement_changed(adv) and not self._was_unavailable:
+            return
+        raise AssertionError("advertisements do not change")
+
+
+def _service_info(ble_device: BLEDevice, rssi: int) -> SimpleNamespace:
+    """Return an advertisement with payloads copied as the stack delivers."""
+    manufacturer_data = {
+        company: bytes(bytearray(data)) for company, data in MANUFACTURER_DATA.items()
+    }
+    advertisement = AdvertisementData(
+        local_name="HLK-LD2410_96D8",
+        manufacturer_data=manufacturer_data,
+        service_data={},
+        service_uuids=["0000af30-0000-1000-8000-00805f9b34fb"],
+        tx_power=-127,
+        rssi=rssi,
+        platform_data=(),
+    )
+    return SimpleNamespace(
+        source="proxy",
+        device=ble_device,
+        advertisement=advertisement,
+        manufacturer_data=manufacturer_data,
+        service_data={},
+        rssi=rssi,
+    )
+
+
+def _coordinator(cls: type[DataCoordinator], ble_device: BLEDevice) -> Any:
+    """Return a coordinator that has seen its device, without Home Assistant."""
+    coordinator = cls.__new__(cls)
+    coordinator.ble_device = ble_device
+    coordinator.device = api.LD2410(ble_device)
+    coordinator.model = api.Model.LD2410
+    coordinator._ready_event = SimpleNamespace(set=lambda: None)
+    coordinator._was_unavailable = False
+    coordinator._last_raw_advertisement = None
+    adv = api.parse_advertisement_data(
+        ble_device, _service_info(ble_device, -70).advertisement
+    )
+    coordinator.device.update_from_advertisement(adv)
+    return coordinator
+
+
+def _run(cls: type[DataCoordinator]) -> float:
+    rng = random.Random(0)
+    ble_devices = [
+        BLEDevice(address=f"AA:BB:CC:DD:EE:{index:02X}", name="bench", details=None)
+        for index in range(DEVICES)
+    ]
+    coordinators = [_coordinator(cls, ble_device) for ble_device in ble_devices]
+    base_rssi = [rng.randint(-90, -50) for _ in ble_devices]
+    stream = [
+        (
+            coordinators[index],
+            _service_info(ble_device, base_rssi[index] + rng.randint(-2, 2)),
+        )
+        for _ in range(DURATION * ADVERTISEMENT_RATE)
+        for index, ble_device in enumerate(ble_devices)
+    ]
+    start = time.perf_counter()
+    for coordinator, service_info in stream:
+        coordinator._async_handle_bluetooth_event(service_info, None)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Print advertisement handling time before and after."""
+    advertisements = DEVICES * ADVERTISEMENT_RATE * DURATION
+    before = min(_run(_LegacyDataCoordinator) for _ in range(5))
+    after = min(_run(DataCoordinator) for _ in range(5))
+    print(
+        f"{advertisements:,} advertisements from {DEVICES} devices "
+        f"({DEVICES * ADVERTISEMENT_RATE}/s)"
+    )
+    print(
+        f"handling time  before {before * 1000:>8,.1f}ms "
+        f"after {after * 1000:>8,.1f}ms x{before / after:.1f}"
+    )
+    print(
+        f"per advert     before {before / advertisements * 1e6:>8,.2f}us "
+        f"after {after / advertisements * 1e6:>8,.2f}us"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Micro-benchmark for the disconnect timer.
+
+Feeds notifications to 50 simulated devices at 10 per second each and
+compares the deadline based disconnect timer against cancelling and
+rescheduling a ``TimerHandle`` on every notification, as it was before.
+The event loop runs on a simulated clock, so timers fire as they would
+over the simulated minute.  Reports the time spent resetting the timer,
+the timers scheduled and the size of the event loop's timer heap.  Run
+from the repository root::
+
+    python -m benchmarks.bench_disconnect_timer
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+from bleak.backends.device import BLEDevice
+
+from custom_components.ld2410.api.devices.device import (
+    DISCONNECT_DELAY,
+    ConnectionState,
+)
+from custom_components.ld2410.api.devices.ld2410 import LD2410
+
+DEVICES = 50
+NOTIFICATION_RATE = 10
+# Simulated seconds of notifications
+DURATION = 60
+
+
+class _LegacyTimerLD2410(LD2410):
+    """Device resetting its disconnect timer as before the deadline timer."""
+
+    def _reset_disconnect_timer(self) -> None:
+        self._cancel_state_timer()
+        self._state_timer = self.loop.call_later(
+            DISCONNECT_DELAY, self._disconnect_from_timer
+        )
+
+    def _disconnect_from_timer(self) -> None:
+        self._state_timer = None
+
+
+async def _run(cls: type[LD2410]) -> dict[str, Any]:
+    loop = asyncio.get_running_loop()
+    devices = [
+        cls(BLEDevice(address=f"AA:BB:{index:02X}", name="bench", details=None))
+        for index in range(DEVICES)
+    ]
+    for device in devices:
+        device._set_state(ConnectionState.STREAMING)
+    now = loop.time()
+    scheduled = 0
+    call_at = loop.call_at
+
+    def _counting_call_at(*args: Any, **kwargs: Any) -> asyncio.TimerHandle:
+        nonlocal scheduled
+        scheduled += 1
+        return call_at(*args, **kwargs)
+
+    loop.call_at = _counting_call_at  # type: ignore[method-assign]
+    loop.time = lambda: now  # type: ignore[method-assign]
+    max_heap = 0
+    elapsed = 0.0
+    try:
+        for _ in range(DURATION * NOTIFICATION_RATE):
+            start = time.perf_counter()
+            for device in devices:
+                device._reset_disconnect_timer()
+            elapsed += time.perf_counter() - start
+            max_heap = max(max_heap, len(loop._scheduled))  # type: ignore[attr-defined]
+            # Let the loop run a cycle, which fires due timers and purges
+            # cancelled ones
+            now += 1 / NOTIFICATION_RATE
+            await asyncio.sleep(0)
+    finally:
+        del loop.call_at, loop.time
+        for device in devices:
+            device._set_state(ConnectionState.IDLE)
+    return {"elapsed": elapsed, "scheduled": scheduled, "max_heap": max_heap}
+
+
+def main() -> None:
+    """Print timer overhead before and after."""
+    notifications = DEVICES * NOTIFICATION_RATE * DURATION
+    before = asyncio.run(_run(_LegacyTimerLD2410))
+    after = asyncio.run(_run(LD2410))
+    print(f"{notifications:,} notifications from {DEVICES} devices")
+    for label, key, scale, unit in (
+        ("reset time", "elapsed", 1000, "ms"),
+        ("timers scheduled", "scheduled", 1, ""),
+        ("max timer heap", "max_heap", 1, ""),
+    ):
+        old, new = before[key] * scale, after[key] * scale
+        print(
+            f"{label:<17} before {old:>10,.1f}{unit:<2} "
+            f"after {new:>10,.1f}{unit:<2} x{old / new:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
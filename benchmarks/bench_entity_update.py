@@ -0,0 +1,112 @@
+"""Micro-benchmark for entity change detection.
+
+Compares the fingerprint based change detection of
+``Entity._handle_coordinator_update`` against building the full state with
+``_Entity__async_calculate_state`` on every callback, for callbacks that do
+not change the published state.  Requires Home Assistant.  Run from the
+repository root::
+
+    python -m benchmarks.bench_entity_update
+"""
+
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import timeit
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.ld2410.entity import Entity
+from custom_components.ld2410.helpers import Deadband
+from custom_components.ld2410.number import LightSensitivityNumber
+from custom_components.ld2410.sensor import GateEnergySensor, Sensor
+
+ROUNDS = 20_000
+
+
+def _legacy_update(entity: Entity) -> None:
+    """Change detection as it was before the fingerprint cache."""
+    if not entity.enabled:
+        return
+    entity._async_update_attrs()
+    if (current_state := entity.hass.states.get(entity.entity_id)) is not None:
+        new_state, new_attributes, *_ = entity._Entity__async_calculate_state()
+        if (
+            new_state == current_state.state
+            and new_attributes == current_state.attributes
+        ):
+            return
+    entity.async_write_ha_state()
+
+
+def _coordinator() -> SimpleNamespace:
+    device = SimpleNamespace(
+        parsed_data={
+            "light_threshold": 10,
+            "move_energy": 42,
+            "move_gate_energy": [1, 2, 3, 4, 5, 6, 7, 8, 9],
+        },
+        is_reconnecting=False,
+        is_connected=True,
+        subscribe=MagicMock(return_value=lambda: None),
+    )
+    return SimpleNamespace(
+        device=device,
+        ble_device=SimpleNamespace(address="AA:BB:CC:DD:EE:FF"),
+        base_unique_id="bench",
+        model=SimpleNamespace(name="LD2410"),
+        device_name="Bench",
+        last_update_success=True,
+        publish_interval=0.0,
+        deadband=lambda _sensor_class: Deadband(),
+    )
+
+
+def _platform(domain: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        platform_name=domain,
+        domain=domain,
+        default_language_platform_translations={},
+        component_translations={},
+        platform_translations={},
+    )
+
+
+def _rate(func: Any, entity: Entity) -> float:
+    seconds = min(timeit.repeat(lambda: func(entity), number=ROUNDS, repeat=5))
+    return ROUNDS / seconds
+
+
+async def main() -> None:
+    """Print unchanged callbacks per second and entity before and after."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        coordinator = _coordinator()
+        entities: list[tuple[str, Entity]] = [
+            ("sensor", Sensor(coordinator, "move_energy")),
+            ("gate sensor", GateEnergySensor(coordinator, "move_gate_energy", 3)),
+            ("number", LightSensitivityNumber(coordinator)),
+        ]
+        for index, (name, entity) in enumerate(entities):
+            domain = "number" if name == "number" else "sensor"
+            entity.hass = hass
+            entity.entity_id = f"{domain}.bench_{index}"
+            entity.platform = _platform(domain)
+            entity.registry_entry = None
+            entity.async_write_ha_state()
+
+            before = _rate(_legacy_update, entity)
+            after = _rate(Entity._handle_coordinator_update, entity)
+            print(
+                f"callbacks {name:<12} before {before:>10,.0f}/s "
+                f"after {after:>10,.0f}/s  x{after / before:.2f}"
+            )
+        await hass.async_stop(force=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
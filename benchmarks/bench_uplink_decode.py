@@ -0,0 +1,165 @@
+"""Micro-benchmark for the uplink frame decoder.
+
+Compares the struct/memoryview decoder against the previous slice and
+hex-string based implementation.  Run from the repository root::
+
+    python -m benchmarks.bench_uplink_decode
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+from array import array
+from typing import Any
+
+from bleak.backends.device import BLEDevice
+
+from custom_components.ld2410.api.const import (
+    RX_FOOTER,
+    RX_HEADER,
+    UPLINK_TYPE_BASIC,
+    UPLINK_TYPE_ENGINEERING,
+)
+from custom_components.ld2410.api.devices.ld2410 import (
+    LD2410,
+    _frame_payload,
+)
+from custom_components.ld2410.api.models import UplinkFrame
+
+BASIC_PAYLOAD = bytes.fromhex("02aa0101001402002803005500")
+ENGINEERING_PAYLOAD = bytes.fromhex(
+    "01aa034e00334e00643e000808123318050403050306000064202627190f1501015500"
+)
+RX_HEADER_BYTES = bytes.fromhex(RX_HEADER)
+RX_FOOTER_BYTES = bytes.fromhex(RX_FOOTER)
+ROUNDS = 200_000
+
+
+def _legacy_parse(data: bytes) -> dict[str, Any] | None:
+    """Decoder as it was before the struct based implementation."""
+    if len(data) < 2 or data[1] != 0xAA:
+        return None
+    frame_type = data[:1].hex()
+    if frame_type == UPLINK_TYPE_ENGINEERING:
+        ftype = "engineering"
+    elif frame_type == UPLINK_TYPE_BASIC:
+        ftype = "basic"
+    else:
+        raise ValueError(f"unknown frame type {frame_type}")
+    if not data.endswith(b"\x55\x00"):
+        raise ValueError("missing frame footer")
+    content = data[2:-2]
+    if len(content) < 9:
+        raise ValueError("payload too short for basic data")
+    status_raw = content[0]
+    moving = status_raw in (0x01, 0x03)
+    stationary = status_raw in (0x02, 0x03)
+    result: dict[str, Any] = {
+        "type": ftype,
+        "moving": moving,
+        "stationary": stationary,
+        "occupancy": moving or stationary,
+        "move_distance_cm": int.from_bytes(content[1:3], "little"),
+        "move_energy": content[3],
+        "still_distance_cm": int.from_bytes(content[4:6], "little"),
+        "still_energy": content[6],
+        "detect_distance_cm": int.from_bytes(content[7:9], "little"),
+    }
+    if ftype == "engineering":
+        idx = 9
+        max_move_gate = content[idx]
+        max_still_gate = content[idx + 1]
+        idx += 2
+        move_len = max_move_gate + 1
+        still_len = max_still_gate + 1
+        move_gate_energy = list(content[idx : idx + move_len])
+        idx += move_len
+        still_gate_energy = list(content[idx : idx + still_len])
+        idx += still_len
+        result.update(
+            {
+                "max_move_gate": max_move_gate,
+                "max_still_gate": max_still_gate,
+                "move_gate_energy": move_gate_energy,
+                "still_gate_energy": still_gate_energy,
+                "photo_sensor": content[idx],
+                "out_pin": bool(content[idx + 1]),
+            }
+        )
+    return result
+
+
+def _legacy_unwrap(data: bytes, header: str, footer: str) -> bytes:
+    hdr = bytearray.fromhex(header)
+    ftr = bytearray.fromhex(footer)
+    if data.startswith(hdr) and data.endswith(ftr):
+        length = int.from_bytes(data[len(hdr) : len(hdr) + 2], "little")
+        return data[len(hdr) + 2 : len(hdr) + 2 + length]
+    return data
+
+
+def _legacy_unwrap_and_parse(frame: bytes) -> dict[str, Any] | None:
+    return _legacy_parse(_legacy_unwrap(frame, RX_HEADER, RX_FOOTER))
+
+
+def _frame(payload: bytes) -> bytearray:
+    length = len(payload).to_bytes(2, "little").hex()
+    return bytearray.fromhex(RX_HEADER + length + payload.hex() + RX_FOOTER)
+
+
+def _rate(func: Any, arg: Any) -> float:
+    seconds = min(timeit.repeat(lambda: func(arg), number=ROUNDS, repeat=5))
+    return ROUNDS / seconds
+
+
+def _as_lists(frame: Any) -> dict[str, Any]:
+    return {k: v.tolist() if isinstance(v, array) else v for k, v in frame.items()}
+
+
+def _deep_size(value: Any) -> int:
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_deep_size(item) for item in value.values())
+    elif isinstance(value, list):
+        size += sum(_deep_size(item) for item in value)
+    elif isinstance(value, UplinkFrame):
+        size += sum(_deep_size(item) for item in value.values())
+    return size if not isinstance(value, (bool, int, str)) else 0
+
+
+def main() -> None:
+    """Print decoded frames per second before and after."""
+    device = LD2410(BLEDevice(address="AA:BB", name="bench", details=None))
+    for name, payload in (
+        ("basic", BASIC_PAYLOAD),
+        ("engineering", ENGINEERING_PAYLOAD),
+    ):
+        assert _legacy_parse(payload) == _as_lists(device._parse_uplink_frame(payload))
+        before = _rate(_legacy_parse, payload)
+        after = _rate(device._parse_uplink_frame, payload)
+        print(
+            f"decode {name:<12} before {before:>12,.0f}/s "
+            f"after {after:>12,.0f}/s  x{after / before:.2f}"
+        )
+
+    frame = _frame(ENGINEERING_PAYLOAD)
+    before = _rate(_legacy_unwrap_and_parse, frame)
+    after = _rate(
+        lambda data: device._parse_uplink_frame(
+            _frame_payload(data, RX_HEADER_BYTES, RX_FOOTER_BYTES)
+        ),
+        frame,
+    )
+    print(
+        f"unwrap {'engineering':<12} before {before:>12,.0f}/s "
+        f"after {after:>12,.0f}/s  x{after / before:.2f}"
+    )
+
+    before = _deep_size(_legacy_parse(ENGINEERING_PAYLOAD))
+    after = _deep_size(device._parse_uplink_frame(ENGINEERING_PAYLOAD))
+    print(f"record {'engineering':<12} before {before:>8} B    after {after:>8} B")
+
+
+if __name__ == "__main__":
+    main()
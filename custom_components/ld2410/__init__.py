@@ -1,7 +1,6 @@
 """Support for devices."""
 
-import asyncio
-import contextlib
+from functools import partial
 import logging
 
 from . import api
@@ -20,24 +19,26 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr
 
+from .config_cache import ConfigCache, async_remove_config_cache
+from .connection_slots import async_get_connection_slots
 from .const import (
     CONF_RETRY_COUNT,
+    CONF_STARTUP_CONCURRENCY,
+    CONF_STARTUP_PRIORITY,
     CONNECTABLE_MODEL_TYPES,
     DEFAULT_RETRY_COUNT,
-    CONF_SAVED_MOVE_SENSITIVITY,
-    CONF_SAVED_STILL_SENSITIVITY,
+    DEFAULT_STARTUP_CONCURRENCY,
+    DEFAULT_STARTUP_PRIORITY,
     DOMAIN,
     HASS_SENSOR_TYPE_TO_MODEL,
+    LIVE_OPTIONS,
     SupportedModels,
 )
 from .coordinator import ConfigEntryType, DataCoordinator
+from .shutdown import async_stop_device, async_track_device
+from .startup import async_get_startup_scheduler
 
 
-async def _async_try_connect(device: api.Device) -> None:
-    """Attempt background connection; suppress failures in setup context."""
-    with contextlib.suppress(Exception):
-        await device._ensure_connected()
-
 PLATFORMS_BY_TYPE = {
     SupportedModels.LD2410.value: [
         Platform.BINARY_SENSOR,
@@ -106,9 +107,32 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntryType) -> bool
         )
         return False
 
+    # Share the connection slots of the adapter or proxy with other devices,
+    # resolved on each connection as the device can move to another proxy
+    device.set_connection_slots(partial(async_get_connection_slots, hass))
+
+    config_cache: ConfigCache | None = None
+    if isinstance(device, api.LD2410):
+        # Publish the last known configuration and skip reading it on
+        # connect while it is still valid
+        config_cache = ConfigCache(hass, entry.entry_id, device)
+        await config_cache.async_restore()
+
     # Start establishing a connection in the background to provoke retries
     # and initial authorization, but do not await it to avoid blocking setup.
-    hass.async_create_task(_async_try_connect(device))
+    # Connections are queued with the other entries to not flood the adapters.
+    service_info = bluetooth.async_last_service_info(hass, address.upper(), connectable)
+    entry.async_on_unload(
+        async_get_startup_scheduler(hass).async_schedule(
+            entry.entry_id,
+            device,
+            rssi=service_info.rssi if service_info else device.rssi,
+            priority=entry.options.get(CONF_STARTUP_PRIORITY, DEFAULT_STARTUP_PRIORITY),
+            concurrency=entry.options.get(
+                CONF_STARTUP_CONCURRENCY, DEFAULT_STARTUP_CONCURRENCY
+            ),
+        )
+    )
 
     data_coordinator = entry.runtime_data = DataCoordinator(
         hass,
@@ -120,8 +144,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntryType) -> bool
         connectable,
         model,
     )
-    data_coordinator.options = dict(entry.options)
+    data_coordinator.async_set_options(entry.options)
+    data_coordinator.config_cache = config_cache
     entry.async_on_unload(data_coordinator.async_start())
+    entry.async_on_unload(async_track_device(hass, entry.entry_id, device))
+    if config_cache is not None:
+        entry.async_on_unload(config_cache.async_start())
 
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
     await hass.config_entries.async_forward_entry_setups(
@@ -132,15 +160,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntryType) -> bool
 
 
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Handle options update."""
+    """Handle options update.
+
+    Options in ``LIVE_OPTIONS`` apply to the running device without a
+    reload, which would drop the connection and recreate the entities.
+    """
     coordinator: DataCoordinator = entry.runtime_data
+    previous = coordinator.options
     new_options = dict(entry.options)
-    allowed = {CONF_SAVED_MOVE_SENSITIVITY, CONF_SAVED_STILL_SENSITIVITY}
-    previous = getattr(coordinator, "options", {})
-    coordinator.options = new_options
-    if {k: v for k, v in previous.items() if k not in allowed} == {
-        k: v for k, v in new_options.items() if k not in allowed
-    }:
+    coordinator.async_set_options(new_options)
+    changed = {
+        key
+        for key in previous.keys() | new_options.keys()
+        if previous.get(key) != new_options.get(key)
+    }
+    if changed <= LIVE_OPTIONS:
+        _LOGGER.debug("%s: Applied options %s", entry.title, sorted(changed))
         return
     await hass.config_entries.async_reload(entry.entry_id)
 
@@ -148,22 +183,14 @@ async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> Non
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     sensor_type = entry.data[CONF_SENSOR_TYPE]
-    device = entry.runtime_data.device
-    device._should_reconnect = False
-    device._cancel_disconnect_timer()
-    if device._restart_connection_tasks:
-        for task in device._restart_connection_tasks:
-            task.cancel()
-        for task in device._restart_connection_tasks:
-            with contextlib.suppress(asyncio.CancelledError):
-                await task
-        device._restart_connection_tasks.clear()
-    if device._timed_disconnect_task:
-        device._timed_disconnect_task.cancel()
-        with contextlib.suppress(asyncio.CancelledError):
-            await device._timed_disconnect_task
-        device._timed_disconnect_task = None
-    await device.async_disconnect()
+    await async_stop_device(entry.runtime_data.device)
+    if (config_cache := entry.runtime_data.config_cache) is not None:
+        await config_cache.async_save()
     return await hass.config_entries.async_unload_platforms(
         entry, PLATFORMS_BY_TYPE[sensor_type]
     )
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored configuration of a removed config entry."""
+    await async_remove_config_cache(hass, entry.entry_id)
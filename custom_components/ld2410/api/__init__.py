@@ -15,10 +15,18 @@ from .const import (
     DEFAULT_SCAN_TIMEOUT,
     Model,
 )
-from .devices.device import Device, OperationError
+from .devices.device import (
+    CommandPriority,
+    ConnectionState,
+    Device,
+    OperationError,
+    command_priority,
+)
 from .devices.ld2410 import LD2410
 from .discovery import GetDevices
 from .models import Advertisement
+from .shutdown import async_stop_devices
+from .slots import ConnectionSlots
 
 __all__ = [
     "DEFAULT_RETRY_COUNT",
@@ -27,12 +35,17 @@ __all__ = [
     "LD2410",
     "GetDevices",
     "Advertisement",
+    "CommandPriority",
+    "ConnectionSlots",
+    "ConnectionState",
     "Device",
     "Model",
     "OperationError",
     "SupportedType",
+    "async_stop_devices",
     "close_stale_connections",
     "close_stale_connections_by_address",
+    "command_priority",
     "get_device",
     "parse_advertisement_data",
 ]
@@ -0,0 +1,60 @@
+"""Delays between reconnect attempts."""
+
+from __future__ import annotations
+
+import random
+
+# Each failed attempt doubles the delay up to the ceiling
+BACKOFF_FACTOR = 2
+
+
+class ReconnectBackoff:
+    """Exponential backoff with jitter for reconnect attempts.
+
+    The first retry after a drop waits exactly ``initial_delay``, which
+    covers the common case of a single dropped connection. Every further
+    failure doubles the delay up to ``max_delay`` and draws the actual
+    delay from its upper half, so devices that lost the same proxy spread
+    their attempts instead of reconnecting in lockstep. A successful
+    connection resets the delay.
+    """
+
+    __slots__ = ("_random", "attempts", "delay", "initial_delay", "max_delay")
+
+    def __init__(
+        self,
+        initial_delay: float,
+        max_delay: float,
+        rng: random.Random | None = None,
+    ) -> None:
+        """Initialize the backoff without failed attempts."""
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self._random = rng or random.Random()
+        self.attempts = 0
+        self.delay: float | None = None
+
+    def next_delay(self) -> float:
+        """Record a failed attempt and return the time to wait before the next."""
+        self.attempts += 1
+        if self.attempts == 1:
+            self.delay = self.initial_delay
+        else:
+            ceiling = min(
+                self.initial_delay * BACKOFF_FACTOR ** (self.attempts - 1),
+                self.max_delay,
+            )
+            self.delay = self._random.uniform(ceiling / 2, ceiling)
+        return self.delay
+
+    def reset(self) -> None:
+        """Start over after a successful connection."""
+        self.attempts = 0
+        self.delay = None
+
+    def as_dict(self) -> dict[str, float | int | None]:
+        """Return the failed attempts and the current delay in seconds."""
+        return {
+            "attempts": self.attempts,
+            "delay_s": None if self.delay is None else round(self.delay, 2),
+        }
@@ -0,0 +1,161 @@
+"""Binary command table for the device protocol.
+
+The command constants in :mod:`.const` are hex strings, which is what the
+``cmd_*`` methods compose and what gets logged.  This module holds their wire
+representation: precomputed frame markers, the command words with the ACK
+word the device answers with, and a framer that builds command frames into a
+reusable buffer, with the common argument-less commands framed once at import.
+"""
+
+from __future__ import annotations
+
+import struct
+
+from .const import (
+    CMD_BT_GET_PERMISSION,
+    CMD_BT_ONOFF,
+    CMD_BT_SET_PWD,
+    CMD_DISABLE_ENGINEERING,
+    CMD_ENABLE_CFG,
+    CMD_ENABLE_ENGINEERING,
+    CMD_END_CFG,
+    CMD_FACTORY_RESET,
+    CMD_GET_AUX,
+    CMD_GET_MAC,
+    CMD_GET_RES,
+    CMD_QUERY_AUTO_THRESH,
+    CMD_READ_FW,
+    CMD_READ_PARAMS,
+    CMD_REBOOT,
+    CMD_SET_AUX,
+    CMD_SET_BAUD,
+    CMD_SET_MAX_GATES_AND_NOBODY,
+    CMD_SET_RES,
+    CMD_SET_SENSITIVITY,
+    CMD_START_AUTO_THRESH,
+    RX_FOOTER,
+    RX_HEADER,
+    TX_FOOTER,
+    TX_HEADER,
+)
+from .enum import StrEnum
+
+RX_HEADER_BYTES = bytes.fromhex(RX_HEADER)
+RX_FOOTER_BYTES = bytes.fromhex(RX_FOOTER)
+TX_HEADER_BYTES = bytes.fromhex(TX_HEADER)
+TX_FOOTER_BYTES = bytes.fromhex(TX_FOOTER)
+
+# Frame layout: header, u16 LE length, command word, value, footer
+_LENGTH = struct.Struct("<H")
+_CONTENT_OFFSET = len(TX_HEADER_BYTES) + _LENGTH.size
+# Largest command is the sensitivity write: word + three 6 byte parameters
+MAX_FRAME_SIZE = _CONTENT_OFFSET + 2 + 3 * 6 + len(TX_FOOTER_BYTES)
+
+
+class Command(StrEnum):
+    """Command words understood by the device."""
+
+    ENABLE_CFG = CMD_ENABLE_CFG
+    END_CFG = CMD_END_CFG
+    SET_MAX_GATES_AND_NOBODY = CMD_SET_MAX_GATES_AND_NOBODY
+    READ_PARAMS = CMD_READ_PARAMS
+    ENABLE_ENGINEERING = CMD_ENABLE_ENGINEERING
+    DISABLE_ENGINEERING = CMD_DISABLE_ENGINEERING
+    SET_SENSITIVITY = CMD_SET_SENSITIVITY
+    READ_FW = CMD_READ_FW
+    SET_BAUD = CMD_SET_BAUD
+    FACTORY_RESET = CMD_FACTORY_RESET
+    REBOOT = CMD_REBOOT
+    BT_ONOFF = CMD_BT_ONOFF
+    GET_MAC = CMD_GET_MAC
+    BT_GET_PERMISSION = CMD_BT_GET_PERMISSION
+    BT_SET_PWD = CMD_BT_SET_PWD
+    SET_RES = CMD_SET_RES
+    GET_RES = CMD_GET_RES
+    SET_AUX = CMD_SET_AUX
+    GET_AUX = CMD_GET_AUX
+    START_AUTO_THRESH = CMD_START_AUTO_THRESH
+    QUERY_AUTO_THRESH = CMD_QUERY_AUTO_THRESH
+
+    @property
+    def word(self) -> bytes:
+        """Return the command word as sent on the wire."""
+        return _WORDS[self.value]
+
+    @property
+    def ack(self) -> bytes:
+        """Return the command word of the device's acknowledgement."""
+        return _ACKS[self.value]
+
+
+def _ack_for(word: str) -> bytes:
+    return (int(word, 16) ^ 0x0001).to_bytes(2, "big")
+
+
+# Keyed by the plain hex word, enum members hash by name
+_WORDS: dict[str, bytes] = {
+    command.value: bytes.fromhex(command.value) for command in Command
+}
+_ACKS: dict[str, bytes] = {
+    command.value: _ack_for(command.value) for command in Command
+}
+
+
+def ack_word(raw_command: str) -> bytes:
+    """Return the ACK word expected for a hex command."""
+    word = raw_command[:4]
+    if (ack := _ACKS.get(word)) is not None:
+        return ack
+    return _ack_for(word)
+
+
+def frame_command(contents: bytes) -> bytes:
+    """Frame command word and value into a complete command frame."""
+    return TX_HEADER_BYTES + _LENGTH.pack(len(contents)) + contents + TX_FOOTER_BYTES
+
+
+# Commands without arguments (or with a fixed one), keyed by their hex form
+FRAMED_COMMANDS: dict[str, bytes] = {
+    raw_command: frame_command(bytes.fromhex(raw_command))
+    for raw_command in (
+        Command.ENABLE_CFG + "0001",
+        Command.END_CFG.value,
+        Command.READ_PARAMS.value,
+        Command.ENABLE_ENGINEERING.value,
+        Command.DISABLE_ENGINEERING.value,
+        Command.READ_FW.value,
+        Command.FACTORY_RESET.value,
+        Command.REBOOT.value,
+        Command.GET_MAC + "0001",
+        Command.GET_RES.value,
+        Command.GET_AUX.value,
+        Command.QUERY_AUTO_THRESH.value,
+    )
+}
+
+
+class CommandFramer:
+    """Frame hex commands into a reusable buffer."""
+
+    __slots__ = ("_buffer", "_view")
+
+    def __init__(self) -> None:
+        """Preallocate the frame buffer with the header in place."""
+        self._buffer = bytearray(MAX_FRAME_SIZE)
+        self._buffer[: len(TX_HEADER_BYTES)] = TX_HEADER_BYTES
+        self._view = memoryview(self._buffer)
+
+    def frame(self, raw_command: str) -> bytes:
+        """Return the frame for a hex command word and value."""
+        if (framed := FRAMED_COMMANDS.get(raw_command)) is not None:
+            return framed
+        contents = bytes.fromhex(raw_command)
+        end = _CONTENT_OFFSET + len(contents)
+        size = end + len(TX_FOOTER_BYTES)
+        if size > MAX_FRAME_SIZE:
+            return frame_command(contents)
+        buffer = self._buffer
+        _LENGTH.pack_into(buffer, len(TX_HEADER_BYTES), len(contents))
+        buffer[_CONTENT_OFFSET:end] = contents
+        buffer[end:size] = TX_FOOTER_BYTES
+        return bytes(self._view[:size])
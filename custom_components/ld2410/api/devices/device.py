@@ -4,15 +4,29 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import heapq
+import itertools
 import logging
 import time
-from collections.abc import Callable
-from dataclasses import replace
-from typing import Any
+from collections import deque
+from collections.abc import (
+    Awaitable,
+    Callable,
+    Collection,
+    Hashable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+from enum import IntEnum
+from typing import Any, TypeVar
 
 from bleak.backends.device import BLEDevice
 from bleak.backends.service import BleakGATTCharacteristic, BleakGATTServiceCollection
-from bleak.exc import BleakDBusError
+from bleak.exc import BleakDBusError, BleakError
 from bleak_retry_connector import (
     BLEAK_RETRY_EXCEPTIONS,
     BleakClientWithServiceCache,
@@ -21,6 +35,7 @@ from bleak_retry_connector import (
     establish_connection,
 )
 
+from ..backoff import ReconnectBackoff
 from ..const import (
     CHARACTERISTIC_NOTIFY,
     CHARACTERISTIC_WRITE,
@@ -28,10 +43,14 @@ from ..const import (
     DEFAULT_SCAN_TIMEOUT,
 )
 from ..discovery import GetDevices
+from ..enum import StrEnum
 from ..models import Advertisement
+from ..rtt import RttEstimator
+from ..slots import ConnectionSlots
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
 
 DBUS_ERROR_BACKOFF_TIME = 0.25
 
@@ -48,9 +67,25 @@ DISCONNECT_DELAY = 8.5
 PASSIVE_POLL_INTERVAL = 60 * 60 * 24
 
 # Time to wait for a command response
-# Before firing a TimeoutError
+# Before firing a TimeoutError, until round
+# trip times have been measured
 COMMAND_TIMEOUT = 5
 
+# Bounds of the timeout derived from the
+# measured round trip times
+MIN_COMMAND_TIMEOUT = 1
+MAX_COMMAND_TIMEOUT = 15
+
+# Consecutive command timeouts after which
+# the connection is considered dead
+MAX_CONSECUTIVE_TIMEOUTS = 3
+
+# Delay before the first reconnect attempt
+# and the ceiling of the backoff after
+# repeated failures
+RECONNECT_DELAY = 1
+MAX_RECONNECT_DELAY = 60
+
 
 class CharacteristicMissingError(Exception):
     """Raised when a characteristic is missing."""
@@ -60,6 +95,102 @@ class OperationError(Exception):
     """Raised when an operation fails."""
 
 
+class ConnectionState(StrEnum):
+    """Lifecycle states of the device connection.
+
+    A connection goes from ``idle`` through ``connecting`` (establishing
+    the link) and ``negotiating`` (``_on_connect``) to ``streaming``, and
+    through ``disconnecting`` back to ``idle``. Reconnect attempts wait in
+    ``backoff`` after a failure.
+
+    States own their timed transitions: ``negotiating`` and ``streaming``
+    disconnect after ``DISCONNECT_DELAY`` without activity and ``backoff``
+    reconnects once the backoff delay passed. Leaving a state cancels its
+    timer.
+    """
+
+    IDLE = "idle"
+    CONNECTING = "connecting"
+    NEGOTIATING = "negotiating"
+    STREAMING = "streaming"
+    DISCONNECTING = "disconnecting"
+    BACKOFF = "backoff"
+
+
+# States with an established link, the idle disconnect timer runs in them
+_CONNECTED_STATES = frozenset({ConnectionState.NEGOTIATING, ConnectionState.STREAMING})
+
+
+class CommandPriority(IntEnum):
+    """Scheduling priority of device commands, lower values go first."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+_command_priority: ContextVar[CommandPriority] = ContextVar(
+    "command_priority", default=CommandPriority.BACKGROUND
+)
+
+
+@contextlib.contextmanager
+def command_priority(priority: CommandPriority) -> Iterator[None]:
+    """Send the commands of the enclosed block with ``priority``.
+
+    The priority is inherited by tasks created inside the block.
+    """
+    token = _command_priority.set(priority)
+    try:
+        yield
+    finally:
+        _command_priority.reset(token)
+
+
+class _CommandSlots:
+    """Semaphore handing free slots to the highest priority waiter.
+
+    Waiters of the same priority are served in arrival order.
+    """
+
+    def __init__(self, slots: int) -> None:
+        self._free = slots
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._order = itertools.count()
+
+    async def acquire(self, priority: CommandPriority) -> None:
+        """Wait for a free slot."""
+        if self._free and not self._waiters:
+            self._free -= 1
+            return
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._order), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted just before the cancellation, pass it on
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Return a slot, waking the next waiter."""
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._free += 1
+
+
+@dataclass(slots=True)
+class _PendingCommand:
+    """A command written to the device and waiting for its response."""
+
+    raw_command: str
+    key: Hashable | None
+    future: asyncio.Future[bytes]
+
+
 def _merge_data(old_data: dict[str, Any], new_data: dict[str, Any]) -> dict[str, Any]:
     """Merge data but only add None keys if they are missing."""
     merged = old_data.copy()
@@ -71,6 +202,42 @@ def _merge_data(old_data: dict[str, Any], new_data: dict[str, Any]) -> dict[str,
     return merged
 
 
+def _is_sequence(value: Any) -> bool:
+    """Return if value is a list-like value and not a string."""
+    return isinstance(value, Sequence) and not isinstance(value, (str, bytes))
+
+
+def _changed_keys(
+    old_data: Mapping[str, Any], new_data: Mapping[str, Any], keys: Iterable[str]
+) -> set[str]:
+    """Return the keys whose values differ between two data sets.
+
+    For sequence values the indexed keys ``f"{key}_{index}"`` of the changed
+    items are added as well, so subscribers of a single gate can be told
+    apart from subscribers of the whole list.
+    """
+    changed: set[str] = set()
+    for key in keys:
+        old = old_data.get(key)
+        new = new_data.get(key)
+        if old == new:
+            continue
+        changed.add(key)
+        if _is_sequence(new) and _is_sequence(old) and len(new) == len(old):
+            changed.update(
+                f"{key}_{index}"
+                for index, (before, after) in enumerate(zip(old, new))
+                if before != after
+            )
+        elif _is_sequence(new) or _is_sequence(old):
+            size = max(
+                len(new) if _is_sequence(new) else 0,
+                len(old) if _is_sequence(old) else 0,
+            )
+            changed.update(f"{key}_{index}" for index in range(size))
+    return changed
+
+
 def _handle_timeout(fut: asyncio.Future[None]) -> None:
     """Handle a timeout."""
     if not fut.done():
@@ -89,6 +256,11 @@ class BaseDevice:
     # by default after sending a command via the write channel
     _default_should_wait_for_response: bool = True
 
+    # Number of commands that may be written before their responses
+    # arrive. Devices that correlate responses to commands through
+    # ``_command_key``/``_response_key`` can raise it to pipeline commands.
+    _max_outstanding_commands: int = 1
+
     # ---------------------------------------------------------------------
     # Subclass hooks
     # ---------------------------------------------------------------------
@@ -111,6 +283,20 @@ class BaseDevice:
 
         return data
 
+    def _command_key(self, raw_command: str) -> Hashable | None:
+        """Return the key a response to ``raw_command`` is matched by.
+
+        ``None`` matches the oldest outstanding command, which is only
+        correct when a single command is outstanding at a time.
+        """
+
+        return None
+
+    def _response_key(self, data: bytes) -> Hashable | None:
+        """Return the key of a response, see ``_command_key``."""
+
+        return None
+
     def _handle_notification(self, data: bytearray) -> bool:
         """Handle unsolicited notifications.
 
@@ -118,10 +304,7 @@ class BaseDevice:
         frames. Return ``True`` if ``data`` was handled.
         """
 
-        if self._notify_future and not self._notify_future.done():
-            self._notify_future.set_result(data)
-            return True
-        return False
+        return self._resolve_command(data)
 
     async def _on_connect(self) -> None:
         """Run after a new connection is made.
@@ -139,20 +322,22 @@ class BaseDevice:
         Override to perform any cleanup command that is needed post disconnection,
         but do include the super() in the call."""
         self._clear_locked_commands()
-        if self._expected_disconnect:
-            _LOGGER.debug(
-                "%s: Disconnected from device; RSSI: %s", self.name, self.rssi
-            )
-        else:
+        self._consecutive_timeouts = 0
+        if self._state in _CONNECTED_STATES:
             _LOGGER.warning(
                 "%s: Device unexpectedly disconnected; RSSI: %s",
                 self.name,
                 self.rssi,
             )
-        self._cancel_disconnect_timer()
+        else:
+            _LOGGER.debug(
+                "%s: Disconnected from device; RSSI: %s", self.name, self.rssi
+            )
+        if self._state is not ConnectionState.DISCONNECTING:
+            self._release_connection_slot()
+            self._set_state(ConnectionState.IDLE)
         if self._should_reconnect:
-            task = self.loop.create_task(self._restart_connection())
-            self._restart_connection_tasks.append(task)
+            self._schedule_reconnect()
         self._fire_callbacks()
 
     def _resolve_characteristics(self, services: BleakGATTServiceCollection) -> None:
@@ -189,14 +374,41 @@ class BaseDevice:
         self._client: BleakClientWithServiceCache | None = None
         self._read_char: BleakGATTCharacteristic | None = None
         self._write_char: BleakGATTCharacteristic | None = None
-        self._disconnect_timer: asyncio.TimerHandle | None = None
-        self._expected_disconnect = False
+        # Timer of the timed transition out of the current state
+        self._state_timer: asyncio.TimerHandle | None = None
+        # Loop time of the last command or notification
+        self._last_activity = 0.0
         self.loop = asyncio.get_event_loop()
         self._callbacks: list[Callable[[], None]] = []
-        self._notify_future: asyncio.Future[bytearray] | None = None
+        self._unkeyed_callbacks: list[Callable[[], None]] = []
+        self._keyed_callbacks: dict[str, list[Callable[[], None]]] = {}
+        self._pending_commands: deque[_PendingCommand] = deque()
+        self._command_slots = _CommandSlots(self._max_outstanding_commands)
+        self._command_rtt: dict[str, float] = {}
+        self._rtt = RttEstimator(
+            COMMAND_TIMEOUT, MIN_COMMAND_TIMEOUT, MAX_COMMAND_TIMEOUT
+        )
+        self._timed_out_commands: set[str] = set()
+        self._consecutive_timeouts = 0
+        self._command_errors = {"timeout": 0, "transient": 0, "disconnect": 0}
+        self._stray_responses = 0
+        self._queue_wait: dict[str, float] = {}
+        self._shared_reads: dict[str, asyncio.Future[Any]] = {}
+        self._merged_reads = 0
         self._last_full_update: float = -PASSIVE_POLL_INTERVAL
-        self._timed_disconnect_task: asyncio.Task[None] | None = None
-        self._restart_connection_tasks: list[asyncio.Task[None]] = []
+        # Reconnect or idle disconnect started by a timed transition
+        self._transition_task: asyncio.Task[None] | None = None
+        self._slots_for_device: Callable[[BLEDevice], ConnectionSlots] | None = None
+        # Slots the current connection attempt or connection holds
+        self._connection_slots: ConnectionSlots | None = None
+        self._reconnect_backoff = ReconnectBackoff(RECONNECT_DELAY, MAX_RECONNECT_DELAY)
+        self._state = ConnectionState.IDLE
+        self._state_since = time.monotonic()
+        # Seconds spent in each state left so far, keyed by state value
+        self._state_durations: dict[str, float] = {}
+        self._state_callbacks: list[
+            Callable[[ConnectionState, ConnectionState], None]
+        ] = []
         self._rssi: int = getattr(device, "rssi", -127) or -127
         self._should_reconnect = self._auto_reconnect
         self._should_wait_for_response = self._default_should_wait_for_response
@@ -289,10 +501,9 @@ class BaseDevice:
         assert current is not None
         self._operation_tasks.append(current)
         try:
-            async with self._operation_lock:
-                return await self._send_command_locked_with_retry(
-                    raw_command, command, retry, max_attempts, wait_for_response
-                )
+            return await self._send_command_locked_with_retry(
+                raw_command, command, retry, max_attempts, wait_for_response
+            )
         except asyncio.CancelledError as err:
             raise OperationError("Device disconnecting") from err
         finally:
@@ -321,6 +532,117 @@ class BaseDevice:
         """Return RSSI of device."""
         return self._rssi
 
+    @property
+    def diagnostics(self) -> dict[str, Any]:
+        """Return runtime statistics for diagnostics."""
+        return {
+            "command_rtt_ms": {
+                word: round(rtt * 1000, 1) for word, rtt in self._command_rtt.items()
+            },
+            "stray_responses": self._stray_responses,
+            "rtt": self._rtt.as_dict(),
+            "command_errors": dict(self._command_errors),
+            "queue_wait_ms": {
+                priority: round(wait * 1000, 1)
+                for priority, wait in self._queue_wait.items()
+            },
+            "merged_reads": self._merged_reads,
+            "reconnect": self._reconnect_backoff.as_dict(),
+            "connection_slots": (
+                None if (slots := self.connection_slots) is None else slots.as_dict()
+            ),
+            "connection": {
+                "state": self._state.value,
+                "time_in_state_s": {
+                    state: round(duration, 1)
+                    for state, duration in self.state_durations.items()
+                },
+            },
+        }
+
+    @property
+    def state(self) -> ConnectionState:
+        """Return the connection state."""
+        return self._state
+
+    @property
+    def state_durations(self) -> dict[str, float]:
+        """Return the seconds spent in each connection state."""
+        durations = dict(self._state_durations)
+        current = self._state.value
+        durations[current] = (
+            durations.get(current, 0.0) + time.monotonic() - self._state_since
+        )
+        return durations
+
+    def _set_state(self, state: ConnectionState) -> None:
+        """Enter a connection state and run the transition hooks."""
+        previous = self._state
+        if state is previous:
+            return
+        now = time.monotonic()
+        self._state_durations[previous.value] = (
+            self._state_durations.get(previous.value, 0.0) + now - self._state_since
+        )
+        self._state = state
+        self._state_since = now
+        self._cancel_state_timer()
+        if state in _CONNECTED_STATES and previous not in _CONNECTED_STATES:
+            # Connecting counts as activity
+            self._last_activity = self.loop.time()
+        self._arm_state_timer()
+        _LOGGER.debug("%s: Connection %s -> %s", self.name, previous, state)
+        self._on_state_change(previous, state)
+        for callback in list(self._state_callbacks):
+            callback(previous, state)
+
+    def _arm_state_timer(self) -> None:
+        """Arm the timed transition out of the current state."""
+        if self._state in _CONNECTED_STATES:
+            self._state_timer = self.loop.call_at(
+                self._last_activity + DISCONNECT_DELAY, self._disconnect_from_timer
+            )
+        elif self._state is ConnectionState.BACKOFF:
+            self._state_timer = self.loop.call_later(
+                self._reconnect_backoff.delay or 0.0, self._reconnect_from_timer
+            )
+
+    def _cancel_state_timer(self) -> None:
+        """Cancel the timed transition out of the current state."""
+        if self._state_timer:
+            self._state_timer.cancel()
+            self._state_timer = None
+
+    def _transition_running(self) -> bool:
+        """Return if another task runs a timed transition."""
+        task = self._transition_task
+        return (
+            task is not None and not task.done() and task is not asyncio.current_task()
+        )
+
+    def _on_state_change(
+        self, previous: ConnectionState, state: ConnectionState
+    ) -> None:
+        """Handle a connection state transition.
+
+        Override to react to transitions; the default does nothing.
+        """
+
+    def subscribe_state(
+        self, callback: Callable[[ConnectionState, ConnectionState], None]
+    ) -> Callable[[], None]:
+        """Subscribe to connection state transitions.
+
+        The callback receives the previous and the new state.
+        """
+        self._state_callbacks.append(callback)
+
+        def _unsub() -> None:
+            """Unsubscribe from connection state transitions."""
+            self._state_callbacks.remove(callback)
+
+        return _unsub
+
     async def read_rssi(self) -> int | None:
         """Update and return the RSSI using the active connection."""
         if self._client and self._client.is_connected:
@@ -348,10 +670,20 @@ class BaseDevice:
         """Return if the BLE client is connected."""
         return bool(self._client and self._client.is_connected)
 
+    @property
+    def receiving_frames(self) -> bool:
+        """Return if the device streamed data on the current connection."""
+        return False
+
     @property
     def is_reconnecting(self) -> bool:
         """Return if the device is attempting to reconnect."""
-        return not self.is_connected and bool(self._restart_connection_tasks)
+        if self.is_connected or not self._should_reconnect:
+            return False
+        task = self._transition_task
+        return self._state is ConnectionState.BACKOFF or (
+            task is not None and not task.done()
+        )
 
     async def _ensure_connected(self) -> bool:
         """Ensure connection to device is established and initialized.
@@ -384,16 +716,39 @@ class BaseDevice:
                 self._reset_disconnect_timer()
                 return False
             _LOGGER.debug("%s: Connecting; RSSI: %s", self.name, self.rssi)
-            client: BleakClientWithServiceCache = await establish_connection(
-                BleakClientWithServiceCache,
-                self._device,
-                self.name,
-                self._on_disconnect,
-                use_services_cache=True,
-                ble_device_callback=lambda: self._device,
+            # Set for commands connecting while a reconnect waits
+            waiting = (
+                self._state is ConnectionState.BACKOFF and self._state_timer is not None
             )
+            self._set_state(ConnectionState.CONNECTING)
+            try:
+                if (slots := self.connection_slots) is not None:
+                    if slots is not self._connection_slots:
+                        # Advertisements moved the device to another adapter
+                        self._release_connection_slot()
+                        self._connection_slots = slots
+                    await slots.acquire(
+                        self._device.address, self.rssi, _command_priority.get()
+                    )
+                client: BleakClientWithServiceCache = await establish_connection(
+                    BleakClientWithServiceCache,
+                    self._device,
+                    self.name,
+                    self._on_disconnect,
+                    use_services_cache=True,
+                    ble_device_callback=lambda: self._device,
+                )
+            except BaseException:
+                self._release_connection_slot()
+                # A failed command does not end the wait of a reconnect
+                self._set_state(
+                    ConnectionState.BACKOFF if waiting else ConnectionState.IDLE
+                )
+                raise
             _LOGGER.debug("%s: Connected; RSSI: %s", self.name, self.rssi)
             self._client = client
+            # Timeouts of an earlier connection do not count against this one
+            self._consecutive_timeouts = 0
 
             try:
                 self._resolve_characteristics(client.services)
@@ -406,48 +761,71 @@ class BaseDevice:
                     exc_info=True,
                 )
                 await client.clear_cache()
-                self._cancel_disconnect_timer()
                 await self._execute_disconnect_with_lock()
                 raise
 
-            _LOGGER.debug(
-                "%s: Starting notify and disconnect timer; RSSI: %s",
-                self.name,
-                self.rssi,
-            )
-            self._reset_disconnect_timer()
+            _LOGGER.debug("%s: Starting notify; RSSI: %s", self.name, self.rssi)
             await self._start_notify()
             new_connection = True
+            self._set_state(ConnectionState.NEGOTIATING)
 
         if new_connection:
-            await self._on_connect()
+            try:
+                await self._on_connect()
+            finally:
+                # Uplink frames flow even if negotiation failed
+                if self._state is ConnectionState.NEGOTIATING:
+                    self._set_state(
+                        ConnectionState.STREAMING
+                        if self.is_connected
+                        else ConnectionState.IDLE
+                    )
         return new_connection
 
     def _reset_disconnect_timer(self):
-        """Reset disconnect timer."""
-        self._cancel_disconnect_timer()
-        self._expected_disconnect = False
-        self._disconnect_timer = self.loop.call_later(
-            DISCONNECT_DELAY, self._disconnect_from_timer
-        )
+        """Reset disconnect timer.
+
+        Runs for every notification, so it only records the activity; the
+        timer of the connected state re-arms itself for the remaining time
+        when it fires, see ``_disconnect_from_timer``.
+        """
+        self._last_activity = self.loop.time()
+        if self._state_timer is None and self._state in _CONNECTED_STATES:
+            self._arm_state_timer()
 
     def _clear_locked_commands(self):
-        if not (self._operation_lock.locked() or self._operation_tasks):
+        # Late responses to timed out commands do not outlive the connection
+        self._timed_out_commands.clear()
+        if not (
+            self._operation_lock.locked()
+            or self._operation_tasks
+            or self._pending_commands
+        ):
             return
         _LOGGER.debug("%s: Clearing queued commands before disconnect", self.name)
         for task in list(self._operation_tasks):
             if not task.done():
                 task.cancel()
         self._operation_tasks.clear()
-        if self._notify_future:
-            if not self._notify_future.done():
-                self._notify_future.cancel()
-            self._notify_future = None
+        for pending in self._pending_commands:
+            if not pending.future.done():
+                pending.future.cancel()
+        self._pending_commands.clear()
         self._operation_lock = asyncio.Lock()
+        self._command_slots = _CommandSlots(self._max_outstanding_commands)
 
     def _disconnect_from_timer(self):
         """Disconnect from device."""
-        if self._operation_lock.locked() and self._client.is_connected:
+        self._state_timer = None
+        if self._last_activity + DISCONNECT_DELAY > self.loop.time():
+            # Activity since the timer was armed, wait for the rest
+            self._arm_state_timer()
+            return
+        if (
+            self._operation_lock.locked()
+            or self._pending_commands
+            or self._transition_running()
+        ) and self.is_connected:
             _LOGGER.debug(
                 "%s: Operation in progress, resetting disconnect timer; RSSI: %s",
                 self.name,
@@ -455,20 +833,15 @@ class BaseDevice:
             )
             self._reset_disconnect_timer()
             return
-        self._cancel_disconnect_timer()
-        self._timed_disconnect_task = asyncio.create_task(
-            self._execute_timed_disconnect()
-        )
+        self._transition_task = self.loop.create_task(self._execute_timed_disconnect())
 
-    def _cancel_disconnect_timer(self):
-        """Cancel disconnect timer."""
-        if self._disconnect_timer:
-            self._disconnect_timer.cancel()
-            self._disconnect_timer = None
+    def _reconnect_from_timer(self) -> None:
+        """Reconnect once the backoff delay passed."""
+        self._state_timer = None
+        self._transition_task = self.loop.create_task(self._restart_connection())
 
     async def async_disconnect(self) -> None:
         """Disconnect the device and stop active notifications."""
-        self._cancel_disconnect_timer()
         client = self._client
         if client and self._read_char:
             try:
@@ -479,7 +852,6 @@ class BaseDevice:
 
     async def _execute_forced_disconnect(self) -> None:
         """Execute forced disconnection."""
-        self._cancel_disconnect_timer()
         _LOGGER.debug(
             "%s: Executing forced disconnect",
             self.name,
@@ -493,20 +865,96 @@ class BaseDevice:
             self.name,
             DISCONNECT_DELAY,
         )
-        await self._execute_disconnect()
+        async with self._connect_lock:
+            if self._state_timer is not None:
+                # Activity while waiting for the lock re-armed the timer
+                _LOGGER.debug("%s: Skipping disconnect as timer reset", self.name)
+                return
+            await self._execute_disconnect_with_lock()
+
+    def set_retry_count(self, retry_count: int) -> None:
+        """Set the retries of commands sent from now on."""
+        self._retry_count = retry_count
+
+    def set_connection_slots(
+        self, slots: Callable[[BLEDevice], ConnectionSlots] | None
+    ) -> None:
+        """Connect through the slots of the adapter that reaches the device.
+
+        ``slots`` returns the slots of the adapter a ``BLEDevice`` is
+        reached through. It is called for every connection attempt, as
+        advertisements can move the device to another adapter or proxy.
+        Connection attempts wait for a free slot, which is held until the
+        device disconnects.
+        """
+        self._release_connection_slot()
+        self._connection_slots = None
+        self._slots_for_device = slots
+
+    @property
+    def connection_slots(self) -> ConnectionSlots | None:
+        """Return the connection slots of the adapter reaching the device.
+
+        While connected, these are the slots the connection holds.
+        """
+        if self.is_connected and self._connection_slots is not None:
+            return self._connection_slots
+        if self._slots_for_device is None:
+            return None
+        return self._slots_for_device(self._device)
+
+    def _release_connection_slot(self) -> None:
+        if self._connection_slots is not None:
+            self._connection_slots.release(self._device.address)
+
+    def _schedule_reconnect(self) -> None:
+        """Start reconnecting unless a reconnect is already scheduled.
+
+        A running timed transition schedules the reconnect when it ends and
+        ``backoff`` reconnects from its timer.
+        """
+        if self._state is ConnectionState.BACKOFF or self._transition_running():
+            _LOGGER.debug("%s: Reconnect already scheduled", self.name)
+            return
+        self._transition_task = self.loop.create_task(self._restart_connection())
+
+    async def async_stop(self) -> None:
+        """Stop reconnecting and disconnect from the device."""
+        self._should_reconnect = False
+        self._cancel_state_timer()
+        task = self._transition_task
+        self._transition_task = None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        await self.async_disconnect()
+        self._set_state(ConnectionState.IDLE)
+
+    def abandon(self) -> None:
+        """Forget the connection without waiting for the device.
+
+        Used when ``async_stop`` did not finish in time, e.g. because a dead
+        proxy never answers; the client is dropped without disconnecting.
+        """
+        self._should_reconnect = False
+        task = self._transition_task
+        self._transition_task = None
+        if task is not None and not task.done():
+            task.cancel()
+        self._clear_locked_commands()
+        self._client = None
+        self._read_char = None
+        self._write_char = None
+        self._connect_lock = asyncio.Lock()
+        self._release_connection_slot()
+        self._set_state(ConnectionState.IDLE)
 
     async def _restart_connection(self) -> None:
         """Reconnect after an unexpected disconnect."""
-        current = asyncio.current_task()
-        for task in list(self._restart_connection_tasks):
-            if task is not current and not task.done():
-                task.cancel()
-        self._restart_connection_tasks = [
-            t for t in self._restart_connection_tasks if t is current
-        ]
         if not self._should_reconnect:
-            if current in self._restart_connection_tasks:
-                self._restart_connection_tasks.remove(current)
+            if self._state is ConnectionState.BACKOFF:
+                self._set_state(ConnectionState.IDLE)
             return
         try:
             _LOGGER.debug("%s: Reconnecting...", self.name)
@@ -514,13 +962,20 @@ class BaseDevice:
         except asyncio.CancelledError:
             raise  # do not reschedule when cancelled
         except Exception as ex:  # pragma: no cover - best effort
-            _LOGGER.debug("%s: Reconnect failed: %s", self.name, ex)
-            await asyncio.sleep(1)
-            task = self.loop.create_task(self._restart_connection())
-            self._restart_connection_tasks.append(task)
-        finally:
-            if current in self._restart_connection_tasks:
-                self._restart_connection_tasks.remove(current)
+            if self._transition_running():
+                return  # a later reconnect took over
+            delay = self._reconnect_backoff.next_delay()
+            # The backoff timer schedules the next attempt
+            self._set_state(ConnectionState.BACKOFF)
+            _LOGGER.debug(
+                "%s: Reconnect attempt %s failed, retrying in %.1fs: %s",
+                self.name,
+                self._reconnect_backoff.attempts,
+                delay,
+                ex,
+            )
+        else:
+            self._reconnect_backoff.reset()
 
     async def _execute_disconnect(self) -> None:
         """Execute disconnection."""
@@ -532,63 +987,103 @@ class BaseDevice:
         """Execute disconnection while holding the lock."""
         assert self._connect_lock.locked(), "Lock not held"
         _LOGGER.debug("%s: Executing disconnect with lock", self.name)
-        if self._disconnect_timer:  # If the timer was reset, don't disconnect
-            _LOGGER.debug("%s: Skipping disconnect as timer reset", self.name)
-            return
         self._clear_locked_commands()
         client = self._client
-        self._expected_disconnect = True
         self._client = None
         self._read_char = None
         self._write_char = None
-        if not client:
-            _LOGGER.debug("%s: Already disconnected", self.name)
-            return
-        _LOGGER.debug("%s: Disconnecting", self.name)
         try:
-            await client.disconnect()
-        except BLEAK_RETRY_EXCEPTIONS as ex:
-            _LOGGER.warning(
-                "%s: Error disconnecting: %s; RSSI: %s",
-                self.name,
-                ex,
-                self.rssi,
-            )
-        else:
-            _LOGGER.debug("%s: Disconnect completed successfully", self.name)
+            if not client:
+                _LOGGER.debug("%s: Already disconnected", self.name)
+                return
+            _LOGGER.debug("%s: Disconnecting", self.name)
+            self._set_state(ConnectionState.DISCONNECTING)
+            try:
+                await client.disconnect()
+            except BLEAK_RETRY_EXCEPTIONS as ex:
+                _LOGGER.warning(
+                    "%s: Error disconnecting: %s; RSSI: %s",
+                    self.name,
+                    ex,
+                    self.rssi,
+                )
+            else:
+                _LOGGER.debug("%s: Disconnect completed successfully", self.name)
         finally:
+            self._release_connection_slot()
+            if self._state is ConnectionState.DISCONNECTING:
+                self._set_state(ConnectionState.IDLE)
             # Some times _on_disconnect isnt triggered, so we call it here to ensure
             if self._should_reconnect:
-                task = self.loop.create_task(self._restart_connection())
-                self._restart_connection_tasks.append(task)
+                self._schedule_reconnect()
 
     async def _send_command_locked(
         self, raw_command: str, command: bytes, wait_for_response: bool
     ) -> bytes | None:
-        """Send command to device and optionally read response."""
+        """Send command to device and optionally read response.
+
+        Timeouts and write errors on a connection that is still up are
+        raised for a retry on the same connection; any other error
+        disconnects first so the next attempt starts from a clean state.
+        """
         try:
-            return await self._execute_command_locked(
+            result = await self._execute_command_locked(
                 raw_command, command, wait_for_response
             )
         except BleakDBusError as ex:
             # Disconnect so we can reset state and try again
-            await asyncio.sleep(DBUS_ERROR_BACKOFF_TIME)
+            backoff = self._rtt.backoff(DBUS_ERROR_BACKOFF_TIME)
+            await asyncio.sleep(backoff)
             _LOGGER.debug(
-                "%s: RSSI: %s; Backing off %ss; Disconnecting due to error: %s",
+                "%s: RSSI: %s; Backing off %.2fs; Disconnecting due to error: %s",
                 self.name,
                 self.rssi,
-                DBUS_ERROR_BACKOFF_TIME,
+                backoff,
                 ex,
             )
+            self._command_errors["disconnect"] += 1
             await self._execute_forced_disconnect()
             raise
         except BLEAK_RETRY_EXCEPTIONS as ex:
+            kind = self._classify_error(ex)
+            if kind == "timeout":
+                self._consecutive_timeouts += 1
+                if self._consecutive_timeouts >= MAX_CONSECUTIVE_TIMEOUTS:
+                    # Too many timeouts in a row, the connection is dead
+                    self._consecutive_timeouts = 0
+                    kind = None
+            if kind is not None:
+                self._command_errors[kind] += 1
+                _LOGGER.debug(
+                    "%s: RSSI: %s; Keeping connection after %s error: %r",
+                    self.name,
+                    self.rssi,
+                    kind,
+                    ex,
+                )
+                raise
             # Disconnect so we can reset state and try again
             _LOGGER.debug(
                 "%s: RSSI: %s; Disconnecting due to error: %s", self.name, self.rssi, ex
             )
+            self._command_errors["disconnect"] += 1
             await self._execute_forced_disconnect()
             raise
+        self._consecutive_timeouts = 0
+        return result
+
+    def _classify_error(self, ex: BaseException) -> str | None:
+        """Return the kind of a recoverable command error.
+
+        Returns ``None`` for transport failures that need a new connection.
+        """
+        if not self.is_connected:
+            return None
+        if isinstance(ex, asyncio.TimeoutError):
+            return "timeout"
+        if isinstance(ex, BleakError):
+            return "transient"
+        return None
 
     def _notification_handler(self, _sender: int, data: bytearray) -> None:
         """Handle notification responses."""
@@ -603,38 +1098,149 @@ class BaseDevice:
         _LOGGER.debug("%s: Subscribe to notifications; RSSI: %s", self.name, self.rssi)
         await self._client.start_notify(self._read_char, self._notification_handler)
 
+    def _resolve_command(self, data: bytes) -> bool:
+        """Hand a response to the oldest outstanding command it matches.
+
+        Responses matching no outstanding command, e.g. late responses to a
+        command that already timed out, are dropped.
+        """
+        key = self._response_key(data)
+        for pending in self._pending_commands:
+            if pending.future.done():
+                continue
+            if key is None or pending.key is None or pending.key == key:
+                pending.future.set_result(data)
+                return True
+        self._stray_responses += 1
+        return False
+
     async def _execute_command_locked(
         self, raw_command: str, command: bytes, wait_for_response: bool
     ) -> bytes | None:
-        """Execute command and optionally read response."""
-        assert self._client is not None
-        assert self._read_char is not None
-        assert self._write_char is not None
-        client = self._client
+        """Execute command and optionally read response.
 
-        _LOGGER.debug("%s: Sending command: %s", self.name, raw_command)
-        if wait_for_response:
-            self._notify_future = self.loop.create_future()
-        await client.write_gatt_char(self._write_char, command, False)
+        The operation lock is only held while writing, so up to
+        ``_max_outstanding_commands`` commands can await their responses at
+        the same time. Free slots go to interactive commands before
+        background ones.
+        """
         if not wait_for_response:
+            async with self._operation_lock:
+                client, write_char = self._command_channel()
+                _LOGGER.debug("%s: Sending command: %s", self.name, raw_command)
+                await client.write_gatt_char(write_char, command, False)
             return None
-        timeout_handle = self.loop.call_at(
-            self.loop.time() + COMMAND_TIMEOUT, _handle_timeout, self._notify_future
+
+        priority = _command_priority.get()
+        queued_at = time.monotonic()
+        slots = self._command_slots
+        await slots.acquire(priority)
+        try:
+            pending = _PendingCommand(
+                raw_command, self._command_key(raw_command), self.loop.create_future()
+            )
+            async with self._operation_lock:
+                client, write_char = self._command_channel()
+                wait = time.monotonic() - queued_at
+                self._queue_wait[priority.name.lower()] = wait
+                _LOGGER.debug(
+                    "%s: Sending command: %s; queued %.0f ms",
+                    self.name,
+                    raw_command,
+                    wait * 1000,
+                )
+                # Register first, the response may arrive before the write returns
+                self._pending_commands.append(pending)
+                sent_at = time.monotonic()
+                try:
+                    await client.write_gatt_char(write_char, command, False)
+                except BaseException:
+                    self._discard_pending(pending)
+                    raise
+            timeout_handle = self.loop.call_at(
+                self.loop.time() + self._rtt.timeout, _handle_timeout, pending.future
+            )
+            try:
+                notify_msg_raw = await pending.future
+            except asyncio.TimeoutError:
+                self._rtt.timed_out()
+                self._timed_out_commands.add(raw_command[:4])
+                raise
+            finally:
+                timeout_handle.cancel()
+                self._discard_pending(pending)
+        finally:
+            slots.release()
+
+        rtt = time.monotonic() - sent_at
+        word = raw_command[:4]
+        self._command_rtt[word] = rtt
+        if word in self._timed_out_commands:
+            # The response may belong to the attempt that timed out (Karn)
+            self._timed_out_commands.discard(word)
+        else:
+            self._rtt.sample(rtt)
+        notify_msg = self._parse_response(raw_command, notify_msg_raw)
+        _LOGGER.debug(
+            "%s: Command reponse after %.0f ms: %s",
+            self.name,
+            rtt * 1000,
+            notify_msg.hex(),
         )
-        timeout_expired = False
+        return notify_msg
+
+    def _command_channel(
+        self,
+    ) -> tuple[BleakClientWithServiceCache, BleakGATTCharacteristic]:
+        """Return the connected client and write characteristic."""
+        assert self._client is not None
+        assert self._read_char is not None
+        assert self._write_char is not None
+        return self._client, self._write_char
+
+    def _discard_pending(self, pending: _PendingCommand) -> None:
+        """Forget an outstanding command."""
+        with contextlib.suppress(ValueError):
+            self._pending_commands.remove(pending)
+
+    async def _shared_read(self, key: str, read: Callable[[], Awaitable[_T]]) -> _T:
+        """Run ``read`` unless the same read is already in flight.
+
+        Concurrent callers of an in-flight read wait for its result instead
+        of sending the command again, unless ``_may_join_shared_read`` says
+        the read in flight may be waiting for them.
+        """
+        if (shared := self._shared_reads.get(key)) is not None:
+            if not self._may_join_shared_read():
+                return await read()
+            self._merged_reads += 1
+            return await asyncio.shield(shared)
+        future: asyncio.Future[_T] = self.loop.create_future()
+        # Failures are re-raised by the caller, waiters are optional
+        future.add_done_callback(lambda fut: fut.cancelled() or fut.exception())
+        self._shared_reads[key] = future
         try:
-            notify_msg_raw = await self._notify_future
-        except asyncio.TimeoutError:
-            timeout_expired = True
+            result = await read()
+        except asyncio.CancelledError:
+            future.cancel()
             raise
+        except Exception as err:
+            future.set_exception(err)
+            raise
+        else:
+            future.set_result(result)
+            return result
         finally:
-            if not timeout_expired:
-                timeout_handle.cancel()
-            self._notify_future = None
+            del self._shared_reads[key]
 
-        notify_msg = self._parse_response(raw_command, notify_msg_raw)
-        _LOGGER.debug("%s: Command reponse: %s", self.name, notify_msg.hex())
-        return notify_msg
+    def _may_join_shared_read(self) -> bool:
+        """Return if the current task may wait for a read of another task.
+
+        Override when reads can wait for work of other tasks, e.g. locks,
+        so those tasks run their own read instead of waiting in a cycle.
+        """
+
+        return True
 
     def get_address(self) -> str:
         """Return address of device."""
@@ -694,19 +1300,54 @@ class BaseDevice:
 
         return self._sb_adv_data
 
-    def _fire_callbacks(self) -> None:
-        """Fire callbacks."""
+    def _fire_callbacks(self, changed: Collection[str] | None = None) -> None:
+        """Fire callbacks.
+
+        Without ``changed`` every subscriber is called. Otherwise only
+        subscribers of one of the changed keys, and those that subscribed
+        without keys, are called.
+        """
         # _LOGGER.debug("%s: Fire callbacks", self.name)
-        for callback in self._callbacks:
+        if changed is None:
+            callbacks: Iterable[Callable[[], None]] = self._callbacks
+        elif not changed:
+            return
+        else:
+            selected = dict.fromkeys(self._unkeyed_callbacks)
+            for key in changed:
+                if keyed := self._keyed_callbacks.get(key):
+                    selected.update(dict.fromkeys(keyed))
+            callbacks = selected
+        for callback in list(callbacks):
             callback()
 
-    def subscribe(self, callback: Callable[[], None]) -> Callable[[], None]:
-        """Subscribe to device notifications."""
+    def subscribe(
+        self,
+        callback: Callable[[], None],
+        keys: Iterable[str] | None = None,
+    ) -> Callable[[], None]:
+        """Subscribe to device notifications.
+
+        ``keys`` limits the notifications to changes of these data keys;
+        indexed keys such as ``move_gate_energy_3`` select a single item of
+        a list value. Connection state changes are always delivered.
+        """
+        keys = None if keys is None else tuple(dict.fromkeys(keys))
         self._callbacks.append(callback)
+        if keys is None:
+            self._unkeyed_callbacks.append(callback)
+        for key in keys or ():
+            self._keyed_callbacks.setdefault(key, []).append(callback)
 
         def _unsub() -> None:
             """Unsubscribe from device notifications."""
             self._callbacks.remove(callback)
+            if keys is None:
+                self._unkeyed_callbacks.remove(callback)
+            for key in keys or ():
+                self._keyed_callbacks[key].remove(callback)
+                if not self._keyed_callbacks[key]:
+                    del self._keyed_callbacks[key]
 
         return _unsub
 
@@ -714,8 +1355,7 @@ class BaseDevice:
         """Update position, battery percent and light level of device."""
         if info := await self.get_basic_info():
             self._last_full_update = time.monotonic()
-            self._update_parsed_data(info)
-            self._fire_callbacks()
+            self._fire_callbacks(self._update_parsed_data(info))
 
     async def get_basic_info(self) -> dict[str, Any] | None:
         """Return cached device data."""
@@ -732,29 +1372,31 @@ class BaseDevice:
             )
         return result[index] in values
 
-    def _update_parsed_data(self, new_data: dict[str, Any]) -> bool:
+    def _update_parsed_data(self, new_data: dict[str, Any]) -> set[str]:
         """
         Update data.
 
-        Returns true if data has changed and False if not.
+        Returns the set of changed keys, which is empty if nothing changed.
+        Changed items of list values are also reported by their indexed key,
+        see ``_changed_keys``.
         """
         if not self._sb_adv_data:
             # Initialize advertisement data if we have not yet received any
             self._sb_adv_data = Advertisement(
                 address=self._device.address,
-                data={"data": new_data},
+                data={"data": dict(new_data)},
                 device=self._device,
                 rssi=self.rssi,
             )
             # _LOGGER.debug("%s: Updated data: %s", self.name, new_data)
-            return True
+            return _changed_keys({}, new_data, new_data)
         old_data = self._sb_adv_data.data.get("data") or {}
         merged_data = _merge_data(old_data, new_data)
         if merged_data == old_data:
-            return False
+            return set()
         self._set_parsed_data(self._sb_adv_data, merged_data)
         # _LOGGER.debug("%s: Updated data: %s", self.name, merged_data)
-        return True
+        return _changed_keys(old_data, merged_data, new_data)
 
     def _set_parsed_data(
         self, advertisement: Advertisement, data: dict[str, Any]
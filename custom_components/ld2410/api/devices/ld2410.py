@@ -2,12 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
+import struct
 import time
+from array import array
+from collections import ChainMap
+from collections.abc import AsyncIterator, Awaitable, Mapping
+from types import MappingProxyType
 from typing import Any, Dict, Sequence
 
 from bleak.backends.device import BLEDevice
-
+from bleak_retry_connector import BleakClientWithServiceCache
+
+from ..commands import (
+    RX_FOOTER_BYTES,
+    RX_HEADER_BYTES,
+    TX_FOOTER_BYTES,
+    TX_HEADER_BYTES,
+    CommandFramer,
+    ack_word,
+)
 from ..const import (
     CMD_BT_GET_PERMISSION,
     CMD_BT_SET_PWD,
@@ -24,6 +40,7 @@ from ..const import (
     CMD_GET_RES,
     CMD_SET_AUX,
     CMD_GET_AUX,
+    ALL_GATES,
     PAR_DISTANCE_GATE,
     PAR_MOVE_SENS,
     PAR_STILL_SENS,
@@ -32,15 +49,59 @@ from ..const import (
     PAR_NOBODY_DURATION,
     UPLINK_TYPE_BASIC,
     UPLINK_TYPE_ENGINEERING,
-    TX_HEADER,
-    TX_FOOTER,
-    RX_HEADER,
-    RX_FOOTER,
 )
-from .device import Device, OperationError
+from ..models import UPLINK_FIELDS, UplinkFrame
+from ..reassembler import FrameReassembler
+from .device import (
+    Device,
+    OperationError,
+    _changed_keys,
+    _command_priority,
+    _CommandSlots,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Uplink payload layout: type byte, 0xAA head, content, 0x55 tail, 0x00 check
+_UPLINK_HEAD = 0xAA
+_UPLINK_TAIL = 0x55
+_UPLINK_CHECK = 0x00
+_UPLINK_CONTENT = 2
+_UPLINK_FRAME_TYPES = {
+    int(UPLINK_TYPE_ENGINEERING, 16): "engineering",
+    int(UPLINK_TYPE_BASIC, 16): "basic",
+}
+_NO_DATA: Mapping[str, Any] = MappingProxyType({})
+
+# Target status, moving distance/energy, still distance/energy, detect distance
+_BASIC_TARGET = struct.Struct("<BHBHBH")
+
+# Distance gates 0..8 of the sensitivity configuration
+_GATE_COUNT = 9
+
+# Configuration values read after connecting
+CONFIG_KEYS = (
+    "move_gate_sensitivity",
+    "still_gate_sensitivity",
+    "absence_delay",
+    "max_move_gate",
+    "max_still_gate",
+    "resolution",
+    "light_function",
+    "light_threshold",
+    "light_out_level",
+)
+# Seconds a read or restored configuration is trusted on reconnect
+CONFIG_MAX_AGE = 24 * 60 * 60
+
+
+def _check_sensitivity(move: int, still: int) -> None:
+    """Validate a pair of gate sensitivities."""
+    if not 0 <= move <= 100:
+        raise ValueError("move must be 0..100")
+    if not 0 <= still <= 100:
+        raise ValueError("still must be 0..100")
+
 
 def _password_to_words(password: str) -> tuple[str, ...]:
     """Encode an ASCII password into 16-bit word hex strings."""
@@ -50,14 +111,14 @@ def _password_to_words(password: str) -> tuple[str, ...]:
     return tuple(data[i : i + 2].hex() for i in range(0, len(data), 2))
 
 
-def _unwrap_frame(data: bytes, header: str, footer: str) -> bytes:
-    """Remove header and footer from a framed message."""
-    hdr = bytearray.fromhex(header)
-    ftr = bytearray.fromhex(footer)
-    if data.startswith(hdr) and data.endswith(ftr):
-        length = int.from_bytes(data[len(hdr) : len(hdr) + 2], "little")
-        return data[len(hdr) + 2 : len(hdr) + 2 + length]
-    return data
+def _frame_payload(data: bytes, header: bytes, footer: bytes) -> memoryview:
+    """Return a zero-copy view of the payload inside a framed message."""
+    view = memoryview(data)
+    if data.startswith(header) and data.endswith(footer):
+        start = len(header) + 2
+        length = int.from_bytes(view[len(header) : start], "little")
+        return view[start : start + length]
+    return view
 
 
 class LD2410(Device):
@@ -65,6 +126,8 @@ class LD2410(Device):
 
     _auto_reconnect: bool = True
     _default_should_wait_for_response: bool = True
+    # Responses carry the command word, so commands can be pipelined
+    _max_outstanding_commands: int = 3
 
     def __init__(
         self,
@@ -77,16 +140,50 @@ class LD2410(Device):
         self._inverse: bool = kwargs.pop("inverse_mode", False)
         super().__init__(device, interface=interface, **kwargs)
         self._password_words = _password_to_words(password) if password else ()
+        self._uplink: UplinkFrame | None = None
+        self._last_uplink_frame: bytes | None = None
+        self._skipped_frames = 0
+        self._parsed_view: ChainMap[str, Any] | None = None
+        # Sessions are granted by priority, interactive ones go first
+        self._config_lock = _CommandSlots(1)
+        self._config_owner: asyncio.Task[Any] | None = None
+        self._config_members: set[asyncio.Task[Any]] = set()
+        self._config_active = False
+        # Wall clock time of the last configuration read and the firmware
+        # it was read from, both persisted with the configuration
+        self._config_validated_at = -float("inf")
+        self._config_firmware: str | None = None
+        self._framer = CommandFramer()
+        self._reassembler = FrameReassembler(
+            (
+                (TX_HEADER_BYTES, TX_FOOTER_BYTES),
+                (RX_HEADER_BYTES, RX_FOOTER_BYTES),
+            )
+        )
 
     async def _on_connect(self) -> None:
         """Reauthorize and refresh configuration after connecting."""
         if self._password_words:
             await self.cmd_send_bluetooth_password()
-        await self.cmd_enable_engineering_mode()
-        params = await self.cmd_read_params()
-        res = await self.cmd_get_resolution()
-        await self.cmd_get_light_config()
-        self._update_parsed_data(
+        async with self.config_session():
+            await self.cmd_enable_engineering_mode()
+            if self.config_valid:
+                _LOGGER.debug("%s: Using cached configuration", self.name)
+            else:
+                await self._read_config()
+        _LOGGER.info(
+            "%s: Negotiation complete, start receiving uplink frames…",
+            self.name,
+        )
+
+    async def _read_config(self) -> None:
+        """Read the whole configuration from the device."""
+        params, res, _ = await self._pipeline(
+            self.cmd_read_params(),
+            self.cmd_get_resolution(),
+            self.cmd_get_light_config(),
+        )
+        changed = self._update_parsed_data(
             {
                 "move_gate_sensitivity": params.get("move_gate_sensitivity"),
                 "still_gate_sensitivity": params.get("still_gate_sensitivity"),
@@ -96,58 +193,247 @@ class LD2410(Device):
                 "resolution": res,
             }
         )
-        _LOGGER.info(
-            "%s: Negotiation complete, start receiving uplink frames…",
-            self.name,
-        )
+        self._config_validated_at = time.time()
+        self._config_firmware = self.parsed_data.get("firmware_version")
+        self._fire_callbacks(changed)
+
+    @property
+    def config_valid(self) -> bool:
+        """Return if the known configuration can be used without reading.
+
+        It expires after ``CONFIG_MAX_AGE`` and when the device reports
+        another firmware version than the one it was read from.
+        """
+        if time.time() - self._config_validated_at >= CONFIG_MAX_AGE:
+            return False
+        firmware = self.parsed_data.get("firmware_version")
+        return firmware is None or firmware == self._config_firmware
+
+    @property
+    def config_validated_at(self) -> float | None:
+        """Return the wall clock time the configuration was last read."""
+        if self._config_validated_at == -float("inf"):
+            return None
+        return self._config_validated_at
+
+    @property
+    def config_firmware(self) -> str | None:
+        """Return the firmware version the configuration was read from."""
+        return self._config_firmware
+
+    @property
+    def config(self) -> dict[str, Any]:
+        """Return the known configuration values."""
+        data = self.parsed_data
+        return {key: data[key] for key in CONFIG_KEYS if data.get(key) is not None}
+
+    def restore_config(
+        self,
+        config: Mapping[str, Any],
+        *,
+        firmware_version: str | None,
+        validated_at: float | None,
+    ) -> None:
+        """Restore a configuration persisted from an earlier session.
+
+        The values are published right away; they replace the reads on the
+        next connection while they are valid, see ``config_valid``.
+        """
+        known = {key: config[key] for key in CONFIG_KEYS if key in config}
+        self._config_firmware = firmware_version
+        if validated_at is not None:
+            self._config_validated_at = validated_at
+        self._fire_callbacks(self._update_parsed_data(known))
+
+    def invalidate_config(self) -> None:
+        """Read the configuration again on the next connection."""
+        self._config_validated_at = -float("inf")
+
+    async def update(self, interface: int | None = None) -> None:
+        """Read the configuration again when connected and publish the data."""
+        if self.is_connected:
+            await self.async_refresh_config(force=True)
+        await super().update(interface)
+
+    async def async_refresh_config(self, force: bool = False) -> None:
+        """Read the configuration unless the known one is still valid."""
+        if not force and self.config_valid:
+            return
+        async with self.config_session():
+            await self._read_config()
 
     def _modify_command(self, raw_command: str) -> bytes:
-        command_word = raw_command[:4]
-        value = raw_command[4:]
-        contents = bytearray.fromhex(command_word + value)
-        length = len(contents).to_bytes(2, "little")
-        return (
-            bytearray.fromhex(TX_HEADER)
-            + length
-            + contents
-            + bytearray.fromhex(TX_FOOTER)
-        )
+        return self._framer.frame(raw_command)
 
     def _parse_response(self, raw_command: str, data: bytes) -> bytes:
-        payload = _unwrap_frame(data, TX_HEADER, TX_FOOTER)
+        payload = _frame_payload(data, TX_HEADER_BYTES, TX_FOOTER_BYTES)
         if len(payload) < 2:
             raise OperationError("Response too short")
-        expected_ack = (int(raw_command[:4], 16) ^ 0x0001).to_bytes(2, "big")
         command = payload[:2]
-        if command != expected_ack:
+        if command != ack_word(raw_command):
             raise OperationError(
                 f"Unexpected response command {command.hex()} for {raw_command[:4]}"
             )
-        return payload[2:]
+        return bytes(payload[2:])
+
+    def _command_key(self, raw_command: str) -> bytes:
+        return ack_word(raw_command)
+
+    def _response_key(self, data: bytes) -> bytes | None:
+        payload = _frame_payload(data, TX_HEADER_BYTES, TX_FOOTER_BYTES)
+        if len(payload) < 2:
+            return None
+        return bytes(payload[:2])
 
     def _handle_notification(self, data: bytearray) -> bool:
-        if data.startswith(bytearray.fromhex(TX_HEADER)):
-            if self._notify_future and not self._notify_future.done():
-                self._notify_future.set_result(data)
-            else:
+        frames = self._reassembler.feed(data)
+        for frame in frames:
+            self._handle_frame(frame)
+        return bool(frames or self._reassembler.pending)
+
+    def _handle_frame(self, frame: bytes) -> None:
+        """Dispatch a single reassembled frame."""
+        if frame.startswith(TX_HEADER_BYTES):
+            if not self._resolve_command(frame):
                 _LOGGER.debug(
                     "%s: Received unexpected command response: %s",
                     self.name,
-                    data.hex(),
+                    frame.hex(),
                 )
-            return True
-        if data.startswith(bytearray.fromhex(RX_HEADER)):
-            payload = _unwrap_frame(data, RX_HEADER, RX_FOOTER)
-            try:
-                parsed = self._parse_uplink_frame(payload)
-            except Exception as err:  # pragma: no cover - defensive
-                _LOGGER.error("%s: Failed to parse uplink frame: %s", self.name, err)
-            else:
-                if parsed and self._update_parsed_data(parsed):
-                    self._last_full_update = time.monotonic()
-                    self._fire_callbacks()
-            return True
-        return False
+            return
+        last_frame = self._last_uplink_frame
+        if frame == last_frame:
+            # A static scene streams byte-identical frames, skip all the work
+            self._skipped_frames += 1
+            return
+        self._last_uplink_frame = frame
+        payload = _frame_payload(frame, RX_HEADER_BYTES, RX_FOOTER_BYTES)
+        try:
+            parsed = self._parse_uplink_frame(payload)
+        except Exception as err:  # pragma: no cover - defensive
+            _LOGGER.error("%s: Failed to parse uplink frame: %s", self.name, err)
+        else:
+            if parsed is None:
+                return
+            previous = self._uplink
+            if last_frame is None or previous is None:
+                # The first frame of a connection wakes every entity so they
+                # refresh their availability even if the data did not change
+                changed = None
+            elif not (changed := _changed_keys(previous, parsed, UPLINK_FIELDS)):
+                return
+            self._uplink = parsed
+            self._last_full_update = time.monotonic()
+            self._fire_callbacks(changed)
+
+    @property
+    def receiving_frames(self) -> bool:
+        """Return if an uplink frame arrived on the current connection."""
+        return self._last_uplink_frame is not None
+
+    @property
+    def skipped_frames(self) -> int:
+        """Return the number of duplicate uplink frames that were skipped."""
+        return self._skipped_frames
+
+    @property
+    def diagnostics(self) -> dict[str, Any]:
+        """Return runtime statistics for diagnostics."""
+        return super().diagnostics | {"skipped_frames": self._skipped_frames}
+
+    @property
+    def parsed_data(self) -> Mapping[str, Any]:
+        """Return parsed device data.
+
+        The latest uplink frame is layered over the configuration and
+        advertisement data; the combined view is rebuilt only when either
+        of them is replaced.
+        """
+        data = super().parsed_data or _NO_DATA
+        uplink = self._uplink
+        if uplink is None:
+            return data
+        view = self._parsed_view
+        if view is None or view.maps[0] is not uplink or view.maps[1] is not data:
+            view = self._parsed_view = ChainMap(uplink, data)
+        return view
+
+    async def update(self, interface: int | None = None) -> None:
+        """Update the device data.
+
+        The latest uplink frame stays in its own layer of ``parsed_data``;
+        the fields it holds are not copied into the advertisement data.
+        """
+        if info := await self.get_basic_info():
+            self._last_full_update = time.monotonic()
+            if (uplink := self._uplink) is not None:
+                info = {key: value for key, value in info.items() if key not in uplink}
+            self._fire_callbacks(self._update_parsed_data(info))
+
+    def _on_disconnect(self, client: BleakClientWithServiceCache = None) -> None:
+        self._reassembler.reset()
+        self._last_uplink_frame = None
+        self._config_active = False
+        super()._on_disconnect(client)
+
+    @contextlib.asynccontextmanager
+    async def config_session(self) -> AsyncIterator[None]:
+        """Run the enclosed commands in a single configuration session.
+
+        Configuration mode is enabled once on entry and ended on a clean
+        exit, ``cmd_*`` methods called inside share the session instead of
+        opening their own. Sessions nest within a task; other tasks wait
+        until the session is over, waiting sessions are entered in order of
+        their ``command_priority``. As with the single commands, the session
+        is not ended when a command fails.
+        """
+        task = asyncio.current_task()
+        if task is not None and (
+            task is self._config_owner or task in self._config_members
+        ):
+            if not self._config_active:
+                # Reopen after a reconnect or reboot inside the session
+                await self.cmd_enable_config()
+                self._config_active = True
+            yield
+            return
+        await self._config_lock.acquire(_command_priority.get())
+        self._config_owner = task
+        try:
+            await self.cmd_enable_config()
+            self._config_active = True
+            yield
+            if self._config_active:
+                await self.cmd_end_config()
+        finally:
+            self._config_owner = None
+            self._config_active = False
+            self._config_lock.release()
+
+    def _may_join_shared_read(self) -> bool:
+        # Reads in flight of other tasks may be waiting for this session
+        task = asyncio.current_task()
+        return task is None or not (
+            task is self._config_owner or task in self._config_members
+        )
+
+    async def _pipeline(self, *commands: Awaitable[Any]) -> list[Any]:
+        """Run commands of the current config session concurrently.
+
+        The commands share the caller's session and their writes are
+        pipelined instead of waiting for each response in turn. Results are
+        returned in order; if one fails the others are cancelled.
+        """
+        tasks = [asyncio.ensure_future(command) for command in commands]
+        self._config_members.update(tasks)
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        finally:
+            self._config_members.difference_update(tasks)
 
     async def cmd_send_bluetooth_password(
         self, words: Sequence[str] | None = None
@@ -174,12 +460,11 @@ class LD2410(Device):
             words = _password_to_words(password)
         except UnicodeEncodeError as err:
             raise ValueError("password must be ASCII") from err
-        await self.cmd_enable_config()
         payload = "".join(words)
-        response = await self._send_command(CMD_BT_SET_PWD + payload)
-        if response != b"\x00\x00":
-            raise OperationError("Failed to set bluetooth password")
-        await self.cmd_end_config()
+        async with self.config_session():
+            response = await self._send_command(CMD_BT_SET_PWD + payload)
+            if response != b"\x00\x00":
+                raise OperationError("Failed to set bluetooth password")
         self._password_words = words
 
     async def cmd_enable_config(self) -> tuple[int, int]:
@@ -202,45 +487,95 @@ class LD2410(Device):
 
     async def cmd_enable_engineering_mode(self) -> None:
         """Enable engineering mode."""
-        await self.cmd_enable_config()
-        response = await self._send_command(CMD_ENABLE_ENGINEERING)
-        if response != b"\x00\x00":
-            raise OperationError("Failed to enable engineering mode")
-        await self.cmd_end_config()
+        async with self.config_session():
+            response = await self._send_command(CMD_ENABLE_ENGINEERING)
+            if response != b"\x00\x00":
+                raise OperationError("Failed to enable engineering mode")
 
     async def cmd_auto_thresholds(self, duration_sec: int) -> None:
         """Start automatic threshold detection for the specified duration."""
         if not 0 <= duration_sec <= 0xFFFF:
             raise ValueError("duration_sec must be 0..65535")
-        await self.cmd_enable_config()
         raw_command = CMD_START_AUTO_THRESH + duration_sec.to_bytes(2, "little").hex()
-        response = await self._send_command(raw_command)
-        if response != b"\x00\x00":
-            raise OperationError("Failed to start automatic threshold detection")
-        await self.cmd_end_config()
+        async with self.config_session():
+            response = await self._send_command(raw_command)
+            if response != b"\x00\x00":
+                raise OperationError("Failed to start automatic threshold detection")
 
     async def cmd_query_auto_thresholds(self) -> int:
         """Query automatic threshold detection status."""
-        await self.cmd_enable_config()
-        response = await self._send_command(CMD_QUERY_AUTO_THRESH)
-        if not response or len(response) < 4 or response[:2] != b"\x00\x00":
-            raise OperationError("Failed to query automatic threshold status")
-        r = int.from_bytes(response[2:4], "little")
-        await self.cmd_end_config()
-        return r
+        async with self.config_session():
+            response = await self._send_command(CMD_QUERY_AUTO_THRESH)
+            if not response or len(response) < 4 or response[:2] != b"\x00\x00":
+                raise OperationError("Failed to query automatic threshold status")
+        return int.from_bytes(response[2:4], "little")
 
     async def cmd_set_gate_sensitivity(self, gate: int, move: int, still: int) -> None:
         """Set move and still sensitivity for a gate."""
-        if not 0 <= gate <= 8:
+        if not 0 <= gate < _GATE_COUNT:
             raise ValueError("gate must be 0..8")
-        if not 0 <= move <= 100:
-            raise ValueError("move must be 0..100")
-        if not 0 <= still <= 100:
-            raise ValueError("still must be 0..100")
-        await self.cmd_enable_config()
+        _check_sensitivity(move, still)
+        async with self.config_session():
+            await self._write_sensitivity(gate.to_bytes(4, "little").hex(), move, still)
+            move_list = list(self.parsed_data.get("move_gate_sensitivity") or [])
+            still_list = list(self.parsed_data.get("still_gate_sensitivity") or [])
+            if gate < len(move_list):
+                move_list[gate] = move
+            if gate < len(still_list):
+                still_list[gate] = still
+            changed = self._update_parsed_data(
+                {
+                    "move_gate_sensitivity": move_list,
+                    "still_gate_sensitivity": still_list,
+                }
+            )
+            self._fire_callbacks(changed)
+
+    async def cmd_set_gate_sensitivities(
+        self, move: Sequence[int], still: Sequence[int]
+    ) -> None:
+        """Set move and still sensitivities of all gates.
+
+        Only gates whose values differ from the cached configuration are
+        written, all in one configuration session. When every gate gets the
+        same values a single write with the ``ALL_GATES`` selector is used.
+        """
+        if len(move) != _GATE_COUNT or len(still) != _GATE_COUNT:
+            raise ValueError(f"expected {_GATE_COUNT} move and still values")
+        for move_value, still_value in zip(move, still):
+            _check_sensitivity(move_value, still_value)
+        current_move = list(self.parsed_data.get("move_gate_sensitivity") or ())
+        current_still = list(self.parsed_data.get("still_gate_sensitivity") or ())
+        gates = [
+            gate
+            for gate in range(_GATE_COUNT)
+            if gate >= len(current_move)
+            or gate >= len(current_still)
+            or (current_move[gate], current_still[gate]) != (move[gate], still[gate])
+        ]
+        if not gates:
+            return
+        async with self.config_session():
+            if len(gates) > 1 and len(set(move)) == 1 and len(set(still)) == 1:
+                await self._write_sensitivity(ALL_GATES + "0000", move[0], still[0])
+            else:
+                for gate in gates:
+                    await self._write_sensitivity(
+                        gate.to_bytes(4, "little").hex(), move[gate], still[gate]
+                    )
+            changed = self._update_parsed_data(
+                {
+                    "move_gate_sensitivity": list(move),
+                    "still_gate_sensitivity": list(still),
+                }
+            )
+            self._fire_callbacks(changed)
+
+    async def _write_sensitivity(self, selector: str, move: int, still: int) -> None:
+        """Write sensitivities of the gate given as a hex u32 ``selector``."""
         payload = (
             PAR_DISTANCE_GATE
-            + gate.to_bytes(4, "little").hex()
+            + selector
             + PAR_MOVE_SENS
             + move.to_bytes(4, "little").hex()
             + PAR_STILL_SENS
@@ -249,54 +584,43 @@ class LD2410(Device):
         response = await self._send_command(CMD_SET_SENSITIVITY + payload)
         if response != b"\x00\x00":
             raise OperationError("Failed to set sensitivity")
-        move_list = list(self.parsed_data.get("move_gate_sensitivity") or [])
-        still_list = list(self.parsed_data.get("still_gate_sensitivity") or [])
-        if gate < len(move_list):
-            move_list[gate] = move
-        if gate < len(still_list):
-            still_list[gate] = still
-        self._update_parsed_data(
-            {
-                "move_gate_sensitivity": move_list,
-                "still_gate_sensitivity": still_list,
-            }
-        )
-        await self.cmd_end_config()
 
     async def cmd_read_params(self) -> Dict[str, Any]:
         """Read and parse device configuration parameters."""
-        await self.cmd_enable_config()
-        response = await self._send_command(CMD_READ_PARAMS)
-        if (
-            not response
-            or len(response) < 10
-            or response[:2] != b"\x00\x00"
-            or response[2] != 0xAA
-        ):
-            raise OperationError("Failed to read parameters")
-        payload = response[3:]
-        max_gate = payload[0]
-        max_move_gate = payload[1]
-        max_still_gate = payload[2]
-        move_len = max_gate + 1
-        expected_len = 3 + move_len * 2 + 2
-        if len(payload) < expected_len:
-            raise OperationError("Failed to read parameters")
-        idx = 3
-        move_gate_sensitivity = list(payload[idx : idx + move_len])
-        idx += move_len
-        still_gate_sensitivity = list(payload[idx : idx + move_len])
-        idx += move_len
-        absence_delay = int.from_bytes(payload[idx : idx + 2], "little")
-        r = {
-            "max_gate": max_gate,
-            "max_move_gate": max_move_gate,
-            "max_still_gate": max_still_gate,
-            "move_gate_sensitivity": move_gate_sensitivity,
-            "still_gate_sensitivity": still_gate_sensitivity,
-            "absence_delay": absence_delay,
-        }
-        await self.cmd_end_config()
+        return await self._shared_read(CMD_READ_PARAMS, self._read_params)
+
+    async def _read_params(self) -> Dict[str, Any]:
+        async with self.config_session():
+            response = await self._send_command(CMD_READ_PARAMS)
+            if (
+                not response
+                or len(response) < 10
+                or response[:2] != b"\x00\x00"
+                or response[2] != 0xAA
+            ):
+                raise OperationError("Failed to read parameters")
+            payload = response[3:]
+            max_gate = payload[0]
+            max_move_gate = payload[1]
+            max_still_gate = payload[2]
+            move_len = max_gate + 1
+            expected_len = 3 + move_len * 2 + 2
+            if len(payload) < expected_len:
+                raise OperationError("Failed to read parameters")
+            idx = 3
+            move_gate_sensitivity = list(payload[idx : idx + move_len])
+            idx += move_len
+            still_gate_sensitivity = list(payload[idx : idx + move_len])
+            idx += move_len
+            absence_delay = int.from_bytes(payload[idx : idx + 2], "little")
+            r = {
+                "max_gate": max_gate,
+                "max_move_gate": max_move_gate,
+                "max_still_gate": max_still_gate,
+                "move_gate_sensitivity": move_gate_sensitivity,
+                "still_gate_sensitivity": still_gate_sensitivity,
+                "absence_delay": absence_delay,
+            }
         return r
 
     async def cmd_set_absence_delay(self, delay: int) -> None:
@@ -305,7 +629,6 @@ class LD2410(Device):
             raise ValueError("delay must be 0..65535")
         move_gate = self.parsed_data.get("max_move_gate", 8)
         still_gate = self.parsed_data.get("max_still_gate", 8)
-        await self.cmd_enable_config()
         payload = (
             PAR_MAX_MOVE_GATE
             + move_gate.to_bytes(4, "little").hex()
@@ -314,29 +637,33 @@ class LD2410(Device):
             + PAR_NOBODY_DURATION
             + delay.to_bytes(4, "little").hex()
         )
-        response = await self._send_command(CMD_SET_MAX_GATES_AND_NOBODY + payload)
-        if response != b"\x00\x00":
-            raise OperationError("Failed to set absence delay")
-        self._update_parsed_data({"absence_delay": delay})
-        await self.cmd_end_config()
+        async with self.config_session():
+            response = await self._send_command(CMD_SET_MAX_GATES_AND_NOBODY + payload)
+            if response != b"\x00\x00":
+                raise OperationError("Failed to set absence delay")
+            changed = self._update_parsed_data({"absence_delay": delay})
+            self._fire_callbacks(changed)
 
     async def cmd_get_light_config(self) -> Dict[str, int]:
         """Get light control configuration."""
-        await self.cmd_enable_config()
-        response = await self._send_command(CMD_GET_AUX)
-        if not response or len(response) < 6 or response[:2] != b"\x00\x00":
-            raise OperationError("Failed to get light config")
-        mode = response[2]
-        threshold = response[3]
-        out_level = response[4]
-        self._update_parsed_data(
-            {
-                "light_function": mode,
-                "light_threshold": threshold,
-                "light_out_level": out_level,
-            }
-        )
-        await self.cmd_end_config()
+        return await self._shared_read(CMD_GET_AUX, self._read_light_config)
+
+    async def _read_light_config(self) -> Dict[str, int]:
+        async with self.config_session():
+            response = await self._send_command(CMD_GET_AUX)
+            if not response or len(response) < 6 or response[:2] != b"\x00\x00":
+                raise OperationError("Failed to get light config")
+            mode = response[2]
+            threshold = response[3]
+            out_level = response[4]
+            changed = self._update_parsed_data(
+                {
+                    "light_function": mode,
+                    "light_threshold": threshold,
+                    "light_out_level": out_level,
+                }
+            )
+            self._fire_callbacks(changed)
         return {"mode": mode, "threshold": threshold, "out_level": out_level}
 
     async def cmd_set_light_config(
@@ -360,124 +687,135 @@ class LD2410(Device):
         threshold_byte = threshold if threshold is not None else current_threshold
         out_level_byte = out_level if out_level is not None else current_out_level
         payload = bytes([mode_byte, threshold_byte, out_level_byte, 0]).hex()
-        await self.cmd_enable_config()
-        response = await self._send_command(CMD_SET_AUX + payload)
-        if response != b"\x00\x00":
-            raise OperationError("Failed to set light config")
-        self._update_parsed_data(
-            {
-                "light_function": mode_byte,
-                "light_threshold": threshold_byte,
-                "light_out_level": out_level_byte,
-            }
-        )
-        await self.cmd_end_config()
+        async with self.config_session():
+            response = await self._send_command(CMD_SET_AUX + payload)
+            if response != b"\x00\x00":
+                raise OperationError("Failed to set light config")
+            changed = self._update_parsed_data(
+                {
+                    "light_function": mode_byte,
+                    "light_threshold": threshold_byte,
+                    "light_out_level": out_level_byte,
+                }
+            )
+            self._fire_callbacks(changed)
 
     async def cmd_get_resolution(self) -> int:
         """Query the distance resolution."""
-        await self.cmd_enable_config()
-        response = await self._send_command(CMD_GET_RES)
-        if not response or len(response) < 4 or response[:2] != b"\x00\x00":
-            raise OperationError("Failed to get resolution")
-        idx = int.from_bytes(response[2:4], "little")
-        await self.cmd_end_config()
-        self._update_parsed_data({"resolution": idx})
+        return await self._shared_read(CMD_GET_RES, self._read_resolution)
+
+    async def _read_resolution(self) -> int:
+        async with self.config_session():
+            response = await self._send_command(CMD_GET_RES)
+            if not response or len(response) < 4 or response[:2] != b"\x00\x00":
+                raise OperationError("Failed to get resolution")
+            idx = int.from_bytes(response[2:4], "little")
+        changed = self._update_parsed_data({"resolution": idx})
+        self._fire_callbacks(changed)
         return idx
 
     async def cmd_set_resolution(self, index: int) -> None:
         """Set the distance resolution."""
         if index not in (0, 1):
             raise ValueError("index must be 0 or 1")
-        await self.cmd_enable_config()
         payload = index.to_bytes(2, "little").hex()
-        response = await self._send_command(CMD_SET_RES + payload)
-        if response != b"\x00\x00":
-            raise OperationError("Failed to set resolution")
-        self._update_parsed_data({"resolution": index})
-        await self.cmd_end_config()
+        async with self.config_session():
+            response = await self._send_command(CMD_SET_RES + payload)
+            if response != b"\x00\x00":
+                raise OperationError("Failed to set resolution")
+            changed = self._update_parsed_data({"resolution": index})
+            self._fire_callbacks(changed)
         await self.cmd_reboot()
 
     async def cmd_reboot(self) -> None:
         """Reboot the module."""
-        await self.cmd_enable_config()
-        await self._send_command(CMD_REBOOT, wait_for_response=False)
+        async with self.config_session():
+            await self._send_command(CMD_REBOOT, wait_for_response=False)
+            # The module leaves configuration mode when it restarts
+            self._config_active = False
 
-    def _parse_uplink_frame(self, data: bytes) -> Dict[str, Any] | None:
+    def _parse_uplink_frame(self, data: bytes) -> UplinkFrame | None:
         """Parse an uplink frame.
 
         ``data`` must be the payload after removing the frame header and footer.
+        Any bytes-like object is accepted; the payload is decoded in place
+        through a ``memoryview`` without intermediate copies.
         Returns ``None`` if the payload is not an uplink frame and raises
         ``ValueError`` if the frame is malformed.
         """
-        if len(data) < 2 or data[1] != 0xAA:
+        size = len(data)
+        if size < 2 or data[1] != _UPLINK_HEAD:
             # Not an uplink frame
             return None
 
-        frame_type = data[:1].hex()
-        if frame_type == UPLINK_TYPE_ENGINEERING:
-            ftype = "engineering"
-        elif frame_type == UPLINK_TYPE_BASIC:
-            ftype = "basic"
-        else:
-            raise ValueError(f"unknown frame type {frame_type}")
+        ftype = _UPLINK_FRAME_TYPES.get(data[0])
+        if ftype is None:
+            raise ValueError(f"unknown frame type {data[0]:02x}")
 
-        if not data.endswith(b"\x55\x00"):
+        if data[size - 2] != _UPLINK_TAIL or data[size - 1] != _UPLINK_CHECK:
             raise ValueError("missing frame footer")
 
-        content = data[2:-2]
-        if len(content) < 9:
+        # Content sits between the two-byte head and the two-byte tail
+        end = size - 2
+        if end - _UPLINK_CONTENT < _BASIC_TARGET.size:
             raise ValueError("payload too short for basic data")
-        status_raw = content[0]
-        move_distance_cm = int.from_bytes(content[1:3], "little")
-        move_energy = content[3]
-        still_distance_cm = int.from_bytes(content[4:6], "little")
-        still_energy = content[6]
-        detect_distance_cm = int.from_bytes(content[7:9], "little")
-        idx = 9
-
-        moving = status_raw in (0x01, 0x03)
-        stationary = status_raw in (0x02, 0x03)
-        occupancy = moving or stationary
-
-        result: Dict[str, Any] = {
-            "type": ftype,
-            "moving": moving,
-            "stationary": stationary,
-            "occupancy": occupancy,
-            "move_distance_cm": move_distance_cm,
-            "move_energy": move_energy,
-            "still_distance_cm": still_distance_cm,
-            "still_energy": still_energy,
-            "detect_distance_cm": detect_distance_cm,
-        }
-
-        if ftype == "engineering":
-            if len(content) < idx + 2:
-                raise ValueError("missing gate counts")
-            max_move_gate = content[idx]
-            max_still_gate = content[idx + 1]
-            idx += 2
-            move_len = max_move_gate + 1
-            still_len = max_still_gate + 1
-            if len(content) < idx + move_len + still_len:
-                raise ValueError("missing gate energy values")
-            move_gate_energy = list(content[idx : idx + move_len])
-            idx += move_len
-            still_gate_energy = list(content[idx : idx + still_len])
-            idx += still_len
-            if len(content) < idx + 2:
-                raise ValueError("missing photo sensor or OUT pin status")
-            photo_sensor = content[idx]
-            out_pin = content[idx + 1]
-            result.update(
-                {
-                    "max_move_gate": max_move_gate,
-                    "max_still_gate": max_still_gate,
-                    "move_gate_energy": move_gate_energy,
-                    "still_gate_energy": still_gate_energy,
-                    "photo_sensor": photo_sensor,
-                    "out_pin": bool(out_pin),
-                }
+        view = memoryview(data)
+        (
+            status_raw,
+            move_distance_cm,
+            move_energy,
+            still_distance_cm,
+            still_energy,
+            detect_distance_cm,
+        ) = _BASIC_TARGET.unpack_from(view, _UPLINK_CONTENT)
+
+        moving = status_raw == 0x01 or status_raw == 0x03
+        stationary = status_raw == 0x02 or status_raw == 0x03
+
+        if ftype == "basic":
+            return UplinkFrame(
+                ftype,
+                moving,
+                stationary,
+                moving or stationary,
+                move_distance_cm,
+                move_energy,
+                still_distance_cm,
+                still_energy,
+                detect_distance_cm,
             )
 
-        return result
+        idx = _UPLINK_CONTENT + _BASIC_TARGET.size
+        if end < idx + 2:
+            raise ValueError("missing gate counts")
+        max_move_gate = view[idx]
+        max_still_gate = view[idx + 1]
+        move_start = idx + 2
+        still_start = move_start + max_move_gate + 1
+        still_end = still_start + max_still_gate + 1
+        if end < still_end:
+            raise ValueError("missing gate energy values")
+        if end < still_end + 2:
+            raise ValueError("missing photo sensor or OUT pin status")
+        move_gate_energy = array("B")
+        move_gate_energy.frombytes(view[move_start:still_start])
+        still_gate_energy = array("B")
+        still_gate_energy.frombytes(view[still_start:still_end])
+
+        return UplinkFrame(
+            ftype,
+            moving,
+            stationary,
+            moving or stationary,
+            move_distance_cm,
+            move_energy,
+            still_distance_cm,
+            still_energy,
+            detect_distance_cm,
+            max_move_gate,
+            max_still_gate,
+            move_gate_energy,
+            still_gate_energy,
+            view[still_end],
+            view[still_end + 1] != 0,
+        )
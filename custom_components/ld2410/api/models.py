@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+from array import array
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Any
 
 from bleak.backends.device import BLEDevice
@@ -17,3 +20,101 @@ class Advertisement:
     device: BLEDevice
     rssi: int
     active: bool = False
+
+
+UPLINK_FIELDS = (
+    "type",
+    "moving",
+    "stationary",
+    "occupancy",
+    "move_distance_cm",
+    "move_energy",
+    "still_distance_cm",
+    "still_energy",
+    "detect_distance_cm",
+    "max_move_gate",
+    "max_still_gate",
+    "move_gate_energy",
+    "still_gate_energy",
+    "photo_sensor",
+    "out_pin",
+)
+_UPLINK_FIELD_SET = frozenset(UPLINK_FIELDS)
+_uplink_values = attrgetter(*UPLINK_FIELDS)
+
+
+class UplinkFrame(Mapping[str, Any]):
+    """Decoded uplink data frame.
+
+    A slotted record that also behaves as a read-only mapping, so it can be
+    used wherever the parsed data dictionary was read before. Engineering
+    fields are ``None`` for basic frames and are hidden from the mapping.
+    Gate energies are stored as ``array('B')``.
+    """
+
+    __slots__ = UPLINK_FIELDS
+
+    def __init__(
+        self,
+        type: str,
+        moving: bool,
+        stationary: bool,
+        occupancy: bool,
+        move_distance_cm: int,
+        move_energy: int,
+        still_distance_cm: int,
+        still_energy: int,
+        detect_distance_cm: int,
+        max_move_gate: int | None = None,
+        max_still_gate: int | None = None,
+        move_gate_energy: array[int] | None = None,
+        still_gate_energy: array[int] | None = None,
+        photo_sensor: int | None = None,
+        out_pin: bool | None = None,
+    ) -> None:
+        """Initialize the frame."""
+        self.type = type
+        self.moving = moving
+        self.stationary = stationary
+        self.occupancy = occupancy
+        self.move_distance_cm = move_distance_cm
+        self.move_energy = move_energy
+        self.still_distance_cm = still_distance_cm
+        self.still_energy = still_energy
+        self.detect_distance_cm = detect_distance_cm
+        self.max_move_gate = max_move_gate
+        self.max_still_gate = max_still_gate
+        self.move_gate_energy = move_gate_energy
+        self.still_gate_energy = still_gate_energy
+        self.photo_sensor = photo_sensor
+        self.out_pin = out_pin
+
+    def __getitem__(self, key: str) -> Any:
+        """Return the value of a populated field."""
+        if key in _UPLINK_FIELD_SET:
+            value = getattr(self, key)
+            if value is not None:
+                return value
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over populated fields."""
+        for key, value in zip(UPLINK_FIELDS, _uplink_values(self)):
+            if value is not None:
+                yield key
+
+    def __len__(self) -> int:
+        """Return the number of populated fields."""
+        return sum(value is not None for value in _uplink_values(self))
+
+    def __eq__(self, other: object) -> bool:
+        """Compare field by field, or as a mapping against other mappings."""
+        if isinstance(other, UplinkFrame):
+            return _uplink_values(self) == _uplink_values(other)
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return a representation of the populated fields."""
+        return f"UplinkFrame({dict(self)!r})"
@@ -0,0 +1,128 @@
+"""Incremental reassembly of framed messages from a notification stream."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+
+_LOGGER = logging.getLogger(__name__)
+
+# Size of the little-endian length field that follows every frame header
+LENGTH_SIZE = 2
+# Upper bound for buffered bytes; LD2410 frames are well below 100 bytes
+DEFAULT_MAX_BUFFER = 512
+
+
+class FrameReassembler:
+    """Cut complete frames out of arbitrarily fragmented notifications.
+
+    BLE notifications relayed through proxies with a small MTU may carry a
+    fraction of a frame, or several frames at once. Bytes are collected in a
+    bounded buffer, headers are located with ``bytes.find`` and frames are cut
+    using their length field, so the work per notification does not depend
+    on a Python loop over individual bytes. Data that cannot belong to a
+    frame is discarded until the next header to resynchronise the stream.
+
+    The buffer is a ``bytearray`` consumed from the front; CPython advances
+    the start offset instead of moving the remaining bytes, which gives the
+    same cost profile as a ring buffer.
+    """
+
+    def __init__(
+        self,
+        markers: Iterable[tuple[bytes, bytes]],
+        max_size: int = DEFAULT_MAX_BUFFER,
+    ) -> None:
+        """Initialize with ``(header, footer)`` pairs of the framed messages."""
+        self._footers: dict[bytes, bytes] = dict(markers)
+        sizes = {len(header) for header in self._footers}
+        if len(sizes) != 1:
+            raise ValueError("all frame headers must have the same size")
+        self._header_size = sizes.pop()
+        self._prefix_size = self._header_size + LENGTH_SIZE
+        self._max_size = max_size
+        self._buffer = bytearray()
+        self.discarded_bytes = 0
+
+    @property
+    def pending(self) -> int:
+        """Return the number of buffered bytes awaiting the rest of a frame."""
+        return len(self._buffer)
+
+    def reset(self) -> None:
+        """Drop any partially received frame."""
+        self._buffer.clear()
+
+    def feed(self, data: bytes) -> list[bytes]:
+        """Add ``data`` to the stream and return all frames it completes."""
+        if not self._buffer and self._frame_size(data) == len(data):
+            # Fast path: exactly one complete frame in a single notification
+            return [bytes(data)]
+
+        buffer = self._buffer
+        buffer += data
+        frames: list[bytes] = []
+        while buffer:
+            start = self._find_header(buffer)
+            if start < 0:
+                self._discard(len(buffer) - self._partial_header_size(buffer))
+                break
+            if start:
+                self._discard(start)
+            frame_size = self._frame_size(buffer)
+            if frame_size is None:
+                # Header found but the frame is incomplete
+                break
+            if frame_size < 0:
+                # Bogus length or footer, skip this header and resync
+                self._discard(1)
+                continue
+            frames.append(bytes(buffer[:frame_size]))
+            del buffer[:frame_size]
+        return frames
+
+    def _frame_size(self, data: bytes) -> int | None:
+        """Return the size of the frame at the start of ``data``.
+
+        Returns ``None`` when more data is needed and ``-1`` when the bytes
+        at the start of ``data`` cannot be a valid frame.
+        """
+        if len(data) < self._prefix_size:
+            return None
+        footer = self._footers.get(bytes(data[: self._header_size]))
+        if footer is None:
+            return -1
+        length = int.from_bytes(data[self._header_size : self._prefix_size], "little")
+        size = self._prefix_size + length + len(footer)
+        if size > self._max_size:
+            return -1
+        if len(data) < size:
+            return None
+        if data[size - len(footer) : size] != footer:
+            return -1
+        return size
+
+    def _find_header(self, buffer: bytearray) -> int:
+        """Return the offset of the first frame header in ``buffer``."""
+        start = -1
+        for header in self._footers:
+            offset = buffer.find(header)
+            if offset >= 0 and (start < 0 or offset < start):
+                start = offset
+        return start
+
+    def _partial_header_size(self, buffer: bytearray) -> int:
+        """Return the length of a trailing header prefix in ``buffer``."""
+        for size in range(min(len(buffer), self._header_size - 1), 0, -1):
+            tail = bytes(buffer[-size:])
+            if any(header.startswith(tail) for header in self._footers):
+                return size
+        return 0
+
+    def _discard(self, count: int) -> None:
+        """Drop ``count`` bytes from the front of the buffer."""
+        if count <= 0:
+            return
+        _LOGGER.debug("Discarding %d bytes while resynchronising", count)
+        del self._buffer[:count]
+        self.discarded_bytes += count
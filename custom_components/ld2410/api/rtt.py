@@ -0,0 +1,82 @@
+"""Round trip time estimation for command timeouts."""
+
+from __future__ import annotations
+
+# Gains of the smoothed RTT and its deviation (RFC 6298)
+ALPHA = 1 / 8
+BETA = 1 / 4
+# Weight of the deviation in the timeout
+DEVIATION_FACTOR = 4
+# Consecutive timeouts double the timeout up to this factor
+MAX_BACKOFF = 8
+
+
+class RttEstimator:
+    """Derive the command timeout from measured round trip times.
+
+    Keeps an exponentially weighted mean and mean deviation of the RTT, as
+    TCP does for its retransmission timeout. The timeout is the mean plus
+    four deviations, bounded by ``min_timeout`` and ``max_timeout``; before
+    the first sample ``initial_timeout`` is used. Every timeout doubles the
+    timeout until the next sample arrives.
+    """
+
+    __slots__ = (
+        "_backoff",
+        "initial_timeout",
+        "max_timeout",
+        "min_timeout",
+        "rttvar",
+        "srtt",
+    )
+
+    def __init__(
+        self,
+        initial_timeout: float,
+        min_timeout: float,
+        max_timeout: float,
+    ) -> None:
+        """Initialize the estimator without samples."""
+        self.initial_timeout = initial_timeout
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.srtt: float | None = None
+        self.rttvar: float | None = None
+        self._backoff = 1
+
+    def sample(self, rtt: float) -> None:
+        """Add a measured round trip time in seconds."""
+        if self.srtt is None or self.rttvar is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar = (1 - BETA) * self.rttvar + BETA * abs(self.srtt - rtt)
+            self.srtt = (1 - ALPHA) * self.srtt + ALPHA * rtt
+        self._backoff = 1
+
+    def timed_out(self) -> None:
+        """Back off after a command timed out."""
+        self._backoff = min(self._backoff * 2, MAX_BACKOFF)
+
+    @property
+    def timeout(self) -> float:
+        """Return the time to wait for a response."""
+        if self.srtt is None or self.rttvar is None:
+            timeout = self.initial_timeout
+        else:
+            timeout = max(self.min_timeout, self.srtt + DEVIATION_FACTOR * self.rttvar)
+        return min(timeout * self._backoff, self.max_timeout)
+
+    def backoff(self, minimum: float) -> float:
+        """Return how long to wait before retrying after an error."""
+        if self.srtt is None:
+            return minimum
+        return min(max(minimum, self.srtt), self.max_timeout)
+
+    def as_dict(self) -> dict[str, float | None]:
+        """Return the current estimate in milliseconds."""
+        return {
+            "srtt_ms": None if self.srtt is None else round(self.srtt * 1000, 1),
+            "rttvar_ms": None if self.rttvar is None else round(self.rttvar * 1000, 1),
+            "timeout_ms": round(self.timeout * 1000, 1),
+        }
@@ -0,0 +1,57 @@
+"""Stop several devices at once under a deadline."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Iterable
+
+from .devices.device import BaseDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+# Stop tasks of abandoned devices, referenced until they unwind
+_ABANDONED_TASKS: set[asyncio.Task[None]] = set()
+
+
+async def async_stop_devices(
+    devices: Iterable[BaseDevice], timeout: float
+) -> dict[str, float | None]:
+    """Stop ``devices`` concurrently within ``timeout`` seconds.
+
+    Devices that have not stopped by the deadline are cancelled and
+    abandoned. Returns the seconds each device took to stop by address,
+    ``None`` for abandoned devices.
+    """
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    durations: dict[str, float | None] = {}
+
+    async def _async_stop(device: BaseDevice) -> None:
+        try:
+            await device.async_stop()
+        except Exception as ex:  # noqa: BLE001 - stop the other devices
+            _LOGGER.warning("%s: Error while stopping: %s", device.name, ex)
+        durations[device.get_address()] = elapsed = loop.time() - start
+        _LOGGER.debug("%s: Stopped in %.2fs", device.name, elapsed)
+
+    tasks = {
+        asyncio.create_task(_async_stop(device), name=f"stop {device.name}"): device
+        for device in devices
+    }
+    if not tasks:
+        return durations
+    _, pending = await asyncio.wait(tasks, timeout=timeout)
+    for task in pending:
+        device = tasks[task]
+        task.cancel()
+        _ABANDONED_TASKS.add(task)
+        task.add_done_callback(_ABANDONED_TASKS.discard)
+        device.abandon()
+        durations[device.get_address()] = None
+        _LOGGER.warning(
+            "%s: Abandoned the connection after not stopping within %ss",
+            device.name,
+            timeout,
+        )
+    return durations
@@ -0,0 +1,102 @@
+"""Connection slots of a bluetooth adapter or proxy."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ConnectionSlots:
+    """Admit connections through an adapter with a limited number of slots.
+
+    A slot is held from the connection attempt until the device
+    disconnects. Waiting devices are admitted by priority, then by the
+    strongest RSSI, at most one every ``stagger`` seconds so an adapter is
+    not asked to establish all its connections at once.
+    """
+
+    def __init__(self, source: str, slots: int, stagger: float) -> None:
+        """Initialize the slots of ``source``."""
+        self.source = source
+        self.slots = slots
+        self.stagger = stagger
+        self._holders: set[str] = set()
+        self._waiters: list[tuple[int, int, int, str, asyncio.Future[None]]] = []
+        self._counter = itertools.count()
+        self._last_admission = -float("inf")
+        self._admit_timer: asyncio.TimerHandle | None = None
+
+    async def acquire(self, address: str, rssi: int, priority: int) -> None:
+        """Wait for a connection slot for the device at ``address``."""
+        if address in self._holders:
+            return
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+        heapq.heappush(
+            self._waiters, (priority, -rssi, next(self._counter), address, future)
+        )
+        self._schedule_admission()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release(address)
+            raise
+
+    def release(self, address: str) -> None:
+        """Free the slot held by the device at ``address``, if any."""
+        if address not in self._holders:
+            return
+        self._holders.remove(address)
+        self._schedule_admission()
+
+    def _schedule_admission(self) -> None:
+        """Admit the next waiter now or once the stagger elapsed."""
+        if self._admit_timer is not None:
+            return
+        if len(self._holders) >= self.slots or not self._waiters:
+            return
+        loop = asyncio.get_running_loop()
+        delay = self._last_admission + self.stagger - loop.time()
+        if delay > 0:
+            self._admit_timer = loop.call_later(delay, self._admit)
+        else:
+            self._admit()
+
+    def _admit(self) -> None:
+        self._admit_timer = None
+        while self._waiters and len(self._holders) < self.slots:
+            *_, address, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue
+            self._holders.add(address)
+            future.set_result(None)
+            self._last_admission = asyncio.get_running_loop().time()
+            _LOGGER.debug(
+                "%s: Admitted connection to %s (%s/%s slots)",
+                self.source,
+                address,
+                len(self._holders),
+                self.slots,
+            )
+            break
+        self._schedule_admission()
+
+    @property
+    def waiting(self) -> int:
+        """Return the number of devices waiting for a slot."""
+        return sum(not waiter[-1].done() for waiter in self._waiters)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the slot usage."""
+        return {
+            "source": self.source,
+            "slots": self.slots,
+            "in_use": len(self._holders),
+            "waiting": self.waiting,
+        }
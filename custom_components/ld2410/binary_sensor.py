@@ -68,6 +68,9 @@ async def async_setup_entry(
 class BinarySensor(Entity, BinarySensorEntity):
     """Representation of a binary sensor."""
 
+    # Occupancy and motion drive automations, never delay their updates
+    _min_publish_interval = 0.0
+
     def __init__(
         self,
         coordinator: DataCoordinator,
@@ -78,6 +81,7 @@ class BinarySensor(Entity, BinarySensorEntity):
         self._sensor = binary_sensor
         self._attr_unique_id = f"{coordinator.base_unique_id}-{binary_sensor}"
         self.entity_description = BINARY_SENSOR_TYPES[binary_sensor]
+        self._data_keys = (self.entity_description.key,)
 
     @property
     def is_on(self) -> bool:
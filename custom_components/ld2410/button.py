@@ -21,6 +21,7 @@ except ImportError:  # Home Assistant <2024.6
 
 import logging
 
+from .api import CommandPriority, command_priority
 from .const import (
     CONF_SAVED_MOVE_SENSITIVITY,
     CONF_SAVED_STILL_SENSITIVITY,
@@ -60,6 +61,7 @@ class AutoSensitivityButton(Entity, ButtonEntity):
 
     _attr_entity_category = EntityCategory.CONFIG
     _attr_translation_key = "auto_sensitivities"
+    _data_keys = ()
 
     def __init__(self, coordinator: DataCoordinator) -> None:
         """Initialize the button."""
@@ -79,9 +81,12 @@ class AutoSensitivityButton(Entity, ButtonEntity):
         await self._device.cmd_auto_thresholds(AUTO_THRESH_DURATION)
         await asyncio.sleep(AUTO_THRESH_DURATION)
         try:
-            async with asyncio.timeout(AUTO_THRESH_TIMEOUT):
-                while await self._device.cmd_query_auto_thresholds() != 0:
-                    await asyncio.sleep(1)
+            # Polling is background traffic; every query is a short session
+            # of its own, so other user actions pass in between
+            with command_priority(CommandPriority.BACKGROUND):
+                async with asyncio.timeout(AUTO_THRESH_TIMEOUT):
+                    while await self._device.cmd_query_auto_thresholds() != 0:
+                        await asyncio.sleep(1)
         except asyncio.TimeoutError:
             async_ephemeral_notification(
                 self.hass,
@@ -91,13 +96,13 @@ class AutoSensitivityButton(Entity, ButtonEntity):
             )
             return
         params = await self._device.cmd_read_params()
-        if self._device._update_parsed_data(
+        changed = self._device._update_parsed_data(
             {
                 "move_gate_sensitivity": params.get("move_gate_sensitivity"),
                 "still_gate_sensitivity": params.get("still_gate_sensitivity"),
             }
-        ):
-            self._device._fire_callbacks()
+        )
+        self._device._fire_callbacks(changed)
 
 
 class SaveSensitivitiesButton(Entity, ButtonEntity):
@@ -105,6 +110,7 @@ class SaveSensitivitiesButton(Entity, ButtonEntity):
 
     _attr_entity_category = EntityCategory.CONFIG
     _attr_translation_key = "save_sensitivities"
+    _data_keys = ()
 
     def __init__(self, coordinator: DataCoordinator, entry: ConfigEntryType) -> None:
         """Initialize the button."""
@@ -145,6 +151,7 @@ class LoadSensitivitiesButton(Entity, ButtonEntity):
 
     _attr_entity_category = EntityCategory.CONFIG
     _attr_translation_key = "load_sensitivities"
+    _data_keys = ()
 
     def __init__(self, coordinator: DataCoordinator, entry: ConfigEntryType) -> None:
         """Initialize the button."""
@@ -166,9 +173,7 @@ class LoadSensitivitiesButton(Entity, ButtonEntity):
                 notification_id=notification_id,
             )
             return
-        for gate, (m, s) in enumerate(zip(move, still)):
-            await self._device.cmd_set_gate_sensitivity(gate, m, s)
-        self._device._fire_callbacks()
+        await self._device.cmd_set_gate_sensitivities(move, still)
         LOGGER.info("Loaded saved gate sensitivities into device")
         async_ephemeral_notification(
             self.hass,
@@ -183,6 +188,7 @@ class ChangePasswordButton(Entity, ButtonEntity):
 
     _attr_entity_category = EntityCategory.CONFIG
     _attr_translation_key = "change_password"
+    _data_keys = ()
 
     def __init__(self, coordinator: DataCoordinator, entry: ConfigEntryType) -> None:
         """Initialize the button."""
@@ -237,6 +243,7 @@ class RebootButton(Entity, ButtonEntity):
 
     _attr_entity_category = EntityCategory.CONFIG
     _attr_translation_key = "reboot"
+    _data_keys = ()
 
     def __init__(self, coordinator: DataCoordinator) -> None:
         """Initialize the button."""
@@ -0,0 +1,109 @@
+"""Persistent cache of the device configuration."""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
+
+from . import api
+from .api.devices.ld2410 import CONFIG_KEYS
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+# Seconds to collect configuration changes into a single write
+SAVE_DELAY = 10
+# How often to check whether the configuration of a connected device expired
+REVALIDATE_INTERVAL = timedelta(hours=1)
+
+
+def _store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.config")
+
+
+async def async_remove_config_cache(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove the stored configuration of a config entry."""
+    await _store(hass, entry_id).async_remove()
+
+
+class ConfigCache:
+    """Persist the configuration of a device across restarts.
+
+    The stored configuration is keyed by the device address and the
+    firmware version it was read from. It is restored before the device
+    connects so configuration entities have a state right after setup, and
+    lets the device skip reading it on connect while it is valid.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, device: api.LD2410) -> None:
+        """Initialize the cache of a config entry."""
+        self._hass = hass
+        self._device = device
+        self._store = _store(hass, entry_id)
+
+    async def async_restore(self) -> None:
+        """Restore the stored configuration into the device."""
+        if not (data := await self._store.async_load()):
+            return
+        if data.get("address") != self._device.get_address():
+            _LOGGER.debug("%s: Ignoring configuration cache", self._device.name)
+            return
+        self._device.restore_config(
+            data.get("config") or {},
+            firmware_version=data.get("firmware_version"),
+            validated_at=data.get("validated_at"),
+        )
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Save configuration changes and revalidate it periodically."""
+        unsub_config = self._device.subscribe(
+            self._async_schedule_save, keys=CONFIG_KEYS
+        )
+        unsub_timer = async_track_time_interval(
+            self._hass, self._async_revalidate, REVALIDATE_INTERVAL
+        )
+
+        @callback
+        def _async_stop() -> None:
+            unsub_config()
+            unsub_timer()
+
+        return _async_stop
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        return {
+            "address": self._device.get_address(),
+            "firmware_version": self._device.config_firmware,
+            "validated_at": self._device.config_validated_at,
+            "config": self._device.config,
+        }
+
+    async def _async_revalidate(self, _now: datetime) -> None:
+        """Read the configuration of a connected device once it expired."""
+        if not self._device.is_connected or self._device.config_valid:
+            return
+        try:
+            await self._device.async_refresh_config()
+        except Exception as err:  # noqa: BLE001 - retried on the next interval
+            _LOGGER.debug(
+                "%s: Failed to revalidate configuration: %s", self._device.name, err
+            )
+            return
+        self._async_schedule_save()
+
+    async def async_save(self) -> None:
+        """Write the configuration now, e.g. before unloading."""
+        if self._device.config:
+            await self._store.async_save(self._data_to_save())
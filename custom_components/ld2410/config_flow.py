@@ -22,9 +22,25 @@ from homeassistant.const import CONF_ADDRESS, CONF_SENSOR_TYPE, CONF_PASSWORD
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import AbortFlow
 from .const import (
+    CONF_DEADBAND_MAX_AGE,
+    CONF_DISTANCE_DEADBAND,
+    CONF_ENERGY_DEADBAND,
+    CONF_PUBLISH_INTERVAL,
+    CONF_RELATIVE_DEADBAND,
     CONF_RETRY_COUNT,
+    CONF_STARTUP_CONCURRENCY,
+    CONF_STARTUP_PRIORITY,
     CONNECTABLE_MODEL_TYPES,
+    DEFAULT_DEADBAND_MAX_AGE,
+    DEFAULT_DISTANCE_DEADBAND,
+    DEFAULT_ENERGY_DEADBAND,
+    DEFAULT_PUBLISH_INTERVAL,
+    DEFAULT_RELATIVE_DEADBAND,
     DEFAULT_RETRY_COUNT,
+    DEFAULT_STARTUP_CONCURRENCY,
+    DEFAULT_STARTUP_PRIORITY,
+    MAX_PUBLISH_INTERVAL,
+    MAX_STARTUP_PRIORITY,
     DOMAIN,
     SUPPORTED_MODEL_TYPES,
 )
@@ -236,6 +252,48 @@ class LD2410OptionsFlowHandler(OptionsFlow):
                 default=self.config_entry.options.get(
                     CONF_RETRY_COUNT, DEFAULT_RETRY_COUNT
                 ),
-            ): int
+            ): int,
+            vol.Optional(
+                CONF_PUBLISH_INTERVAL,
+                default=self.config_entry.options.get(
+                    CONF_PUBLISH_INTERVAL, DEFAULT_PUBLISH_INTERVAL
+                ),
+            ): vol.All(vol.Coerce(float), vol.Range(min=0, max=MAX_PUBLISH_INTERVAL)),
+            vol.Optional(
+                CONF_ENERGY_DEADBAND,
+                default=self.config_entry.options.get(
+                    CONF_ENERGY_DEADBAND, DEFAULT_ENERGY_DEADBAND
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+            vol.Optional(
+                CONF_DISTANCE_DEADBAND,
+                default=self.config_entry.options.get(
+                    CONF_DISTANCE_DEADBAND, DEFAULT_DISTANCE_DEADBAND
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=1000)),
+            vol.Optional(
+                CONF_RELATIVE_DEADBAND,
+                default=self.config_entry.options.get(
+                    CONF_RELATIVE_DEADBAND, DEFAULT_RELATIVE_DEADBAND
+                ),
+            ): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+            vol.Optional(
+                CONF_DEADBAND_MAX_AGE,
+                default=self.config_entry.options.get(
+                    CONF_DEADBAND_MAX_AGE, DEFAULT_DEADBAND_MAX_AGE
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+            vol.Optional(
+                CONF_STARTUP_CONCURRENCY,
+                default=self.config_entry.options.get(
+                    CONF_STARTUP_CONCURRENCY, DEFAULT_STARTUP_CONCURRENCY
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+            vol.Optional(
+                CONF_STARTUP_PRIORITY,
+                default=self.config_entry.options.get(
+                    CONF_STARTUP_PRIORITY, DEFAULT_STARTUP_PRIORITY
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_STARTUP_PRIORITY)),
         }
         return self.async_show_form(step_id="init", data_schema=vol.Schema(options))
@@ -0,0 +1,68 @@
+"""Connection slots shared by the devices behind one adapter or proxy."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.components import bluetooth
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.singleton import singleton
+
+from .api import ConnectionSlots
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from bleak.backends.device import BLEDevice
+
+DATA_CONNECTION_SLOTS = f"{DOMAIN}_connection_slots"
+
+# Connection slots of an adapter that does not report its allocations,
+# the default of ESPHome bluetooth proxies
+DEFAULT_CONNECTION_SLOTS = 3
+# Seconds between two connections admitted through the same adapter
+CONNECT_STAGGER = 0.5
+
+
+@callback
+@singleton(DATA_CONNECTION_SLOTS)
+def _async_slots_by_source(hass: HomeAssistant) -> dict[str, ConnectionSlots]:
+    return {}
+
+
+def _source(ble_device: BLEDevice) -> str:
+    """Return the adapter or proxy a device is reached through."""
+    details = ble_device.details
+    if isinstance(details, dict) and (source := details.get("source")):
+        return str(source)
+    return "default"
+
+
+def _capacity(hass: HomeAssistant, source: str) -> int:
+    """Return the number of connection slots of ``source``."""
+    try:
+        scanner = bluetooth.async_scanner_by_source(hass, source)
+    except (AttributeError, RuntimeError):  # Bluetooth manager not set up
+        return DEFAULT_CONNECTION_SLOTS
+    if scanner is None:
+        return DEFAULT_CONNECTION_SLOTS
+    get_allocations = getattr(scanner, "get_allocations", None)
+    if get_allocations is None:  # Home Assistant <2024.7
+        return DEFAULT_CONNECTION_SLOTS
+    allocations = get_allocations()
+    if allocations is None or not allocations.slots:
+        return DEFAULT_CONNECTION_SLOTS
+    return allocations.slots
+
+
+@callback
+def async_get_connection_slots(
+    hass: HomeAssistant, ble_device: BLEDevice
+) -> ConnectionSlots:
+    """Return the connection slots of the adapter that reaches ``ble_device``."""
+    slots_by_source = _async_slots_by_source(hass)
+    source = _source(ble_device)
+    if (slots := slots_by_source.get(source)) is None:
+        slots = slots_by_source[source] = ConnectionSlots(
+            source, _capacity(hass, source), CONNECT_STAGGER
+        )
+    return slots
@@ -28,8 +28,46 @@ HASS_SENSOR_TYPE_TO_MODEL = {str(v): k for k, v in CONNECTABLE_MODEL_TYPES.items
 
 # Config Defaults
 DEFAULT_RETRY_COUNT = 3
+# Minimum seconds between state writes of sensors, 0 disables; binary
+# sensors are never delayed
+DEFAULT_PUBLISH_INTERVAL = 0.0
+MAX_PUBLISH_INTERVAL = 60.0
+# Minimum change of energy (points) and distance (cm) sensors to publish,
+# relative minimum change in percent and forced refresh age in seconds
+DEFAULT_ENERGY_DEADBAND = 0
+DEFAULT_DISTANCE_DEADBAND = 0
+DEFAULT_RELATIVE_DEADBAND = 0.0
+DEFAULT_DEADBAND_MAX_AGE = 300
+# Devices connecting at the same time while the integration starts, and
+# the startup priority of a device; higher priorities connect first, then
+# the device with the strongest signal
+DEFAULT_STARTUP_CONCURRENCY = 2
+DEFAULT_STARTUP_PRIORITY = 0
+MAX_STARTUP_PRIORITY = 10
 
 # Config Options
 CONF_RETRY_COUNT = "retry_count"
+CONF_PUBLISH_INTERVAL = "publish_interval"
+CONF_ENERGY_DEADBAND = "energy_deadband"
+CONF_DISTANCE_DEADBAND = "distance_deadband"
+CONF_RELATIVE_DEADBAND = "relative_deadband"
+CONF_DEADBAND_MAX_AGE = "deadband_max_age"
+CONF_STARTUP_CONCURRENCY = "startup_concurrency"
+CONF_STARTUP_PRIORITY = "startup_priority"
 CONF_SAVED_MOVE_SENSITIVITY = "saved_move_gate_sensitivity"
 CONF_SAVED_STILL_SENSITIVITY = "saved_still_gate_sensitivity"
+
+# Options applied to the running device and coordinator, changing any
+# other option reloads the config entry
+LIVE_OPTIONS = frozenset(
+    {
+        CONF_RETRY_COUNT,
+        CONF_PUBLISH_INTERVAL,
+        CONF_ENERGY_DEADBAND,
+        CONF_DISTANCE_DEADBAND,
+        CONF_RELATIVE_DEADBAND,
+        CONF_DEADBAND_MAX_AGE,
+        CONF_SAVED_MOVE_SENSITIVITY,
+        CONF_SAVED_STILL_SENSITIVITY,
+    }
+)
@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from . import api
 from .api import Model
@@ -15,15 +15,36 @@ from homeassistant.components.bluetooth.active_update_coordinator import (
     ActiveBluetoothDataUpdateCoordinator,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import CoreState, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
+
+from .const import (
+    CONF_DEADBAND_MAX_AGE,
+    CONF_DISTANCE_DEADBAND,
+    CONF_ENERGY_DEADBAND,
+    CONF_PUBLISH_INTERVAL,
+    CONF_RELATIVE_DEADBAND,
+    CONF_RETRY_COUNT,
+    DEFAULT_DEADBAND_MAX_AGE,
+    DEFAULT_DISTANCE_DEADBAND,
+    DEFAULT_ENERGY_DEADBAND,
+    DEFAULT_PUBLISH_INTERVAL,
+    DEFAULT_RELATIVE_DEADBAND,
+    DEFAULT_RETRY_COUNT,
+)
+from .dispatcher import async_get_advertisement_dispatcher
+from .helpers import Deadband
 
 if TYPE_CHECKING:
     from bleak.backends.device import BLEDevice
 
+    from .config_cache import ConfigCache
+
 
 _LOGGER = logging.getLogger(__name__)
 
 DEVICE_STARTUP_TIMEOUT = 30
+# Width in dBm of the RSSI ranges that count as the same advertisement
+RSSI_BUCKET = 5
 
 
 class DataCoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
@@ -55,8 +76,77 @@ class DataCoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
         self.device_name = device_name
         self.base_unique_id = base_unique_id
         self.model = model
+        self.options: dict[str, Any] = {}
+        self.config_cache: ConfigCache | None = None
         self._ready_event = asyncio.Event()
         self._was_unavailable = True
+        self._last_raw_advertisement: tuple[Any, ...] | None = None
+
+    @callback
+    def async_set_options(self, options: dict[str, Any]) -> None:
+        """Apply the options of the config entry to the running device.
+
+        Publish intervals and deadbands are read from the options on every
+        update, so they apply from the next update on.
+        """
+        self.options = dict(options)
+        self.device.set_retry_count(
+            self.options.get(CONF_RETRY_COUNT, DEFAULT_RETRY_COUNT)
+        )
+
+    @property
+    def publish_interval(self) -> float:
+        """Return the default minimum seconds between sensor state writes."""
+        return float(self.options.get(CONF_PUBLISH_INTERVAL, DEFAULT_PUBLISH_INTERVAL))
+
+    def deadband(self, sensor_class: str) -> Deadband:
+        """Return the deadband of ``energy`` or ``distance`` sensors."""
+        absolute = (
+            self.options.get(CONF_ENERGY_DEADBAND, DEFAULT_ENERGY_DEADBAND)
+            if sensor_class == "energy"
+            else self.options.get(CONF_DISTANCE_DEADBAND, DEFAULT_DISTANCE_DEADBAND)
+        )
+        return Deadband(
+            absolute=absolute,
+            relative=self.options.get(CONF_RELATIVE_DEADBAND, DEFAULT_RELATIVE_DEADBAND)
+            / 100,
+            max_age=self.options.get(CONF_DEADBAND_MAX_AGE, DEFAULT_DEADBAND_MAX_AGE),
+        )
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Start tracking the device.
+
+        Advertisements are routed here by the advertisement dispatcher of
+        the integration rather than by a Bluetooth callback per device.
+        """
+        unsubs = [
+            async_get_advertisement_dispatcher(self.hass).async_register(self),
+            bluetooth.async_track_unavailable(
+                self.hass,
+                self._async_handle_unavailable,
+                self.address,
+                self.connectable,
+            ),
+        ]
+
+        @callback
+        def _async_stop() -> None:
+            for unsub in unsubs:
+                unsub()
+            # Cancels a pending poll
+            self._async_stop()
+
+        return _async_stop
+
+    @callback
+    def async_handle_advertisement(
+        self,
+        service_info: bluetooth.BluetoothServiceInfoBleak,
+        change: bluetooth.BluetoothChange,
+    ) -> None:
+        """Handle an advertisement of the device routed by the dispatcher."""
+        self._async_handle_bluetooth_event(service_info, change)
 
     @callback
     def _needs_poll(
@@ -99,7 +189,23 @@ class DataCoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
         service_info: bluetooth.BluetoothServiceInfoBleak,
         change: bluetooth.BluetoothChange,
     ) -> None:
-        """Handle a Bluetooth event."""
+        """Handle a Bluetooth event.
+
+        Advertisements repeating the raw data of the previous one from the
+        same source, within the same RSSI range, are dropped before parsing.
+        """
+        raw_advertisement = (
+            service_info.source,
+            service_info.manufacturer_data,
+            service_info.service_data,
+            service_info.rssi // RSSI_BUCKET,
+        )
+        if (
+            raw_advertisement == self._last_raw_advertisement
+            and not self._was_unavailable
+        ):
+            return
+        self._last_raw_advertisement = raw_advertisement
         self.ble_device = service_info.device
         if not (
             adv := api.parse_advertisement_data(
@@ -109,7 +215,10 @@ class DataCoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
             return
         if "modelName" in adv.data:
             self._ready_event.set()
-        _LOGGER.debug("%s: Device data: %s", self.ble_device.address, self.device.data)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s: Device data: %s", self.ble_device.address, self.device.data
+            )
         if not self.device.advertisement_changed(adv) and not self._was_unavailable:
             return
         self._was_unavailable = False
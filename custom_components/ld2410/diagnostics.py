@@ -9,6 +9,7 @@ from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.core import HomeAssistant
 
 from .coordinator import ConfigEntryType
+from .startup import async_get_startup_scheduler
 
 TO_REDACT: list[str] = []
 
@@ -26,4 +27,6 @@ async def async_get_config_entry_diagnostics(
     return {
         "entry": async_redact_data(entry.as_dict(), TO_REDACT),
         "service_info": service_info,
+        "device": coordinator.device.diagnostics,
+        "startup": async_get_startup_scheduler(hass).async_diagnostics(entry.entry_id),
     }
@@ -0,0 +1,125 @@
+"""Dispatch the advertisements of all devices from a single callback."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.components import bluetooth
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.singleton import singleton
+
+from .api.adv_parser import MFR_DATA_ORDER, SERVICE_DATA_ORDER
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .coordinator import DataCoordinator
+
+DATA_ADVERTISEMENT_DISPATCHER = f"{DOMAIN}_advertisement_dispatcher"
+# Local names matched by the Bluetooth matchers of the manifest
+LOCAL_NAMES = ("HLK-LD2410B_*", "HLK-LD2410_*", "HLK-LD2401_*")
+
+
+class AdvertisementDispatcher:
+    """Route advertisements to the coordinator of their device.
+
+    Bluetooth callbacks for the manufacturer IDs of ``MFR_DATA_ORDER``, the
+    service UUIDs of ``SERVICE_DATA_ORDER`` and the ``LOCAL_NAMES`` are
+    registered once for the integration, instead of once per config entry,
+    and advertisements are routed to coordinators by address.
+    Advertisements of devices that are not configured are dropped without
+    parsing.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the dispatcher."""
+        self._hass = hass
+        self._coordinators: dict[str, DataCoordinator] = {}
+        # Last advertisement dispatched per address
+        self._dispatched: dict[str, bluetooth.BluetoothServiceInfoBleak] = {}
+        self._unsubs: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_register(self, coordinator: DataCoordinator) -> CALLBACK_TYPE:
+        """Route the advertisements of a coordinator's device to it.
+
+        Returns a callback that stops routing them.
+        """
+        if not self._unsubs:
+            self._async_start()
+        self._coordinators[coordinator.address] = coordinator
+        self._dispatched.pop(coordinator.address, None)
+        # Bluetooth only replays the last advertisement to new callbacks,
+        # replay it to coordinators registering while dispatching already
+        if service_info := bluetooth.async_last_service_info(
+            self._hass, coordinator.address, coordinator.connectable
+        ):
+            self._async_dispatch(service_info, bluetooth.BluetoothChange.ADVERTISEMENT)
+
+        @callback
+        def _async_unregister() -> None:
+            if self._coordinators.get(coordinator.address) is coordinator:
+                del self._coordinators[coordinator.address]
+                self._dispatched.pop(coordinator.address, None)
+            if not self._coordinators:
+                self._async_stop()
+
+        return _async_unregister
+
+    @callback
+    def _async_start(self) -> None:
+        matchers = [
+            bluetooth.BluetoothCallbackMatcher(
+                manufacturer_id=manufacturer_id, connectable=True
+            )
+            for manufacturer_id in MFR_DATA_ORDER
+        ]
+        for uuid in SERVICE_DATA_ORDER:
+            matchers.append(
+                bluetooth.BluetoothCallbackMatcher(service_uuid=uuid, connectable=True)
+            )
+            matchers.append(
+                bluetooth.BluetoothCallbackMatcher(
+                    service_data_uuid=uuid, connectable=True
+                )
+            )
+        matchers.extend(
+            bluetooth.BluetoothCallbackMatcher(local_name=name, connectable=True)
+            for name in LOCAL_NAMES
+        )
+        for matcher in matchers:
+            self._unsubs.append(
+                bluetooth.async_register_callback(
+                    self._hass,
+                    self._async_dispatch,
+                    matcher,
+                    bluetooth.BluetoothScanningMode.ACTIVE,
+                )
+            )
+
+    @callback
+    def _async_stop(self) -> None:
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs.clear()
+
+    @callback
+    def _async_dispatch(
+        self,
+        service_info: bluetooth.BluetoothServiceInfoBleak,
+        change: bluetooth.BluetoothChange,
+    ) -> None:
+        address = service_info.address
+        if (coordinator := self._coordinators.get(address)) is None:
+            return
+        # Advertisements matching several matchers reach every callback
+        if self._dispatched.get(address) is service_info:
+            return
+        self._dispatched[address] = service_info
+        coordinator.async_handle_advertisement(service_info, change)
+
+
+@callback
+@singleton(DATA_ADVERTISEMENT_DISPATCHER)
+def async_get_advertisement_dispatcher(hass: HomeAssistant) -> AdvertisementDispatcher:
+    """Return the advertisement dispatcher of the integration."""
+    return AdvertisementDispatcher(hass)
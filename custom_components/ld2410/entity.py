@@ -4,18 +4,20 @@ from __future__ import annotations
 
 from collections.abc import Callable, Coroutine, Mapping
 import logging
+import time
 from typing import Any, Concatenate
 
-from .api import Device, OperationError
+from .api import CommandPriority, Device, OperationError, command_priority
 
 from homeassistant.components.bluetooth.passive_update_coordinator import (
     PassiveBluetoothCoordinatorEntity,
 )
 from homeassistant.const import ATTR_CONNECTIONS
-from homeassistant.core import callback
+from homeassistant.core import CALLBACK_TYPE, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.event import async_call_later
 
 from .const import DOMAIN, MANUFACTURER
 from .coordinator import DataCoordinator
@@ -28,12 +30,21 @@ class Entity(PassiveBluetoothCoordinatorEntity[DataCoordinator]):
 
     _device: Device
     _attr_has_entity_name = True
+    # Data keys this entity renders; ``None`` wakes it on every update and an
+    # empty tuple only on connection changes
+    _data_keys: tuple[str, ...] | None = None
+    # Minimum seconds between state writes; ``None`` uses the device default
+    # from the options. Entities publish immediately unless they opt in.
+    _min_publish_interval: float | None = 0.0
 
     def __init__(self, coordinator: DataCoordinator) -> None:
         """Initialize the entity."""
         super().__init__(coordinator)
         self._device = coordinator.device
         self._last_run_success: bool | None = None
+        self._last_publish = -float("inf")
+        self._publish_timer: CALLBACK_TYPE | None = None
+        self._published_fingerprint: tuple[Any, ...] | None = None
         self._address = coordinator.ble_device.address
         self._attr_unique_id = coordinator.base_unique_id
         self._attr_device_info = DeviceInfo(
@@ -54,7 +65,7 @@ class Entity(PassiveBluetoothCoordinatorEntity[DataCoordinator]):
         )
 
     @property
-    def parsed_data(self) -> dict[str, Any]:
+    def parsed_data(self) -> Mapping[str, Any]:
         """Return parsed device data for this entity."""
         return self.coordinator.device.parsed_data
 
@@ -75,9 +86,21 @@ class Entity(PassiveBluetoothCoordinatorEntity[DataCoordinator]):
     def _async_update_attrs(self) -> None:
         """Update the entity attributes."""
 
+    @property
+    def publish_interval(self) -> float:
+        """Return the minimum seconds between state writes."""
+        if self._min_publish_interval is None:
+            return self.coordinator.publish_interval
+        return self._min_publish_interval
+
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Handle data update."""
+        """Handle data update.
+
+        Entities with a publish interval write at most once per interval;
+        updates in between are coalesced into a single trailing write that
+        publishes the latest data. Availability changes are written at once.
+        """
         if not self.enabled:
             return
 
@@ -86,19 +109,92 @@ class Entity(PassiveBluetoothCoordinatorEntity[DataCoordinator]):
         if not self.hass or self.entity_id is None:
             return
 
-        if (current_state := self.hass.states.get(self.entity_id)) is not None:
+        if self._availability_changed():
+            self._async_cancel_publish_timer()
+        elif self._publish_timer is not None:
+            # A trailing write is pending and will pick up this update
+            return
+        elif (interval := self.publish_interval) > 0:
+            delay = self._last_publish + interval - time.monotonic()
+            if delay > 0:
+                self._publish_timer = async_call_later(
+                    self.hass, delay, self._async_publish_trailing
+                )
+                return
+
+        self._async_publish_state()
+
+    @callback
+    def _availability_changed(self) -> bool:
+        """Return if the availability differs from the published state."""
+        published = self._published_fingerprint
+        return published is not None and published[0] != self.available
+
+    @callback
+    def _async_publish_trailing(self, _now: Any) -> None:
+        """Publish updates coalesced during the publish interval."""
+        self._publish_timer = None
+        if self.enabled and self.hass and self.entity_id is not None:
+            self._async_publish_state()
+
+    @callback
+    def _async_cancel_publish_timer(self) -> None:
+        """Drop a pending trailing write."""
+        if self._publish_timer is not None:
+            self._publish_timer()
+            self._publish_timer = None
+
+    @property
+    def _fingerprint_value(self) -> Any:
+        """Return the value compared to detect state changes."""
+        return self.state
+
+    @callback
+    def _async_fingerprint(self) -> tuple[Any, ...]:
+        """Return what identifies the published state of the entity.
+
+        Covers everything that changes at runtime, the remaining attributes
+        are static. Subclasses with dynamic attributes must extend it.
+        """
+        return (self.available, self._fingerprint_value, self._last_run_success)
+
+    @callback
+    def _async_publish_state(self) -> None:
+        """Write the state unless it matches the published one."""
+        fingerprint = self._async_fingerprint()
+        if fingerprint == self._published_fingerprint:
+            return
+        if (
+            self._published_fingerprint is None
+            and (current_state := self.hass.states.get(self.entity_id)) is not None
+        ):
+            # Nothing published by this entity yet, compare with the state
+            # machine once, e.g. for a state written before a reload
             new_state, new_attributes, *_ = self._Entity__async_calculate_state()
             if (
                 new_state == current_state.state
                 and new_attributes == current_state.attributes
             ):
+                self._published_fingerprint = fingerprint
                 return
 
         self.async_write_ha_state()
 
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state and remember its fingerprint."""
+        super().async_write_ha_state()
+        self._published_fingerprint = self._async_fingerprint()
+        self._last_publish = time.monotonic()
+
     async def async_added_to_hass(self) -> None:
         """Register callbacks."""
-        self.async_on_remove(self._device.subscribe(self._handle_coordinator_update))
+        self.async_on_remove(self._async_cancel_publish_timer)
+        self.async_on_remove(
+            self._device.subscribe(
+                self._handle_coordinator_update, keys=self._data_keys
+            )
+        )
         return await super().async_added_to_hass()
 
     async def async_update(self) -> None:
@@ -115,11 +211,14 @@ def exception_handler[_EntityT: Entity, **_P](
     """Decorate device calls to handle exceptions.
 
     A decorator that wraps the passed in function, catching device errors.
+    Commands sent by the function are user actions and run at interactive
+    priority.
     """
 
     async def handler(self: _EntityT, *args: _P.args, **kwargs: _P.kwargs) -> None:
         try:
-            await func(self, *args, **kwargs)
+            with command_priority(CommandPriority.INTERACTIVE):
+                await func(self, *args, **kwargs)
         except OperationError as error:
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
@@ -1,12 +1,47 @@
 """Helper utilities for the LD2410 integration."""
 
 import asyncio
+from dataclasses import dataclass
+from typing import Any
 
 from homeassistant.components import persistent_notification
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.event import async_call_later
 
 
+@dataclass(frozen=True, slots=True)
+class Deadband:
+    """Minimum change of a numeric value that is worth publishing.
+
+    A new value is significant when it moves at least ``absolute`` units and
+    ``relative`` (a fraction) of the last published value away from it.
+    Smaller changes are still published once the last publish is older than
+    ``max_age`` seconds.
+    """
+
+    absolute: float = 0
+    relative: float = 0
+    max_age: float = 0
+
+    def __bool__(self) -> bool:
+        """Return if the deadband filters anything."""
+        return bool(self.absolute or self.relative)
+
+    def is_significant(self, last: Any, value: Any, age: float) -> bool:
+        """Return if ``value`` should replace the published ``last`` value."""
+        if value == last:
+            return False
+        if (
+            not self
+            or age >= self.max_age
+            or not isinstance(last, (int, float))
+            or not isinstance(value, (int, float))
+        ):
+            return True
+        delta = abs(value - last)
+        return delta >= self.absolute and delta >= self.relative * abs(last)
+
+
 async def _async_dismiss(hass: HomeAssistant, notification_id: str) -> None:
     """Dismiss a persistent notification."""
     persistent_notification.async_dismiss(hass, notification_id)
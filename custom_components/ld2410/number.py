@@ -62,6 +62,7 @@ class GateSensitivityNumber(Entity, NumberEntity):
         prefix = "M" if data_key == "move_gate_sensitivity" else "S"
         self._attr_name = f"{prefix}G{gate} Sensitivity"
         self._attr_unique_id = f"{coordinator.base_unique_id}-{data_key}-{gate}"
+        self._data_keys = (f"{data_key}_{gate}",)
 
     @property
     def native_value(self) -> int | None:
@@ -94,6 +95,7 @@ class AbsenceDelayNumber(Entity, NumberEntity):
     _attr_device_class = NumberDeviceClass.DURATION
     _attr_native_unit_of_measurement = UnitOfTime.SECONDS
     _attr_entity_registry_enabled_default = True
+    _data_keys = ("absence_delay",)
 
     def __init__(self, coordinator: DataCoordinator) -> None:
         super().__init__(coordinator)
@@ -119,6 +121,7 @@ class LightSensitivityNumber(Entity, NumberEntity):
     _attr_mode = NumberMode.SLIDER
     _attr_icon = "mdi:brightness-6"
     _attr_translation_key = "light_sensitivity"
+    _data_keys = ("light_threshold",)
 
     def __init__(self, coordinator: DataCoordinator) -> None:
         super().__init__(coordinator)
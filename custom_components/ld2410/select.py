@@ -49,6 +49,7 @@ class ResolutionSelect(Entity, SelectEntity):
     _attr_entity_registry_enabled_default = True
     _attr_icon = "mdi:tape-measure"
     _attr_translation_key = "distance_resolution"
+    _data_keys = ("resolution",)
 
     def __init__(self, coordinator: DataCoordinator) -> None:
         super().__init__(coordinator)
@@ -75,6 +76,7 @@ class LightFunctionSelect(Entity, SelectEntity):
     _attr_entity_registry_enabled_default = True
     _attr_icon = "mdi:lightbulb"
     _attr_translation_key = "light_function"
+    _data_keys = ("light_function",)
 
     def __init__(self, coordinator: DataCoordinator) -> None:
         super().__init__(coordinator)
@@ -101,6 +103,7 @@ class OutLevelSelect(Entity, SelectEntity):
     _attr_entity_registry_enabled_default = True
     _attr_icon = "mdi:electric-switch"
     _attr_translation_key = "out_level"
+    _data_keys = ("light_out_level",)
 
     def __init__(self, coordinator: DataCoordinator) -> None:
         super().__init__(coordinator)
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import time
+from typing import Any
+
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
@@ -14,7 +17,7 @@ from homeassistant.const import (
     EntityCategory,
     UnitOfLength,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 
 try:
     from homeassistant.helpers.entity_platform import (
@@ -30,6 +33,15 @@ from .entity import Entity
 
 PARALLEL_UPDATES = 0
 
+# Deadband applied to jittery measurements, see DataCoordinator.deadband
+DEADBAND_CLASSES: dict[str, str] = {
+    "move_energy": "energy",
+    "still_energy": "energy",
+    "move_distance_cm": "distance",
+    "still_distance_cm": "distance",
+    "detect_distance_cm": "distance",
+}
+
 SENSOR_TYPES: dict[str, SensorEntityDescription] = {
     "rssi": SensorEntityDescription(
         key="rssi",
@@ -141,7 +153,33 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class Sensor(Entity, SensorEntity):
+class BaseSensor(Entity, SensorEntity):
+    """Base of sensors reporting device data."""
+
+    _min_publish_interval = None
+    _deadband_class: str | None = None
+
+    @callback
+    def _async_publish_state(self) -> None:
+        """Skip writes for changes within the deadband of the sensor."""
+        if self._deadband_class is not None and self._published_fingerprint:
+            available, value, *_ = self._published_fingerprint
+            if self.available is available and (
+                (native_value := self.native_value) == value
+                or not self.coordinator.deadband(self._deadband_class).is_significant(
+                    value, native_value, time.monotonic() - self._last_publish
+                )
+            ):
+                return
+        super()._async_publish_state()
+
+    @property
+    def _fingerprint_value(self) -> Any:
+        """Compare the raw value, formatting the state is comparatively slow."""
+        return self.native_value
+
+
+class Sensor(BaseSensor):
     """Representation of a sensor."""
 
     def __init__(
@@ -154,6 +192,8 @@ class Sensor(Entity, SensorEntity):
         self._sensor = sensor
         self._attr_unique_id = f"{coordinator.base_unique_id}-{sensor}"
         self.entity_description = SENSOR_TYPES[sensor]
+        self._data_keys = (self.entity_description.key,)
+        self._deadband_class = DEADBAND_CLASSES.get(self.entity_description.key)
 
     @property
     def native_value(self) -> str | int | None:
@@ -161,9 +201,11 @@ class Sensor(Entity, SensorEntity):
         return self.parsed_data.get(self.entity_description.key)
 
 
-class GateEnergySensor(Entity, SensorEntity):
+class GateEnergySensor(BaseSensor):
     """Representation of a gate energy sensor."""
 
+    _deadband_class = "energy"
+
     def __init__(
         self,
         coordinator: DataCoordinator,
@@ -182,6 +224,7 @@ class GateEnergySensor(Entity, SensorEntity):
             entity_registry_enabled_default=False,
         )
         self._attr_unique_id = f"{coordinator.base_unique_id}-{data_key}-{gate}"
+        self._data_keys = (self.entity_description.key,)
 
     @property
     def native_value(self) -> int | None:
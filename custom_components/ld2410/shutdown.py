@@ -0,0 +1,53 @@
+"""Stop the devices of all config entries when Home Assistant stops."""
+
+from __future__ import annotations
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.singleton import singleton
+
+from . import api
+from .const import DOMAIN
+
+DATA_RUNNING_DEVICES = f"{DOMAIN}_running_devices"
+
+# Seconds to stop all devices before abandoning the ones that did not, so
+# a dead proxy link does not delay Home Assistant from stopping
+SHUTDOWN_TIMEOUT = 10
+
+
+@callback
+@singleton(DATA_RUNNING_DEVICES)
+def _async_running_devices(hass: HomeAssistant) -> dict[str, api.Device]:
+    devices: dict[str, api.Device] = {}
+
+    async def _async_stop(_event: Event) -> None:
+        running = list(devices.values())
+        devices.clear()
+        await api.async_stop_devices(running, SHUTDOWN_TIMEOUT)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop)
+    return devices
+
+
+@callback
+def async_track_device(
+    hass: HomeAssistant, entry_id: str, device: api.Device
+) -> CALLBACK_TYPE:
+    """Stop the device of a config entry when Home Assistant stops.
+
+    Returns a callback that stops tracking it, e.g. when the entry unloads.
+    """
+    devices = _async_running_devices(hass)
+    devices[entry_id] = device
+
+    @callback
+    def _async_untrack() -> None:
+        devices.pop(entry_id, None)
+
+    return _async_untrack
+
+
+async def async_stop_device(device: api.Device) -> None:
+    """Stop the device of an unloading config entry within the timeout."""
+    await api.async_stop_devices([device], SHUTDOWN_TIMEOUT)
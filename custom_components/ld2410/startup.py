@@ -0,0 +1,191 @@
+"""Connect the devices of all config entries when the integration starts."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
+from homeassistant.helpers.singleton import singleton
+
+from . import api
+from .const import DEFAULT_STARTUP_CONCURRENCY, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_STARTUP_SCHEDULER = f"{DOMAIN}_startup_scheduler"
+
+# Seconds to collect the entries set up while Home Assistant starts before
+# the first device connects, so they connect in order
+STARTUP_BATCH_DELAY = 2
+
+
+@dataclass(slots=True)
+class _StartupJob:
+    """Startup connection of the device of a config entry."""
+
+    device: api.Device
+    concurrency: int
+    scheduled_at: float = field(default_factory=time.monotonic)
+    source: str | None = None
+    task: asyncio.Task[None] | None = None
+    unsub_frames: CALLBACK_TYPE | None = None
+
+
+class StartupScheduler:
+    """Connect devices one batch at a time, in order.
+
+    Entries are queued by startup priority, then by the strongest RSSI,
+    and at most ``concurrency`` devices connect and negotiate at the same
+    time through each adapter or proxy, so devices behind a saturated
+    proxy do not hold up the others; the lowest concurrency of all queued
+    entries applies. The time from queueing an entry to the first frame
+    of its device is recorded so startup can be measured.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._jobs: dict[str, _StartupJob] = {}
+        self._queue: list[tuple[int, int, int, str]] = []
+        self._counter = itertools.count()
+        self._running: dict[str, int] = {}
+        self._dispatch_timer: asyncio.TimerHandle | None = None
+        self._time_to_first_frame: dict[str, float] = {}
+
+    @property
+    def concurrency(self) -> int:
+        """Return the number of devices connecting at the same time."""
+        return min(
+            (job.concurrency for job in self._jobs.values()),
+            default=DEFAULT_STARTUP_CONCURRENCY,
+        )
+
+    @callback
+    def async_schedule(
+        self,
+        entry_id: str,
+        device: api.Device,
+        *,
+        rssi: int,
+        priority: int,
+        concurrency: int,
+    ) -> CALLBACK_TYPE:
+        """Queue the startup connection of a config entry's device.
+
+        Returns a callback that cancels it, e.g. when the entry unloads.
+        """
+        self._async_cancel(entry_id)
+        self._time_to_first_frame.pop(entry_id, None)
+        job = self._jobs[entry_id] = _StartupJob(device, concurrency)
+
+        @callback
+        def _async_frame_received() -> None:
+            if device.receiving_frames:
+                self._async_first_frame(entry_id)
+
+        job.unsub_frames = device.subscribe(_async_frame_received)
+        heapq.heappush(self._queue, (-priority, -rssi, next(self._counter), entry_id))
+        if self._hass.state is CoreState.running:
+            self._async_dispatch()
+        elif self._dispatch_timer is None:
+            self._dispatch_timer = self._hass.loop.call_later(
+                STARTUP_BATCH_DELAY, self._async_dispatch
+            )
+        return lambda: self._async_cancel(entry_id)
+
+    @callback
+    def _async_dispatch(self) -> None:
+        """Start connecting queued devices while below the concurrency."""
+        if self._dispatch_timer is not None:
+            self._dispatch_timer.cancel()
+            self._dispatch_timer = None
+        concurrency = self.concurrency
+        deferred: list[tuple[int, int, int, str]] = []
+        while self._queue:
+            item = heapq.heappop(self._queue)
+            entry_id = item[-1]
+            if (job := self._jobs.get(entry_id)) is None or job.task is not None:
+                continue
+            source = _source(job.device)
+            if self._running.get(source, 0) >= concurrency:
+                deferred.append(item)
+                continue
+            job.source = source
+            self._running[source] = self._running.get(source, 0) + 1
+            job.task = self._hass.async_create_task(
+                self._async_connect(job),
+                f"{DOMAIN} startup connection {entry_id}",
+            )
+        for item in deferred:
+            heapq.heappush(self._queue, item)
+
+    async def _async_connect(self, job: _StartupJob) -> None:
+        """Connect a device; failures are retried when it is used."""
+        try:
+            with contextlib.suppress(Exception):
+                await job.device._ensure_connected()
+        finally:
+            self._running[job.source] -= 1
+            _LOGGER.debug(
+                "%s: Startup connection finished after %.1fs",
+                job.device.name,
+                time.monotonic() - job.scheduled_at,
+            )
+            self._async_dispatch()
+
+    @callback
+    def _async_first_frame(self, entry_id: str) -> None:
+        """Record the time to the first frame of an entry's device."""
+        if (job := self._jobs.get(entry_id)) is None or job.unsub_frames is None:
+            return
+        job.unsub_frames()
+        job.unsub_frames = None
+        elapsed = self._time_to_first_frame[entry_id] = (
+            time.monotonic() - job.scheduled_at
+        )
+        _LOGGER.info("%s: First frame %.1fs after startup", job.device.name, elapsed)
+        if all(other.unsub_frames is None for other in self._jobs.values()):
+            _LOGGER.info(
+                "All %s devices streaming after %.1fs",
+                len(self._jobs),
+                max(self._time_to_first_frame.values()),
+            )
+
+    @callback
+    def _async_cancel(self, entry_id: str) -> None:
+        """Stop the startup connection of an entry."""
+        if (job := self._jobs.pop(entry_id, None)) is None:
+            return
+        if job.unsub_frames is not None:
+            job.unsub_frames()
+        if job.task is not None and not job.task.done():
+            job.task.cancel()
+
+    @callback
+    def async_diagnostics(self, entry_id: str) -> dict[str, Any]:
+        """Return the startup statistics of an entry."""
+        elapsed = self._time_to_first_frame.get(entry_id)
+        return {
+            "concurrency": self.concurrency,
+            "time_to_first_frame_s": None if elapsed is None else round(elapsed, 1),
+        }
+
+
+def _source(device: api.Device) -> str:
+    """Return the adapter or proxy the device connects through."""
+    slots = device.connection_slots
+    return "default" if slots is None else slots.source
+
+
+@callback
+@singleton(DATA_STARTUP_SCHEDULER)
+def async_get_startup_scheduler(hass: HomeAssistant) -> StartupScheduler:
+    """Return the startup scheduler of the integration."""
+    return StartupScheduler(hass)
@@ -34,6 +34,7 @@ class NewPasswordText(Entity, TextEntity):
 
     _attr_entity_category = EntityCategory.CONFIG
     _attr_translation_key = "new_password"
+    _data_keys = ()
     _attr_mode = TextMode.TEXT
     _attr_pattern = r"^[ -~]*$"
 
@@ -1,6 +1,7 @@
 from typing import Any
 from collections.abc import Callable, Coroutine
 import inspect
+from fnmatch import fnmatchcase
 
 from aiohttp.test_utils import TestClient
 from bleak import AdvertisementData
@@ -101,22 +102,57 @@ def inject_bluetooth_service_info(
         class _StubBluetoothManager:
             def __init__(self) -> None:
                 self.service_info = {}
-                self._callback = None
+                self._callbacks = []
+
+            @staticmethod
+            def _matches(matcher, service_info: BluetoothServiceInfo) -> bool:
+                if not matcher:
+                    return True
+                if (address := matcher.get("address")) and (
+                    address != service_info.address
+                ):
+                    return False
+                manufacturer_id = matcher.get("manufacturer_id")
+                if (
+                    manufacturer_id is not None
+                    and manufacturer_id not in service_info.manufacturer_data
+                ):
+                    return False
+                if (uuid := matcher.get("service_uuid")) and (
+                    uuid not in service_info.service_uuids
+                ):
+                    return False
+                if (uuid := matcher.get("service_data_uuid")) and (
+                    uuid not in service_info.service_data
+                ):
+                    return False
+                if (local_name := matcher.get("local_name")) and not fnmatchcase(
+                    service_info.name or "", local_name
+                ):
+                    return False
+                return True
 
             def inject(self, service_info: BluetoothServiceInfo) -> None:
                 self.service_info[service_info.address] = service_info
-                if self._callback:
-                    self._callback(service_info, BluetoothChange.ADVERTISEMENT)
+                for callback, matcher in list(self._callbacks):
+                    if self._matches(matcher, service_info):
+                        callback(service_info, BluetoothChange.ADVERTISEMENT)
 
             def async_address_present(self, address: str, connectable: bool) -> bool:
                 return address in self.service_info
 
             def async_register_callback(self, callback, matcher) -> Callable[[], None]:
-                self._callback = callback
-                address = matcher.get("address") if matcher else None
-                if address and address in self.service_info:
-                    callback(self.service_info[address], BluetoothChange.ADVERTISEMENT)
-                return lambda: None
+                registration = (callback, matcher)
+                self._callbacks.append(registration)
+                for service_info in list(self.service_info.values()):
+                    if self._matches(matcher, service_info):
+                        callback(service_info, BluetoothChange.ADVERTISEMENT)
+
+                def _unregister() -> None:
+                    if registration in self._callbacks:
+                        self._callbacks.remove(registration)
+
+                return _unregister
 
             def async_track_unavailable(self, callback, address, connectable):
                 return lambda: None
@@ -124,6 +160,9 @@ def inject_bluetooth_service_info(
             def async_last_service_info(self, address: str, connectable: bool):
                 return self.service_info.get(address)
 
+            def async_scanner_by_source(self, source: str):
+                return None
+
         manager = _StubBluetoothManager()
         set_manager(manager)
 
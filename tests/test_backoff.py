@@ -0,0 +1,48 @@
+"""Tests for the reconnect backoff."""
+
+import random
+
+from custom_components.ld2410.api.backoff import ReconnectBackoff
+
+
+def _backoff(seed: int = 0) -> ReconnectBackoff:
+    return ReconnectBackoff(initial_delay=1, max_delay=60, rng=random.Random(seed))
+
+
+def test_first_retry_is_fast_and_exact() -> None:
+    """The first retry waits the initial delay without jitter."""
+    backoff = _backoff()
+    assert backoff.as_dict() == {"attempts": 0, "delay_s": None}
+    assert backoff.next_delay() == 1
+    assert backoff.as_dict() == {"attempts": 1, "delay_s": 1}
+
+
+def test_delay_grows_with_jitter_up_to_ceiling() -> None:
+    """Further failures double the delay, jittered within its upper half."""
+    backoff = _backoff()
+    backoff.next_delay()
+    for attempt in range(2, 12):
+        ceiling = min(2 ** (attempt - 1), 60)
+        assert ceiling / 2 <= backoff.next_delay() <= ceiling
+    assert backoff.attempts == 11
+
+
+def test_jitter_spreads_devices() -> None:
+    """Devices failing together do not retry in lockstep."""
+    delays = set()
+    for seed in range(5):
+        backoff = _backoff(seed)
+        backoff.next_delay()
+        backoff.next_delay()
+        delays.add(backoff.next_delay())
+    assert len(delays) == 5
+
+
+def test_reset_after_success() -> None:
+    """A successful connection starts over with the fast retry."""
+    backoff = _backoff()
+    for _ in range(5):
+        backoff.next_delay()
+    backoff.reset()
+    assert backoff.as_dict() == {"attempts": 0, "delay_s": None}
+    assert backoff.next_delay() == 1
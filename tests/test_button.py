@@ -65,6 +65,13 @@ async def test_auto_sensitivities_button(hass: HomeAssistant) -> None:
             "custom_components.ld2410.api.devices.device.Device.get_basic_info",
             AsyncMock(return_value={}),
         ),
+        patch(
+            "custom_components.ld2410.api.LD2410.cmd_enable_config",
+            AsyncMock(return_value=(1, 64)),
+        ) as enable_mock,
+        patch(
+            "custom_components.ld2410.api.LD2410.cmd_end_config", AsyncMock()
+        ) as end_mock,
         patch(
             "custom_components.ld2410.api.LD2410.cmd_auto_thresholds", AsyncMock()
         ) as auto_mock,
@@ -105,6 +112,9 @@ async def test_auto_sensitivities_button(hass: HomeAssistant) -> None:
         sleep_mock.assert_has_awaits([call(10)], any_order=True)
         query_mock.assert_awaited_once()
         read_mock.assert_awaited_once()
+        # No session is held while polling, the commands open their own
+        enable_mock.assert_not_awaited()
+        end_mock.assert_not_awaited()
         call_later_mock.assert_called_once()
         assert call_later_mock.call_args[0][1] == 10
         dismiss = call_later_mock.call_args[0][2]
@@ -216,7 +226,7 @@ async def test_save_and_load_sensitivities_buttons(hass: HomeAssistant) -> None:
 
     with (
         patch(
-            "custom_components.ld2410.api.LD2410.cmd_set_gate_sensitivity",
+            "custom_components.ld2410.api.LD2410.cmd_set_gate_sensitivities",
             AsyncMock(),
         ) as set_mock,
         patch("custom_components.ld2410.helpers.async_call_later") as call_later_mock,
@@ -229,7 +239,7 @@ async def test_save_and_load_sensitivities_buttons(hass: HomeAssistant) -> None:
         )
         await hass.async_block_till_done()
 
-    set_mock.assert_has_awaits([call(g, 50, 60) for g in range(9)], any_order=False)
+    set_mock.assert_awaited_once_with(new_move, new_still)
     call_later_mock.assert_called_once()
     assert call_later_mock.call_args_list[0][0][1] == 10
     dismiss = call_later_mock.call_args_list[0][0][2]
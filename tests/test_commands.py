@@ -0,0 +1,74 @@
+"""Tests for the binary command table."""
+
+import pytest
+
+from custom_components.ld2410.api.commands import (
+    FRAMED_COMMANDS,
+    MAX_FRAME_SIZE,
+    Command,
+    CommandFramer,
+    ack_word,
+    frame_command,
+)
+from custom_components.ld2410.api.const import (
+    CMD_BT_GET_PERMISSION,
+    CMD_ENABLE_CFG,
+    CMD_END_CFG,
+    CMD_READ_PARAMS,
+    CMD_SET_SENSITIVITY,
+)
+
+
+def test_command_words_and_acks() -> None:
+    """Command words keep their wire form and ACK word."""
+    assert Command.END_CFG == CMD_END_CFG
+    assert Command.END_CFG.word == bytes.fromhex("fe00")
+    assert Command.END_CFG.ack == bytes.fromhex("fe01")
+    assert Command.ENABLE_CFG.ack == bytes.fromhex("ff01")
+    assert Command.BT_GET_PERMISSION.ack == bytes.fromhex("a801")
+
+
+@pytest.mark.parametrize(
+    ("raw_command", "expected"),
+    [
+        (CMD_READ_PARAMS, "6101"),
+        (CMD_BT_GET_PERMISSION + "48694c696e6b", "a801"),
+        ("ff000100", "ff01"),
+        ("1234", "1235"),
+    ],
+)
+def test_ack_word(raw_command: str, expected: str) -> None:
+    """ACK words are looked up for known commands and derived otherwise."""
+    assert ack_word(raw_command) == bytes.fromhex(expected)
+
+
+def test_framed_commands_are_cached() -> None:
+    """Argument-less commands return the same precomputed frame."""
+    framer = CommandFramer()
+    frame = framer.frame(CMD_END_CFG)
+    assert frame.hex() == "fdfcfbfa0200fe0004030201"
+    assert frame is FRAMED_COMMANDS[CMD_END_CFG]
+    assert framer.frame(CMD_ENABLE_CFG + "0001") is framer.frame(
+        CMD_ENABLE_CFG + "0001"
+    )
+
+
+def test_framer_reuses_buffer_without_leaking() -> None:
+    """Frames built in the shared buffer do not change afterwards."""
+    framer = CommandFramer()
+    long_command = (
+        CMD_SET_SENSITIVITY + "0000" + "03000000" + "0100" + "28000000" + "0200"
+    ) + "28000000"
+    first = framer.frame(long_command)
+    second = framer.frame(CMD_BT_GET_PERMISSION + "48694c696e6b")
+    assert len(first) == MAX_FRAME_SIZE
+    assert first == frame_command(bytes.fromhex(long_command))
+    assert second.hex() == "fdfcfbfa0800a80048694c696e6b04030201"
+
+
+def test_framer_handles_oversized_commands() -> None:
+    """Commands larger than the buffer are framed separately."""
+    raw_command = "1234" + "00" * MAX_FRAME_SIZE
+    assert CommandFramer().frame(raw_command) == frame_command(
+        bytes.fromhex(raw_command)
+    )
@@ -1,15 +1,33 @@
+import asyncio
+import time
+
 from bleak.backends.device import BLEDevice
 import pytest
-from unittest.mock import AsyncMock, patch
-
-from custom_components.ld2410.api.devices.device import OperationError
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from custom_components.ld2410.api.devices.device import (
+    MAX_CONSECUTIVE_TIMEOUTS,
+    CommandPriority,
+    ConnectionState,
+    OperationError,
+    _CommandSlots,
+    command_priority,
+)
 from custom_components.ld2410.api.devices.ld2410 import (
+    CONFIG_MAX_AGE,
     LD2410,
+    _frame_payload,
     _password_to_words,
-    _unwrap_frame,
 )
+from custom_components.ld2410.api.commands import (
+    TX_FOOTER_BYTES,
+    TX_HEADER_BYTES,
+    CommandFramer,
+)
+from custom_components.ld2410.api.reassembler import FrameReassembler
 
 from custom_components.ld2410.api.const import (
+    ALL_GATES,
     CMD_BT_GET_PERMISSION,
     CMD_ENABLE_CFG,
     CMD_END_CFG,
@@ -23,6 +41,7 @@ from custom_components.ld2410.api.const import (
     CMD_SET_RES,
     CMD_GET_RES,
     CMD_GET_AUX,
+    CMD_SET_AUX,
     PAR_MAX_MOVE_GATE,
     PAR_MAX_STILL_GATE,
     PAR_NOBODY_DURATION,
@@ -326,6 +345,70 @@ async def test_set_gate_sensitivity_fail() -> None:
     ]
 
 
+@pytest.mark.asyncio
+async def test_set_gate_sensitivities_writes_changed_gates() -> None:
+    """Only gates that differ from the cache are written, in one session."""
+    dev = _TestDevice(
+        password=None, response=[b"\x00\x00\x01\x00\x00@"] + [b"\x00\x00"] * 3
+    )
+    dev._update_parsed_data(
+        {
+            "move_gate_sensitivity": [50] * 9,
+            "still_gate_sensitivity": [60] * 9,
+        }
+    )
+    move = [50] * 9
+    still = [60] * 9
+    move[2] = 15
+    still[7] = 40
+    await dev.cmd_set_gate_sensitivities(move, still)
+    assert dev.raw_commands == [
+        CMD_ENABLE_CFG + "0001",
+        CMD_SET_SENSITIVITY + "00000200000001000f00000002003c000000",
+        CMD_SET_SENSITIVITY + "000007000000010032000000020028000000",
+        CMD_END_CFG,
+    ]
+    assert dev.parsed_data["move_gate_sensitivity"] == move
+    assert dev.parsed_data["still_gate_sensitivity"] == still
+
+
+@pytest.mark.asyncio
+async def test_set_gate_sensitivities_uses_all_gates() -> None:
+    """Equal values for every gate are written with a single command."""
+    dev = _TestDevice(
+        password=None, response=[b"\x00\x00\x01\x00\x00@"] + [b"\x00\x00"] * 2
+    )
+    dev._update_parsed_data(
+        {
+            "move_gate_sensitivity": list(range(9)),
+            "still_gate_sensitivity": list(range(9)),
+        }
+    )
+    await dev.cmd_set_gate_sensitivities([50] * 9, [60] * 9)
+    assert dev.raw_commands == [
+        CMD_ENABLE_CFG + "0001",
+        CMD_SET_SENSITIVITY + "0000" + ALL_GATES + "0000010032000000" + "02003c000000",
+        CMD_END_CFG,
+    ]
+    assert dev.parsed_data["move_gate_sensitivity"] == [50] * 9
+
+
+@pytest.mark.asyncio
+async def test_set_gate_sensitivities_skips_unchanged() -> None:
+    """Nothing is sent when the cache already holds the values."""
+    dev = _TestDevice(password=None)
+    dev._update_parsed_data(
+        {
+            "move_gate_sensitivity": [50] * 9,
+            "still_gate_sensitivity": [60] * 9,
+        }
+    )
+    await dev.cmd_set_gate_sensitivities([50] * 9, [60] * 9)
+    assert dev.raw_commands == []
+    with pytest.raises(ValueError):
+        await dev.cmd_set_gate_sensitivities([50] * 8, [60] * 8)
+
+
 @pytest.mark.asyncio
 async def test_read_params_success() -> None:
     """Read parameters command parses response."""
@@ -371,22 +454,16 @@ async def test_read_params_fail() -> None:
 
 @pytest.mark.asyncio
 async def test_on_connect_reads_params() -> None:
-    """_on_connect reads parameters and stores them."""
+    """_on_connect reads parameters and stores them in one session."""
     resp = [
         b"\x00\x00\x01\x00\x00@",
         b"\x00\x00",
-        b"\x00\x00",
-        b"\x00\x00\x01\x00\x00@",
         b"\x00\x00"
         + bytes.fromhex("aa080507")
         + b"\x01" * 9
         + b"\x02" * 9
         + b"\x1e\x00",
-        b"\x00\x00",
-        b"\x00\x00\x01\x00\x00@",
         b"\x00\x00\x00\x00",
-        b"\x00\x00",
-        b"\x00\x00\x01\x00\x00@",
         b"\x00\x00\x01\x64\x00\x00",
         b"\x00\x00",
     ]
@@ -395,14 +472,8 @@ async def test_on_connect_reads_params() -> None:
     assert dev.raw_commands == [
         CMD_ENABLE_CFG + "0001",
         CMD_ENABLE_ENGINEERING,
-        CMD_END_CFG,
-        CMD_ENABLE_CFG + "0001",
         CMD_READ_PARAMS,
-        CMD_END_CFG,
-        CMD_ENABLE_CFG + "0001",
         CMD_GET_RES,
-        CMD_END_CFG,
-        CMD_ENABLE_CFG + "0001",
         CMD_GET_AUX,
         CMD_END_CFG,
     ]
@@ -415,6 +486,139 @@ async def test_on_connect_reads_params() -> None:
     assert dev.parsed_data["light_out_level"] == 0
 
 
+_ON_CONNECT_RESPONSES = [
+    b"\x00\x00\x01\x00\x00@",
+    b"\x00\x00",
+    b"\x00\x00" + bytes.fromhex("aa080507") + b"\x01" * 9 + b"\x02" * 9 + b"\x1e\x00",
+    b"\x00\x00\x00\x00",
+    b"\x00\x00\x01\x64\x00\x00",
+    b"\x00\x00",
+]
+
+
+@pytest.mark.asyncio
+async def test_on_connect_skips_reads_with_valid_config() -> None:
+    """A restored configuration replaces the reads while it is valid."""
+    dev = _TestDevice(
+        password=None,
+        response=[_ON_CONNECT_RESPONSES[0], b"\x00\x00", b"\x00\x00"],
+    )
+    callback = MagicMock()
+    dev.subscribe(callback, keys=["absence_delay"])
+    dev.restore_config(
+        {"absence_delay": 30, "resolution": 1, "unknown": 1},
+        firmware_version=None,
+        validated_at=time.time(),
+    )
+    callback.assert_called_once()
+    assert dev.config == {"absence_delay": 30, "resolution": 1}
+    assert dev.config_valid
+    await dev._on_connect()
+    assert dev.raw_commands == [
+        CMD_ENABLE_CFG + "0001",
+        CMD_ENABLE_ENGINEERING,
+        CMD_END_CFG,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_on_connect_reads_expired_config() -> None:
+    """An expired configuration is read again."""
+    dev = _TestDevice(password=None, response=list(_ON_CONNECT_RESPONSES))
+    dev.restore_config(
+        {"absence_delay": 10},
+        firmware_version=None,
+        validated_at=time.time() - CONFIG_MAX_AGE,
+    )
+    assert not dev.config_valid
+    await dev._on_connect()
+    assert CMD_READ_PARAMS in dev.raw_commands
+    assert dev.parsed_data["absence_delay"] == 30
+    assert dev.config_valid
+    assert dev.config_validated_at is not None
+
+
+def test_config_invalid_after_firmware_change() -> None:
+    """A configuration read from other firmware is not trusted."""
+    dev = _TestDevice(password=None)
+    dev.restore_config(
+        {"absence_delay": 10}, firmware_version="1.2.3", validated_at=time.time()
+    )
+    assert dev.config_firmware == "1.2.3"
+    assert dev.config_valid
+    dev._update_parsed_data({"firmware_version": "2.0.0"})
+    assert not dev.config_valid
+    dev._update_parsed_data({"firmware_version": "1.2.3"})
+    dev.invalidate_config()
+    assert not dev.config_valid
+    assert dev.config_validated_at is None
+
+
+@pytest.mark.asyncio
+async def test_config_session_batches_commands() -> None:
+    """Commands inside a session share one enable/end pair."""
+    dev = _TestDevice(
+        password=None,
+        response=[
+            b"\x00\x00\x01\x00\x00@",
+            b"\x00\x00",
+            b"\x00\x00\x01\x00",
+            b"\x00\x00",
+        ],
+    )
+    async with dev.config_session():
+        await dev.cmd_enable_engineering_mode()
+        assert await dev.cmd_get_resolution() == 1
+    assert dev.raw_commands == [
+        CMD_ENABLE_CFG + "0001",
+        CMD_ENABLE_ENGINEERING,
+        CMD_GET_RES,
+        CMD_END_CFG,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_config_session_not_ended_on_failure() -> None:
+    """A failing command leaves the session without ending it."""
+    dev = _TestDevice(
+        password=None,
+        response=[b"\x00\x00\x01\x00\x00@", b"\x01\x00"],
+    )
+    with pytest.raises(OperationError):
+        async with dev.config_session():
+            await dev.cmd_enable_engineering_mode()
+            await dev.cmd_get_resolution()
+    assert dev.raw_commands == [CMD_ENABLE_CFG + "0001", CMD_ENABLE_ENGINEERING]
+    assert dev._config_owner is None
+
+    # The next session starts over with a new enable
+    dev._response = [b"\x00\x00\x01\x00\x00@", b"\x00\x00", b"\x00\x00"]
+    dev.raw_commands.clear()
+    await dev.cmd_enable_engineering_mode()
+    assert dev.raw_commands == [
+        CMD_ENABLE_CFG + "0001",
+        CMD_ENABLE_ENGINEERING,
+        CMD_END_CFG,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_config_session_reboot_skips_end() -> None:
+    """Rebooting ends configuration mode, no end command is sent."""
+    dev = _TestDevice(
+        password=None,
+        response=[b"\x00\x00\x01\x00\x00@", b"\x00\x00", b"\x00\x00"],
+    )
+    async with dev.config_session():
+        await dev.cmd_enable_engineering_mode()
+        await dev.cmd_reboot()
+    assert dev.raw_commands == [
+        CMD_ENABLE_CFG + "0001",
+        CMD_ENABLE_ENGINEERING,
+        CMD_REBOOT,
+    ]
+
+
 @pytest.mark.asyncio
 async def test_set_absence_delay_success() -> None:
     """Set absence delay command sends correct key."""
@@ -550,9 +754,15 @@ async def test_reboot_success() -> None:
 
 
 def test_unwrap_response():
-    """Ensure responses are unwrapped correctly."""
+    """Ensure framed messages are cut and unwrapped correctly."""
     raw = bytes.fromhex("fdfcfbfa0400ff00010004030201")
-    assert _unwrap_frame(raw, TX_HEADER, TX_FOOTER) == bytes.fromhex("ff000100")
+    assert CommandFramer().frame("ff000100") == raw
+    reassembler = FrameReassembler([(TX_HEADER_BYTES, TX_FOOTER_BYTES)])
+    assert reassembler.feed(raw[:5]) == []
+    assert reassembler.feed(raw[5:]) == [raw]
+    assert _frame_payload(raw, TX_HEADER_BYTES, TX_FOOTER_BYTES) == bytes.fromhex(
+        "ff000100"
+    )
 
 
 def test_parse_response():
@@ -569,3 +779,355 @@ def test_parse_response_rejects_short_payload(payload_hex: str) -> None:
     dev = _TestDevice(password=None)
     with pytest.raises(OperationError):
         dev._parse_response(CMD_BT_GET_PERMISSION, raw)
+
+
+def _connected_device(max_outstanding: int = 3) -> tuple[LD2410, list[bytes]]:
+    """Return a device with a fake connection recording its writes."""
+    dev = LD2410(
+        device=BLEDevice(address="AA:BB", name="test", details=None, rssi=-60),
+        password=None,
+    )
+    dev._command_slots = _CommandSlots(max_outstanding)
+    writes: list[bytes] = []
+
+    async def write_gatt_char(_char, data, _response) -> None:
+        writes.append(data)
+
+    dev._client = MagicMock(is_connected=True, write_gatt_char=write_gatt_char)
+    dev._read_char = MagicMock()
+    dev._write_char = MagicMock()
+    dev._ensure_connected = AsyncMock()
+    return dev, writes
+
+
+def _ack(command: str, value: str = "0000") -> bytes:
+    word = (int(command, 16) ^ 0x0001).to_bytes(2, "big").hex()
+    payload = bytes.fromhex(word + value)
+    return (
+        bytes.fromhex(TX_HEADER)
+        + len(payload).to_bytes(2, "little")
+        + payload
+        + bytes.fromhex(TX_FOOTER)
+    )
+
+
+@pytest.mark.asyncio
+async def test_pipelined_commands_match_acks_by_command_word() -> None:
+    """Outstanding commands are resolved by their ACK word in any order."""
+    dev, writes = _connected_device()
+    first = asyncio.create_task(dev._send_command(CMD_GET_RES))
+    second = asyncio.create_task(dev._send_command(CMD_GET_AUX))
+    await asyncio.sleep(0)
+    assert len(writes) == 2
+
+    dev._handle_notification(bytearray(_ack(CMD_GET_AUX, "00000100")))
+    dev._handle_notification(bytearray(_ack(CMD_GET_RES, "00000000")))
+
+    assert await first == bytes.fromhex("00000000")
+    assert await second == bytes.fromhex("00000100")
+    assert set(dev.diagnostics["command_rtt_ms"]) == {CMD_GET_RES, CMD_GET_AUX}
+    assert not dev._pending_commands
+
+
+@pytest.mark.asyncio
+async def test_outstanding_commands_are_bounded() -> None:
+    """Writes beyond the outstanding limit wait for a response."""
+    dev, writes = _connected_device(max_outstanding=1)
+    first = asyncio.create_task(dev._send_command(CMD_GET_RES))
+    second = asyncio.create_task(dev._send_command(CMD_GET_AUX))
+    await asyncio.sleep(0)
+    assert writes == [dev._modify_command(CMD_GET_RES)]
+
+    dev._handle_notification(bytearray(_ack(CMD_GET_RES)))
+    await first
+    await asyncio.sleep(0)
+    assert len(writes) == 2
+    dev._handle_notification(bytearray(_ack(CMD_GET_AUX)))
+    await second
+
+
+@pytest.mark.asyncio
+async def test_stray_ack_is_dropped() -> None:
+    """ACKs without an outstanding command are counted and ignored."""
+    dev, _ = _connected_device()
+    task = asyncio.create_task(dev._send_command(CMD_GET_RES))
+    await asyncio.sleep(0)
+
+    dev._handle_notification(bytearray(_ack(CMD_READ_PARAMS)))
+    assert not task.done()
+    assert dev.diagnostics["stray_responses"] == 1
+
+    dev._handle_notification(bytearray(_ack(CMD_GET_RES)))
+    assert await task == bytes.fromhex("0000")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reads_are_merged() -> None:
+    """A read already in flight is shared instead of sent again."""
+    dev = _TestDevice(password=None)
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def read() -> int:
+        started.set()
+        await release.wait()
+        return 1
+
+    dev._read_resolution = read
+    first = asyncio.create_task(dev.cmd_get_resolution())
+    await started.wait()
+    second = asyncio.create_task(dev.cmd_get_resolution())
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await first == await second == 1
+    assert dev.diagnostics["merged_reads"] == 1
+    assert not dev._shared_reads
+
+
+def _acking_device() -> tuple[LD2410, list[str]]:
+    """Return a disconnected device whose fake connection acks every command.
+
+    The command words written are recorded.
+    """
+    dev = LD2410(
+        device=BLEDevice(address="AA:BB", name="test", details=None, rssi=-60),
+        password=None,
+    )
+    values = {
+        CMD_ENABLE_CFG: "000001004000",
+        CMD_READ_PARAMS: "0000aa080507" + "01" * 9 + "02" * 9 + "1e00",
+        CMD_GET_RES: "00000000",
+        CMD_GET_AUX: "000001640000",
+    }
+    writes: list[str] = []
+
+    async def write_gatt_char(_char, data, _response) -> None:
+        word = data[6:8].hex().upper()
+        writes.append(word)
+        ack = _ack(word, values.get(word, "0000"))
+        dev.loop.call_soon(dev._handle_notification, bytearray(ack))
+
+    async def connect() -> bool:
+        if dev._client is not None:
+            return False
+        dev._client = MagicMock(is_connected=True, write_gatt_char=write_gatt_char)
+        dev._read_char = MagicMock()
+        dev._write_char = MagicMock()
+        await dev._on_connect()
+        return True
+
+    dev._ensure_connected = connect
+    return dev, writes
+
+
+@pytest.mark.asyncio
+async def test_read_connecting_with_expired_config_does_not_deadlock() -> None:
+    """Reads of the connection setup do not wait for the read connecting."""
+    dev, _ = _acking_device()
+    assert not dev.config_valid
+
+    async with asyncio.timeout(1):
+        params = await dev.cmd_read_params()
+
+    assert params["absence_delay"] == 30
+    assert dev.config_valid
+    assert not dev._shared_reads
+    assert dev._config_owner is None
+
+
+@pytest.mark.asyncio
+async def test_interactive_commands_preempt_background() -> None:
+    """Waiting interactive sessions are entered before background ones."""
+    dev, writes = _acking_device()
+    await dev._ensure_connected()
+    writes.clear()
+
+    running = asyncio.create_task(dev.cmd_read_params())
+    background = asyncio.create_task(dev.cmd_get_resolution())
+    with command_priority(CommandPriority.INTERACTIVE):
+        interactive = asyncio.create_task(dev.cmd_set_light_config(mode=1))
+    async with asyncio.timeout(1):
+        await asyncio.gather(running, background, interactive)
+
+    assert writes == [
+        CMD_ENABLE_CFG,
+        CMD_READ_PARAMS,
+        CMD_END_CFG,
+        CMD_ENABLE_CFG,
+        CMD_SET_AUX,
+        CMD_END_CFG,
+        CMD_ENABLE_CFG,
+        CMD_GET_RES,
+        CMD_END_CFG,
+    ]
+    assert set(dev.diagnostics["queue_wait_ms"]) == {"interactive", "background"}
+
+
+@pytest.mark.asyncio
+async def test_timeout_follows_measured_rtt() -> None:
+    """The response timeout adapts to measured RTTs."""
+    dev, _ = _connected_device()
+    dev._rtt.sample(0.01)
+    assert dev._rtt.timeout == 1
+    srtt = dev._rtt.srtt
+
+    task = asyncio.create_task(
+        dev._execute_command_locked(CMD_GET_RES, dev._modify_command(CMD_GET_RES), True)
+    )
+    await asyncio.sleep(0)
+    dev._handle_notification(bytearray(_ack(CMD_GET_RES)))
+    await task
+    assert dev._rtt.srtt != srtt
+    assert dev.diagnostics["rtt"]["timeout_ms"] == 1000
+
+
+@pytest.mark.asyncio
+async def test_late_response_after_timeout_is_not_sampled() -> None:
+    """A response to a retried command does not update the estimate."""
+    dev, _ = _connected_device()
+    dev._rtt.min_timeout = 0.01
+    dev._rtt.sample(0.001)
+    with pytest.raises(asyncio.TimeoutError):
+        await dev._execute_command_locked(
+            CMD_GET_RES, dev._modify_command(CMD_GET_RES), True
+        )
+    assert dev._rtt.timeout == pytest.approx(0.02)
+    srtt = dev._rtt.srtt
+
+    task = asyncio.create_task(
+        dev._execute_command_locked(CMD_GET_RES, dev._modify_command(CMD_GET_RES), True)
+    )
+    await asyncio.sleep(0)
+    dev._handle_notification(bytearray(_ack(CMD_GET_RES)))
+    await task
+    assert dev._rtt.srtt == srtt
+
+
+@pytest.mark.asyncio
+async def test_timed_out_commands_are_tracked_by_command_word() -> None:
+    """Retries with other values match, and disconnects forget timeouts."""
+    dev, _ = _connected_device()
+    dev._rtt.min_timeout = 0.01
+    dev._rtt.sample(0.001)
+    with pytest.raises(asyncio.TimeoutError):
+        await dev._execute_command_locked(
+            CMD_SET_RES + "0000", dev._modify_command(CMD_SET_RES + "0000"), True
+        )
+    srtt = dev._rtt.srtt
+
+    task = asyncio.create_task(
+        dev._execute_command_locked(
+            CMD_SET_RES + "0100", dev._modify_command(CMD_SET_RES + "0100"), True
+        )
+    )
+    await asyncio.sleep(0)
+    dev._handle_notification(bytearray(_ack(CMD_SET_RES)))
+    await task
+    assert dev._rtt.srtt == srtt
+    assert not dev._timed_out_commands
+
+    with pytest.raises(asyncio.TimeoutError):
+        await dev._execute_command_locked(
+            CMD_SET_RES + "0000", dev._modify_command(CMD_SET_RES + "0000"), True
+        )
+    dev._on_disconnect(None)
+    assert not dev._timed_out_commands
+
+
+@pytest.mark.asyncio
+async def test_timeout_retries_on_live_connection() -> None:
+    """A timed-out command is retried without reconnecting."""
+    dev, _ = _connected_device()
+    dev._execute_command_locked = AsyncMock(
+        side_effect=[asyncio.TimeoutError, b"\x00\x00"]
+    )
+    dev._execute_forced_disconnect = AsyncMock()
+
+    assert await dev._send_command(CMD_GET_RES, retry=1) == b"\x00\x00"
+    dev._execute_forced_disconnect.assert_not_awaited()
+    assert dev.diagnostics["command_errors"] == {
+        "timeout": 1,
+        "transient": 0,
+        "disconnect": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_consecutive_timeouts_disconnect() -> None:
+    """Too many timeouts in a row force a new connection."""
+    dev, _ = _connected_device()
+    dev._execute_command_locked = AsyncMock(
+        side_effect=[asyncio.TimeoutError] * MAX_CONSECUTIVE_TIMEOUTS + [b"\x00\x00"]
+    )
+    dev._execute_forced_disconnect = AsyncMock()
+
+    assert (
+        await dev._send_command(CMD_GET_RES, retry=MAX_CONSECUTIVE_TIMEOUTS)
+        == b"\x00\x00"
+    )
+    dev._execute_forced_disconnect.assert_awaited_once()
+    assert dev.diagnostics["command_errors"] == {
+        "timeout": MAX_CONSECUTIVE_TIMEOUTS - 1,
+        "transient": 0,
+        "disconnect": 1,
+    }
+    assert dev._classify_error(TimeoutError()) == "timeout"
+
+
+@pytest.mark.asyncio
+async def test_consecutive_timeouts_reset_per_connection() -> None:
+    """Timeouts of an earlier connection do not count against the next one."""
+    dev, _ = _connected_device()
+    dev._execute_command_locked = AsyncMock(side_effect=asyncio.TimeoutError)
+    with pytest.raises(asyncio.TimeoutError):
+        await dev._send_command(CMD_GET_RES, retry=0)
+    assert dev._consecutive_timeouts == 1
+
+    dev._should_reconnect = False
+    dev._on_disconnect(None)
+    assert dev._consecutive_timeouts == 0
+
+    dev._consecutive_timeouts = 1
+    del dev._ensure_connected
+    dev._client = None
+    dev._resolve_characteristics = MagicMock()
+    dev._start_notify = AsyncMock()
+    dev._on_connect = AsyncMock()
+    with patch(
+        "custom_components.ld2410.api.devices.device.establish_connection",
+        AsyncMock(return_value=MagicMock(is_connected=True)),
+    ):
+        assert await dev._ensure_connected() is True
+    assert dev._consecutive_timeouts == 0
+    dev._set_state(ConnectionState.IDLE)
+
+
+@pytest.mark.asyncio
+async def test_transport_error_disconnects() -> None:
+    """Transport failures still force a new connection."""
+    dev, _ = _connected_device()
+    dev._execute_command_locked = AsyncMock(side_effect=EOFError)
+    dev._execute_forced_disconnect = AsyncMock()
+
+    with pytest.raises(EOFError):
+        await dev._send_command(CMD_GET_RES, retry=0)
+    dev._execute_forced_disconnect.assert_awaited_once()
+    assert dev.diagnostics["command_errors"]["disconnect"] == 1
+
+
+@pytest.mark.asyncio
+async def test_repeated_timeouts_disconnect() -> None:
+    """A connection that keeps timing out is torn down."""
+    dev, _ = _connected_device()
+    dev._execute_command_locked = AsyncMock(side_effect=asyncio.TimeoutError)
+    dev._execute_forced_disconnect = AsyncMock()
+
+    with pytest.raises(asyncio.TimeoutError):
+        await dev._send_command(CMD_GET_RES, retry=2)
+    dev._execute_forced_disconnect.assert_awaited_once()
+    assert dev.diagnostics["command_errors"] == {
+        "timeout": 2,
+        "transient": 0,
+        "disconnect": 1,
+    }
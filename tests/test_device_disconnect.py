@@ -3,6 +3,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from bleak.backends.device import BLEDevice
+from bleak.exc import BleakError
 from homeassistant.const import (
     CONF_ADDRESS,
     CONF_NAME,
@@ -11,8 +12,14 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant
 
-from custom_components.ld2410.api.devices.device import OperationError
+from custom_components.ld2410.api.devices.device import (
+    DISCONNECT_DELAY,
+    ConnectionState,
+    OperationError,
+)
 from custom_components.ld2410.api.devices.ld2410 import LD2410
+from custom_components.ld2410.api.shutdown import async_stop_devices
+from custom_components.ld2410.api.slots import ConnectionSlots
 from custom_components.ld2410.const import DOMAIN
 
 from . import LD2410b_SERVICE_INFO
@@ -160,31 +167,339 @@ async def test_reconnect_after_timed_disconnect():
 
 
 @pytest.mark.asyncio
-async def test_restart_connection_waits_before_retry():
-    """Reconnect waits a second before scheduling a retry."""
+async def test_connection_state_transitions() -> None:
+    """Connecting, negotiating and disconnecting pass through their states."""
+    device = LD2410(
+        device=BLEDevice(address="AA:BB", name="test", details=None, rssi=-60),
+        password="HiLink",
+    )
+    dummy_client = AsyncMock()
+    dummy_client.is_connected = True
+    device._resolve_characteristics = MagicMock()
+    device._start_notify = AsyncMock()
+    device._reset_disconnect_timer = MagicMock()
+    device._on_connect = AsyncMock()
+    transitions: list[tuple[ConnectionState, ConnectionState]] = []
+    unsub = device.subscribe_state(lambda old, new: transitions.append((old, new)))
+
+    with patch(
+        "custom_components.ld2410.api.devices.device.establish_connection",
+        AsyncMock(return_value=dummy_client),
+    ):
+        assert await device._ensure_connected() is True
+    assert device.state is ConnectionState.STREAMING
+    device._should_reconnect = False
+    await device.async_disconnect()
+    unsub()
+
+    assert transitions == [
+        (ConnectionState.IDLE, ConnectionState.CONNECTING),
+        (ConnectionState.CONNECTING, ConnectionState.NEGOTIATING),
+        (ConnectionState.NEGOTIATING, ConnectionState.STREAMING),
+        (ConnectionState.STREAMING, ConnectionState.DISCONNECTING),
+        (ConnectionState.DISCONNECTING, ConnectionState.IDLE),
+    ]
+    assert device.state_durations.keys() == {
+        "idle",
+        "connecting",
+        "negotiating",
+        "streaming",
+        "disconnecting",
+    }
+    assert device.diagnostics["connection"]["state"] == "idle"
+
+
+@pytest.mark.asyncio
+async def test_connection_holds_adapter_slot() -> None:
+    """A connection holds a slot of its adapter until it disconnects."""
     device = LD2410(
         device=BLEDevice(address="AA:BB", name="test", details=None, rssi=-60),
         password="HiLink",
     )
-    device._on_connect = AsyncMock(side_effect=Exception("fail"))
+    slots = ConnectionSlots("proxy", slots=1, stagger=0)
+    device.set_connection_slots(lambda _ble_device: slots)
+    dummy_client = AsyncMock()
+    dummy_client.is_connected = True
+    device._resolve_characteristics = MagicMock()
+    device._start_notify = AsyncMock()
+    device._on_connect = AsyncMock()
+    device._should_reconnect = False
+
     with patch(
-        "custom_components.ld2410.api.devices.device.asyncio.sleep",
-        new=AsyncMock(),
-    ) as mock_sleep:
+        "custom_components.ld2410.api.devices.device.establish_connection",
+        AsyncMock(return_value=dummy_client),
+    ):
+        await device._ensure_connected()
+    assert device.diagnostics["connection_slots"]["in_use"] == 1
+
+    await device.async_disconnect()
+    assert slots.as_dict()["in_use"] == 0
+
+    with (
+        patch(
+            "custom_components.ld2410.api.devices.device.establish_connection",
+            AsyncMock(side_effect=BleakError("fail")),
+        ),
+        pytest.raises(BleakError),
+    ):
+        await device._ensure_connected()
+    assert slots.as_dict()["in_use"] == 0
+
+
+@pytest.mark.asyncio
+async def test_connection_slots_follow_the_advertising_proxy() -> None:
+    """Each connection takes a slot of the proxy the device is reached by."""
+    device = LD2410(
+        device=BLEDevice(
+            address="AA:BB", name="test", details={"source": "a"}, rssi=-60
+        ),
+        password="HiLink",
+    )
+    slots_by_source = {
+        source: ConnectionSlots(source, slots=1, stagger=0) for source in "ab"
+    }
+    device.set_connection_slots(
+        lambda ble_device: slots_by_source[ble_device.details["source"]]
+    )
+    dummy_client = AsyncMock()
+    dummy_client.is_connected = True
+    device._resolve_characteristics = MagicMock()
+    device._start_notify = AsyncMock()
+    device._on_connect = AsyncMock()
+    device._should_reconnect = False
+
+    with patch(
+        "custom_components.ld2410.api.devices.device.establish_connection",
+        AsyncMock(return_value=dummy_client),
+    ):
+        await device._ensure_connected()
+        # Advertisements through another proxy do not move the connection
+        device._device = BLEDevice(
+            address="AA:BB", name="test", details={"source": "b"}, rssi=-60
+        )
+        assert device.diagnostics["connection_slots"]["source"] == "a"
+
+        await device.async_disconnect()
+        await device._ensure_connected()
+
+    assert slots_by_source["a"].as_dict()["in_use"] == 0
+    assert slots_by_source["b"].as_dict()["in_use"] == 1
+    assert device.diagnostics["connection_slots"]["source"] == "b"
+
+
+@pytest.mark.asyncio
+async def test_failed_connect_returns_to_idle() -> None:
+    """A failed connection attempt leaves the connecting state."""
+    device = LD2410(
+        device=BLEDevice(address="AA:BB", name="test", details=None, rssi=-60),
+        password="HiLink",
+    )
+    with (
+        patch(
+            "custom_components.ld2410.api.devices.device.establish_connection",
+            AsyncMock(side_effect=BleakError("fail")),
+        ),
+        pytest.raises(BleakError),
+    ):
+        await device._ensure_connected()
+    assert device.state is ConnectionState.IDLE
+
+
+@pytest.mark.asyncio
+async def test_disconnect_schedules_single_reconnect() -> None:
+    """The disconnect callback and the disconnect path share one reconnect."""
+    device = LD2410(
+        device=BLEDevice(address="AA:BB", name="test", details=None, rssi=-60),
+        password="HiLink",
+    )
+    device._should_reconnect = True
+    device._restart_connection = AsyncMock()
+    client = AsyncMock()
+    client.disconnect = AsyncMock(side_effect=lambda: device._on_disconnect(client))
+    device._client = client
+
+    await device._execute_disconnect()
+
+    assert device._transition_task is not None
+    await asyncio.sleep(0)
+    device._restart_connection.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_async_stop_cancels_reconnect() -> None:
+    """Stopping cancels reconnects and disconnects the device."""
+    device = LD2410(
+        device=BLEDevice(address="AA:BB", name="test", details=None, rssi=-60),
+        password="HiLink",
+    )
+    device._should_reconnect = True
+    device._ensure_connected = AsyncMock(side_effect=BleakError("fail"))
+    device._reconnect_backoff.initial_delay = 3600
+    device.async_disconnect = AsyncMock()
+    device._schedule_reconnect()
+    await asyncio.sleep(0)
+    assert device.state is ConnectionState.BACKOFF
+    timer = device._state_timer
+    assert timer is not None
 
-        def _close(coro):
-            coro.close()
+    await device.async_stop()
 
-        with patch.object(device.loop, "create_task", side_effect=_close) as mock_task:
-            await device._restart_connection()
+    assert timer.cancelled()
+    assert device._state_timer is None
+    assert device._transition_task is None
+    assert not device._should_reconnect
+    device.async_disconnect.assert_awaited_once()
+    assert device.state is ConnectionState.IDLE
 
-    mock_sleep.assert_awaited_once_with(1)
+
+@pytest.mark.asyncio
+async def test_stop_devices_abandons_hung_device() -> None:
+    """Devices that do not stop before the deadline are abandoned."""
+    stopping = LD2410(
+        device=BLEDevice(address="AA:BB", name="HLK-LD2410", details=None, rssi=-60),
+        password="HiLink",
+    )
+    stopping.async_disconnect = AsyncMock()
+    hung = LD2410(
+        device=BLEDevice(address="CC:DD", name="HLK-LD2410", details=None, rssi=-60),
+        password="HiLink",
+    )
+    client = AsyncMock()
+
+    async def _stop_notify(_char: object) -> None:
+        await asyncio.Event().wait()
+
+    client.stop_notify = _stop_notify
+    hung._client = client
+    hung._read_char = object()
+    hung._set_state(ConnectionState.STREAMING)
+
+    durations = await async_stop_devices([stopping, hung], timeout=0.05)
+
+    assert durations[stopping.get_address()] is not None
+    assert durations[stopping.get_address()] < 0.05
+    assert durations[hung.get_address()] is None
+    stopping.async_disconnect.assert_awaited_once()
+    client.disconnect.assert_not_awaited()
+    assert hung._client is None
+    assert hung.state is ConnectionState.IDLE
+    assert not hung._should_reconnect
+
+
+@pytest.mark.asyncio
+async def test_disconnect_timer_rearms_lazily() -> None:
+    """Activity moves the deadline without rescheduling the timer."""
+    device = LD2410(
+        device=BLEDevice(address="AA:BB", name="test", details=None, rssi=-60),
+        password="HiLink",
+    )
+    device._execute_timed_disconnect = AsyncMock()
+    device._set_state(ConnectionState.STREAMING)
+    timer = device._state_timer
+    assert timer is not None
+    device._notification_handler(0, bytearray(b"\x00"))
+    assert device._state_timer is timer
+
+    # Fired early because of later activity: re-arm for the remaining time
+    device._disconnect_from_timer()
+    assert device._state_timer is not None
+    assert device._state_timer is not timer
+    assert device._transition_task is None
+    assert device._state_timer.when() == pytest.approx(
+        device._last_activity + DISCONNECT_DELAY
+    )
+
+    # Fired at the deadline: disconnect
+    device._cancel_state_timer()
+    device._last_activity -= DISCONNECT_DELAY
+    device._disconnect_from_timer()
+    assert device._state_timer is None
+    assert device._transition_task is not None
+    await device._transition_task
+    device._execute_timed_disconnect.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_leaving_a_state_cancels_its_timer() -> None:
+    """Only the current state has a timed transition armed."""
+    device = LD2410(
+        device=BLEDevice(address="AA:BB", name="test", details=None, rssi=-60),
+        password="HiLink",
+    )
+    assert device._state_timer is None
+    device._set_state(ConnectionState.STREAMING)
+    idle_timer = device._state_timer
+    assert idle_timer is not None
+
+    device._set_state(ConnectionState.DISCONNECTING)
+    assert idle_timer.cancelled()
+    assert device._state_timer is None
+
+    device._reconnect_backoff.next_delay()
+    device._set_state(ConnectionState.BACKOFF)
+    backoff_timer = device._state_timer
+    assert backoff_timer is not None
+
+    device._set_state(ConnectionState.CONNECTING)
+    assert backoff_timer.cancelled()
+    assert device._state_timer is None
+
+
+@pytest.mark.asyncio
+async def test_restart_connection_waits_before_retry():
+    """Reconnect waits a second in backoff before scheduling a retry."""
+    device = LD2410(
+        device=BLEDevice(address="AA:BB", name="test", details=None, rssi=-60),
+        password="HiLink",
+    )
+    device._ensure_connected = AsyncMock(side_effect=Exception("fail"))
+    await device._restart_connection()
+
+    assert device.state is ConnectionState.BACKOFF
+    timer = device._state_timer
+    assert timer is not None
+    assert timer.when() - device.loop.time() == pytest.approx(1, abs=0.1)
+
+    def _close(coro):
+        coro.close()
+
+    timer.cancel()
+    with patch.object(device.loop, "create_task", side_effect=_close) as mock_task:
+        device._reconnect_from_timer()
     assert mock_task.call_count == 1
+    assert device._state_timer is None
 
 
 @pytest.mark.asyncio
-async def test_restart_connection_cancels_previous_task() -> None:
-    """Starting a new restart cancels any previous scheduled task."""
+async def test_restart_connection_backs_off_and_resets() -> None:
+    """Repeated failures back off exponentially until a connection succeeds."""
+    device = LD2410(
+        device=BLEDevice(address="AA:BB", name="test", details=None, rssi=-60),
+        password="HiLink",
+    )
+    device._ensure_connected = AsyncMock(side_effect=Exception("fail"))
+    delays = []
+    for _ in range(4):
+        await device._restart_connection()
+        delays.append(device._reconnect_backoff.delay)
+        # The next attempt leaves backoff like a real connection attempt
+        device._set_state(ConnectionState.CONNECTING)
+
+    assert delays[0] == 1
+    assert 1 <= delays[1] <= 2
+    assert 2 <= delays[2] <= 4
+    assert 4 <= delays[3] <= 8
+    assert device.diagnostics["reconnect"]["attempts"] == 4
+
+    device._ensure_connected = AsyncMock(return_value=True)
+    await device._restart_connection()
+    assert device.diagnostics["reconnect"] == {"attempts": 0, "delay_s": None}
+    device._set_state(ConnectionState.IDLE)
+
+
+@pytest.mark.asyncio
+async def test_schedule_reconnect_keeps_a_single_task() -> None:
+    """A running reconnect or a backoff wait is not scheduled twice."""
     device = LD2410(
         device=BLEDevice(address="AA:BB", name="test", details=None, rssi=-60),
         password="HiLink",
@@ -195,18 +510,21 @@ async def test_restart_connection_cancels_previous_task() -> None:
         return True
 
     device._ensure_connected = AsyncMock(side_effect=slow_connect)
-    device._on_connect = AsyncMock()
 
-    first = device.loop.create_task(device._restart_connection())
-    device._restart_connection_tasks.append(first)
+    device._schedule_reconnect()
+    first = device._transition_task
     await asyncio.sleep(0)
-    second = device.loop.create_task(device._restart_connection())
-    device._restart_connection_tasks.append(second)
-    await asyncio.sleep(0.2)
+    device._schedule_reconnect()
+    assert device._transition_task is first
+    await first
 
-    assert first.cancelled()
-    assert second.done()
-    assert device._restart_connection_tasks == []
+    # Waiting in backoff, the backoff timer reconnects
+    device._reconnect_backoff.next_delay()
+    device._set_state(ConnectionState.BACKOFF)
+    device._schedule_reconnect()
+    assert device._transition_task is first
+    device._ensure_connected.assert_awaited_once()
+    device._set_state(ConnectionState.IDLE)
 
 
 @pytest.mark.asyncio
@@ -229,13 +547,13 @@ async def test_restart_connection_cancelled_does_not_reschedule() -> None:
         device.loop, "create_task", wraps=orig_create_task
     ) as mock_create_task:
         task = device.loop.create_task(device._restart_connection())
-        device._restart_connection_tasks.append(task)
+        device._transition_task = task
         await asyncio.sleep(0)
         task.cancel()
         with pytest.raises(asyncio.CancelledError):
             await task
         await asyncio.sleep(0)
-    assert device._restart_connection_tasks == []
+    assert device._state_timer is None
     assert mock_create_task.call_count == 1
 
 
@@ -294,14 +612,20 @@ async def test_disconnect_error_triggers_restart() -> None:
     device._client.disconnect = AsyncMock(side_effect=Exception)
     device._should_reconnect = True
     mock_task = MagicMock()
+
+    def _create_task(coro):
+        # The reconnect never runs, close it to avoid a never awaited warning
+        coro.close()
+        return mock_task
+
     with patch.object(
-        device.loop, "create_task", MagicMock(return_value=mock_task)
+        device.loop, "create_task", MagicMock(side_effect=_create_task)
     ) as mock_create_task:
         with pytest.raises(Exception):
             async with device._connect_lock:
                 await device._execute_disconnect_with_lock()
     assert mock_create_task.call_count == 1
-    assert mock_task in device._restart_connection_tasks
+    assert device._transition_task is mock_task
 
 
 @pytest.mark.asyncio
@@ -441,15 +765,14 @@ async def test_unload_cancels_restart_task(hass: HomeAssistant) -> None:
             raise
 
     device._restart_connection = fake_restart
-    task = device.loop.create_task(device._restart_connection())
-    device._restart_connection_tasks.append(task)
+    device._transition_task = device.loop.create_task(device._restart_connection())
     await asyncio.sleep(0)
 
     await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
 
     assert restart_cancelled.is_set()
-    assert device._restart_connection_tasks == []
+    assert device._transition_task is None
 
 
 @pytest.mark.asyncio
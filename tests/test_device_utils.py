@@ -11,7 +11,7 @@ from custom_components.ld2410.api.devices.device import (
     _handle_timeout,
     _merge_data,
 )
-from custom_components.ld2410.api.devices.ld2410 import LD2410, _unwrap_frame
+from custom_components.ld2410.api.devices.ld2410 import LD2410, _frame_payload
 from custom_components.ld2410.api.const import CMD_BT_GET_PERMISSION
 from custom_components.ld2410.api.models import Advertisement
 
@@ -32,10 +32,10 @@ async def test_handle_timeout_sets_exception() -> None:
         await fut
 
 
-def test_unwrap_frame_returns_input_if_no_markers() -> None:
-    """_unwrap_frame returns data when header/footer missing."""
+def test_frame_payload_returns_input_if_no_markers() -> None:
+    """_frame_payload returns data when header/footer missing."""
     data = bytes.fromhex("00112233")
-    assert _unwrap_frame(data, "fdfc", "0403") == data
+    assert _frame_payload(data, b"\xfd\xfc", b"\x04\x03") == data
 
 
 def test_base_parse_response_returns_raw() -> None:
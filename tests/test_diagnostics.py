@@ -75,5 +75,12 @@ async def test_diagnostics(
         hass, hass_client, mock_config_entry
     )
     assert result == snapshot(
-        exclude=props("created_at", "modified_at", "entry_id", "time", "subentry_id")
+        exclude=props(
+            "created_at",
+            "modified_at",
+            "entry_id",
+            "time",
+            "subentry_id",
+            "connection",
+        )
     )
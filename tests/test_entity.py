@@ -7,6 +7,9 @@ from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from homeassistant.components.bluetooth.passive_update_coordinator import (
+    PassiveBluetoothCoordinatorEntity,
+)
 from homeassistant.core import HomeAssistant
 
 from custom_components.ld2410.number import LightSensitivityNumber
@@ -118,3 +121,89 @@ async def test_handle_update_writes_state_on_change(
         await hass.async_block_till_done()
 
     mock_write.assert_called_once()
+
+
+async def test_handle_update_coalesces_within_publish_interval(
+    hass: HomeAssistant, entity: LightSensitivityNumber, coordinator: SimpleNamespace
+) -> None:
+    """Updates within the publish interval become one trailing write."""
+
+    entity._min_publish_interval = 5.0
+
+    with (
+        patch(
+            "custom_components.ld2410.entity.async_call_later",
+            return_value=MagicMock(),
+        ) as call_later,
+        patch.object(
+            PassiveBluetoothCoordinatorEntity, "async_write_ha_state"
+        ) as mock_write,
+    ):
+        entity._handle_coordinator_update()
+        mock_write.assert_called_once()
+        call_later.assert_not_called()
+
+        for value in (11, 12, 13):
+            coordinator.device.parsed_data = {"light_threshold": value}
+            entity._handle_coordinator_update()
+
+        mock_write.assert_called_once()
+        call_later.assert_called_once()
+        assert 0 < call_later.call_args.args[1] <= 5.0
+
+        call_later.call_args.args[2](None)
+        assert mock_write.call_count == 2
+        assert entity._publish_timer is None
+
+
+async def test_handle_update_publishes_availability_at_once(
+    hass: HomeAssistant, entity: LightSensitivityNumber, coordinator: SimpleNamespace
+) -> None:
+    """Availability changes skip the publish interval."""
+
+    entity._min_publish_interval = 5.0
+    timer = MagicMock()
+
+    with (
+        patch(
+            "custom_components.ld2410.entity.async_call_later",
+            return_value=timer,
+        ) as call_later,
+        patch.object(
+            PassiveBluetoothCoordinatorEntity, "async_write_ha_state"
+        ) as mock_write,
+    ):
+        entity._handle_coordinator_update()
+        coordinator.device.parsed_data = {"light_threshold": 11}
+        entity._handle_coordinator_update()
+        call_later.assert_called_once()
+        assert mock_write.call_count == 1
+
+        coordinator.device.is_reconnecting = True
+        entity._handle_coordinator_update()
+
+        timer.assert_called_once()
+        assert entity._publish_timer is None
+        assert mock_write.call_count == 2
+        assert entity._published_fingerprint[0] is False
+
+
+async def test_handle_update_skips_unchanged_fingerprint(
+    hass: HomeAssistant, entity: LightSensitivityNumber, coordinator: SimpleNamespace
+) -> None:
+    """Once published, unchanged data never builds the full state."""
+
+    with patch.object(
+        PassiveBluetoothCoordinatorEntity, "async_write_ha_state"
+    ) as mock_write:
+        entity._handle_coordinator_update()
+        mock_write.assert_called_once()
+
+        with patch.object(entity, "_Entity__async_calculate_state") as calculate:
+            entity._handle_coordinator_update()
+            calculate.assert_not_called()
+        mock_write.assert_called_once()
+
+        coordinator.device.parsed_data = {"light_threshold": 42}
+        entity._handle_coordinator_update()
+        assert mock_write.call_count == 2
@@ -1,6 +1,8 @@
 from unittest.mock import patch
 
-from custom_components.ld2410.helpers import async_ephemeral_notification
+import pytest
+
+from custom_components.ld2410.helpers import Deadband, async_ephemeral_notification
 
 
 async def test_async_ephemeral_notification_dismisses(hass):
@@ -21,3 +23,24 @@ async def test_async_ephemeral_notification_dismisses(hass):
 
     mock_create.assert_called_once()
     mock_dismiss.assert_called_once_with(hass, "notif")
+
+
+@pytest.mark.parametrize(
+    ("deadband", "last", "value", "age", "expected"),
+    [
+        (Deadband(), 10, 11, 0, True),
+        (Deadband(absolute=3, max_age=60), 10, 12, 0, False),
+        (Deadband(absolute=3, max_age=60), 10, 13, 0, True),
+        (Deadband(absolute=3, max_age=60), 10, 7, 0, True),
+        (Deadband(absolute=3, max_age=60), 10, 12, 60, True),
+        (Deadband(absolute=3, max_age=60), 10, 10, 60, False),
+        (Deadband(relative=0.1, max_age=60), 200, 215, 0, False),
+        (Deadband(relative=0.1, max_age=60), 200, 220, 0, True),
+        (Deadband(absolute=3, relative=0.1, max_age=60), 10, 12, 0, False),
+        (Deadband(absolute=3, max_age=60), None, 12, 0, True),
+        (Deadband(absolute=3, max_age=60), 12, None, 0, True),
+    ],
+)
+def test_deadband_is_significant(deadband, last, value, age, expected):
+    """Only changes leaving the deadband or older than max age are significant."""
+    assert deadband.is_significant(last, value, age) is expected
@@ -1,20 +1,29 @@
 """Test the integration init."""
 
 from collections.abc import Callable
+import time
+from typing import Any
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from homeassistant.components.bluetooth import (
+    BluetoothChange,
+    BluetoothServiceInfoBleak,
+)
 from homeassistant.const import (
     CONF_ADDRESS,
     CONF_NAME,
     CONF_PASSWORD,
     CONF_SENSOR_TYPE,
+    EVENT_HOMEASSISTANT_STOP,
 )
 from homeassistant.core import HomeAssistant
 
 from . import (
+    LD2410b_2_SERVICE_INFO,
     LD2410b_SERVICE_INFO,
+    generate_advertisement_data,
     patch_async_ble_device_from_address,
 )
 
@@ -28,7 +37,14 @@ try:
 except ImportError:
     from .mocks import inject_bluetooth_service_info
 
-from custom_components.ld2410.const import DOMAIN
+from custom_components.ld2410 import api
+from custom_components.ld2410.const import (
+    CONF_PUBLISH_INTERVAL,
+    CONF_RETRY_COUNT,
+    CONF_STARTUP_PRIORITY,
+    DEFAULT_RETRY_COUNT,
+    DOMAIN,
+)
 
 
 @pytest.mark.parametrize(
@@ -245,3 +261,336 @@ async def test_unload_disconnects_device(hass: HomeAssistant) -> None:
 
     mock_client.stop_notify.assert_awaited_once_with(mock_char)
     mock_client.disconnect.assert_awaited_once()
+
+
+async def test_setup_restores_cached_config(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_entry_factory: Callable[[str], MockConfigEntry],
+) -> None:
+    """The stored configuration is published before the device connects."""
+    inject_bluetooth_service_info(hass, LD2410b_SERVICE_INFO)
+
+    entry = mock_entry_factory("ld2410")
+    entry.add_to_hass(hass)
+    hass_storage[f"{DOMAIN}.{entry.entry_id}.config"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.{entry.entry_id}.config",
+        "data": {
+            "address": "AA:BB:CC:DD:EE:FF",
+            "firmware_version": "2.44.24073110",
+            "validated_at": time.time(),
+            "config": {"absence_delay": 15, "resolution": 1},
+        },
+    }
+
+    with (
+        patch("custom_components.ld2410.api.close_stale_connections_by_address"),
+        patch(
+            "custom_components.ld2410.api.devices.device.BaseDevice._ensure_connected",
+            AsyncMock(),
+        ),
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    device = entry.runtime_data.device
+    assert device.parsed_data["absence_delay"] == 15
+    assert device.parsed_data["resolution"] == 1
+    assert device.config_firmware == "2.44.24073110"
+
+
+async def test_options_apply_without_reload(hass: HomeAssistant) -> None:
+    """Ensure live options apply to the running device without a reload."""
+    inject_bluetooth_service_info(hass, LD2410b_SERVICE_INFO)
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_ADDRESS: "AA:BB:CC:DD:EE:FF",
+            CONF_NAME: "test-name",
+            CONF_SENSOR_TYPE: "ld2410",
+        },
+        unique_id="aabbccddeeff",
+    )
+    entry.add_to_hass(hass)
+
+    with (
+        patch("custom_components.ld2410.api.close_stale_connections_by_address"),
+        patch(
+            "custom_components.ld2410.api.devices.device.BaseDevice._ensure_connected",
+            AsyncMock(),
+        ),
+        patch("custom_components.ld2410.api.LD2410._on_connect", AsyncMock()),
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data
+    assert coordinator.device._retry_count == DEFAULT_RETRY_COUNT
+
+    with patch.object(hass.config_entries, "async_reload", AsyncMock()) as reload:
+        hass.config_entries.async_update_entry(
+            entry,
+            options={
+                **entry.options,
+                CONF_RETRY_COUNT: 7,
+                CONF_PUBLISH_INTERVAL: 2.0,
+            },
+        )
+        await hass.async_block_till_done()
+
+    reload.assert_not_called()
+    assert coordinator.device._retry_count == 7
+    assert coordinator.publish_interval == 2.0
+
+    # Startup options are only read when the device is queued for startup
+    with patch.object(hass.config_entries, "async_reload", AsyncMock()) as reload:
+        hass.config_entries.async_update_entry(
+            entry, options={**entry.options, CONF_STARTUP_PRIORITY: 5}
+        )
+        await hass.async_block_till_done()
+
+    reload.assert_called_once_with(entry.entry_id)
+
+
+async def test_stop_event_stops_devices(hass: HomeAssistant) -> None:
+    """Ensure stopping Home Assistant stops the devices of all entries."""
+    inject_bluetooth_service_info(hass, LD2410b_SERVICE_INFO)
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_ADDRESS: "AA:BB:CC:DD:EE:FF",
+            CONF_NAME: "test-name",
+            CONF_SENSOR_TYPE: "ld2410",
+        },
+        unique_id="aabbccddeeff",
+    )
+    entry.add_to_hass(hass)
+
+    with (
+        patch("custom_components.ld2410.api.close_stale_connections_by_address"),
+        patch(
+            "custom_components.ld2410.api.devices.device.BaseDevice._ensure_connected",
+            AsyncMock(),
+        ),
+        patch("custom_components.ld2410.api.LD2410._on_connect", AsyncMock()),
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    with patch(
+        "custom_components.ld2410.api.LD2410.async_stop", AsyncMock()
+    ) as stop_mock:
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+        await hass.async_block_till_done()
+
+    stop_mock.assert_awaited_once()
+
+
+async def test_repeated_advertisements_skip_parsing(hass: HomeAssistant) -> None:
+    """Ensure advertisements repeating the previous one are not parsed."""
+    inject_bluetooth_service_info(hass, LD2410b_SERVICE_INFO)
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_ADDRESS: "AA:BB:CC:DD:EE:FF",
+            CONF_NAME: "test-name",
+            CONF_SENSOR_TYPE: "ld2410",
+        },
+        unique_id="aabbccddeeff",
+    )
+    entry.add_to_hass(hass)
+
+    with (
+        patch("custom_components.ld2410.api.close_stale_connections_by_address"),
+        patch(
+            "custom_components.ld2410.api.devices.device.BaseDevice._ensure_connected",
+            AsyncMock(),
+        ),
+        patch("custom_components.ld2410.api.LD2410._on_connect", AsyncMock()),
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data
+    coordinator._was_unavailable = False
+    coordinator._last_raw_advertisement = None
+    with patch(
+        "custom_components.ld2410.api.parse_advertisement_data",
+        wraps=api.parse_advertisement_data,
+    ) as parse_mock:
+        for _ in range(3):
+            coordinator._async_handle_bluetooth_event(
+                LD2410b_SERVICE_INFO, BluetoothChange.ADVERTISEMENT
+            )
+
+    assert parse_mock.call_count == 1
+
+
+async def test_advertisements_dispatched_by_address(hass: HomeAssistant) -> None:
+    """Ensure advertisements reach the coordinator of their device once."""
+    inject_bluetooth_service_info(hass, LD2410b_SERVICE_INFO)
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_ADDRESS: "AA:BB:CC:DD:EE:FF",
+            CONF_NAME: "test-name",
+            CONF_SENSOR_TYPE: "ld2410",
+        },
+        unique_id="aabbccddeeff",
+    )
+    entry.add_to_hass(hass)
+
+    with (
+        patch("custom_components.ld2410.api.close_stale_connections_by_address"),
+        patch(
+            "custom_components.ld2410.api.devices.device.BaseDevice._ensure_connected",
+            AsyncMock(),
+        ),
+        patch("custom_components.ld2410.api.LD2410._on_connect", AsyncMock()),
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data
+    advertised = dict(LD2410b_SERVICE_INFO.manufacturer_data)
+    with patch.object(coordinator, "async_handle_advertisement") as handle_mock:
+        # Advertisement of another device
+        inject_bluetooth_service_info(hass, LD2410b_2_SERVICE_INFO)
+        # Advertisements with both manufacturer IDs, then the second only
+        for manufacturer_data in (
+            {**advertised, 1494: b"\x08\x01JLAISDK"},
+            {1494: b"\x08\x02JLAISDK"},
+        ):
+            inject_bluetooth_service_info(
+                hass,
+                BluetoothServiceInfoBleak(
+                    name=LD2410b_SERVICE_INFO.name,
+                    address=LD2410b_SERVICE_INFO.address,
+                    rssi=-60,
+                    manufacturer_data=manufacturer_data,
+                    service_data={},
+                    service_uuids=LD2410b_SERVICE_INFO.service_uuids,
+                    source="local",
+                    device=LD2410b_SERVICE_INFO.device,
+                    advertisement=generate_advertisement_data(
+                        local_name=LD2410b_SERVICE_INFO.name,
+                        manufacturer_data=manufacturer_data,
+                        service_uuids=LD2410b_SERVICE_INFO.service_uuids,
+                        rssi=-60,
+                    ),
+                    time=0,
+                    connectable=True,
+                    tx_power=-127,
+                ),
+            )
+        await hass.async_block_till_done()
+
+    assert handle_mock.call_count == 2
+    assert {call.args[0].address for call in handle_mock.call_args_list} == {
+        LD2410b_SERVICE_INFO.address
+    }
+
+
+async def test_advertisements_without_manufacturer_data_dispatched(
+    hass: HomeAssistant,
+) -> None:
+    """Ensure advertisements without manufacturer data are routed."""
+    inject_bluetooth_service_info(hass, LD2410b_SERVICE_INFO)
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_ADDRESS: "AA:BB:CC:DD:EE:FF",
+            CONF_NAME: "test-name",
+            CONF_SENSOR_TYPE: "ld2410",
+        },
+        unique_id="aabbccddeeff",
+    )
+    entry.add_to_hass(hass)
+
+    with (
+        patch("custom_components.ld2410.api.close_stale_connections_by_address"),
+        patch(
+            "custom_components.ld2410.api.devices.device.BaseDevice._ensure_connected",
+            AsyncMock(),
+        ),
+        patch("custom_components.ld2410.api.LD2410._on_connect", AsyncMock()),
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data
+    uuid = "0000af30-0000-1000-8000-00805f9b34fb"
+    with patch.object(coordinator, "async_handle_advertisement") as handle_mock:
+        for service_uuids, service_data in (
+            ([uuid], {}),
+            ([], {uuid: b"\x01"}),
+            ([uuid], {uuid: b"\x02"}),
+            # Matched by the local name only
+            ([], {}),
+        ):
+            inject_bluetooth_service_info(
+                hass,
+                BluetoothServiceInfoBleak(
+                    name=LD2410b_SERVICE_INFO.name,
+                    address=LD2410b_SERVICE_INFO.address,
+                    rssi=-60,
+                    manufacturer_data={},
+                    service_data=service_data,
+                    service_uuids=service_uuids,
+                    source="local",
+                    device=LD2410b_SERVICE_INFO.device,
+                    advertisement=generate_advertisement_data(
+                        local_name=LD2410b_SERVICE_INFO.name,
+                        service_data=service_data,
+                        service_uuids=service_uuids,
+                        rssi=-60,
+                    ),
+                    time=0,
+                    connectable=True,
+                    tx_power=-127,
+                ),
+            )
+        await hass.async_block_till_done()
+
+    assert handle_mock.call_count == 4
+
+
+async def test_dispatcher_replays_last_advertisement(hass: HomeAssistant) -> None:
+    """Ensure entries set up after others get the last advertisement."""
+    inject_bluetooth_service_info(hass, LD2410b_SERVICE_INFO)
+    inject_bluetooth_service_info(hass, LD2410b_2_SERVICE_INFO)
+
+    entries = [
+        MockConfigEntry(
+            domain=DOMAIN,
+            data={
+                CONF_ADDRESS: service_info.address,
+                CONF_NAME: service_info.name,
+                CONF_SENSOR_TYPE: "ld2410",
+            },
+            entry_id=service_info.address,
+            unique_id=service_info.address.replace(":", "").lower(),
+        )
+        for service_info in (LD2410b_SERVICE_INFO, LD2410b_2_SERVICE_INFO)
+    ]
+    with (
+        patch("custom_components.ld2410.api.close_stale_connections_by_address"),
+        patch(
+            "custom_components.ld2410.api.devices.device.BaseDevice._ensure_connected",
+            AsyncMock(),
+        ),
+        patch("custom_components.ld2410.api.LD2410._on_connect", AsyncMock()),
+    ):
+        for entry in entries:
+            entry.add_to_hass(hass)
+            assert await hass.config_entries.async_setup(entry.entry_id)
+            await hass.async_block_till_done()
+
+    for entry in entries:
+        assert entry.runtime_data._last_raw_advertisement is not None
@@ -0,0 +1,103 @@
+"""Tests for the notification frame reassembler."""
+
+from __future__ import annotations
+
+from array import array
+
+import pytest
+from bleak.backends.device import BLEDevice
+
+from custom_components.ld2410.api.const import (
+    RX_FOOTER,
+    RX_HEADER,
+    TX_FOOTER,
+    TX_HEADER,
+)
+from custom_components.ld2410.api.devices.ld2410 import LD2410
+from custom_components.ld2410.api.reassembler import FrameReassembler
+
+RX = (bytes.fromhex(RX_HEADER), bytes.fromhex(RX_FOOTER))
+TX = (bytes.fromhex(TX_HEADER), bytes.fromhex(TX_FOOTER))
+UPLINK_PAYLOAD = bytes.fromhex(
+    "01aa034e00334e00643e000808123318050403050306000064202627190f1501015500"
+)
+
+
+def _frame(markers: tuple[bytes, bytes], payload: bytes) -> bytes:
+    header, footer = markers
+    return header + len(payload).to_bytes(2, "little") + payload + footer
+
+
+def test_single_frame_passthrough() -> None:
+    """A complete frame is returned as is."""
+    frame = _frame(RX, UPLINK_PAYLOAD)
+    reassembler = FrameReassembler((RX, TX))
+    assert reassembler.feed(bytearray(frame)) == [frame]
+    assert reassembler.pending == 0
+
+
+def test_fragmented_frame() -> None:
+    """Frames split across notifications are joined."""
+    frame = _frame(RX, UPLINK_PAYLOAD)
+    reassembler = FrameReassembler((RX, TX))
+    assert reassembler.feed(frame[:3]) == []
+    assert reassembler.feed(frame[3:20]) == []
+    assert reassembler.pending == 20
+    assert reassembler.feed(frame[20:]) == [frame]
+    assert reassembler.pending == 0
+
+
+def test_coalesced_frames() -> None:
+    """Several frames in one notification are split."""
+    uplink = _frame(RX, UPLINK_PAYLOAD)
+    ack = _frame(TX, bytes.fromhex("ff01000001004000"))
+    reassembler = FrameReassembler((RX, TX))
+    assert reassembler.feed(ack + uplink + uplink[:10]) == [ack, uplink]
+    assert reassembler.feed(uplink[10:]) == [uplink]
+
+
+def test_resync_after_garbage() -> None:
+    """Leading garbage and corrupt frames are skipped."""
+    uplink = _frame(RX, UPLINK_PAYLOAD)
+    corrupt = uplink[:-1] + b"\x00"
+    reassembler = FrameReassembler((RX, TX))
+    assert reassembler.feed(b"\x01\x02\x03" + corrupt + uplink) == [uplink]
+    assert reassembler.discarded_bytes == 3 + len(corrupt)
+
+
+def test_garbage_without_header_is_bounded() -> None:
+    """Data without a header is dropped except a possible header prefix."""
+    reassembler = FrameReassembler((RX, TX))
+    assert reassembler.feed(b"\x00" * 100 + RX[0][:2]) == []
+    assert reassembler.pending == 2
+    assert reassembler.feed(b"\x00" * 100) == []
+    assert reassembler.pending == 0
+
+
+def test_oversized_length_resyncs() -> None:
+    """A bogus length field does not stall the stream."""
+    uplink = _frame(RX, UPLINK_PAYLOAD)
+    bogus = RX[0] + b"\xff\xff"
+    reassembler = FrameReassembler((RX, TX), max_size=128)
+    assert reassembler.feed(bogus + uplink) == [uplink]
+    assert reassembler.pending == 0
+
+
+def test_mismatched_header_sizes_rejected() -> None:
+    """All headers must share the same size."""
+    with pytest.raises(ValueError):
+        FrameReassembler(((b"\x01\x02", b"\x03"), (b"\x01", b"\x03")))
+
+
+def test_device_handles_split_notifications() -> None:
+    """The device parses uplink frames delivered in fragments."""
+    frame = _frame(RX, UPLINK_PAYLOAD)
+    device = LD2410(
+        device=BLEDevice(address="AA:BB", name="test", details=None, rssi=-60)
+    )
+    device._notification_handler(0, bytearray(frame[:7]))
+    assert device.parsed_data == {}
+    device._notification_handler(0, bytearray(frame[7:] + frame[:5]))
+    assert device.parsed_data["move_gate_energy"] == array(
+        "B", [18, 51, 24, 5, 4, 3, 5, 3, 6]
+    )
@@ -0,0 +1,60 @@
+"""Tests for the round trip time estimator."""
+
+import pytest
+
+from custom_components.ld2410.api.rtt import MAX_BACKOFF, RttEstimator
+
+
+def _estimator() -> RttEstimator:
+    return RttEstimator(initial_timeout=5, min_timeout=1, max_timeout=15)
+
+
+def test_initial_timeout_without_samples() -> None:
+    """Without measurements the initial timeout is used."""
+    rtt = _estimator()
+    assert rtt.timeout == 5
+    assert rtt.backoff(0.25) == 0.25
+    assert rtt.as_dict() == {"srtt_ms": None, "rttvar_ms": None, "timeout_ms": 5000}
+
+
+def test_samples_follow_rfc6298() -> None:
+    """Mean and deviation are smoothed like TCP's RTO."""
+    rtt = _estimator()
+    rtt.sample(0.4)
+    assert rtt.srtt == pytest.approx(0.4)
+    assert rtt.rttvar == pytest.approx(0.2)
+    assert rtt.timeout == pytest.approx(1.2)
+
+    rtt.sample(0.8)
+    assert rtt.rttvar == pytest.approx(0.75 * 0.2 + 0.25 * 0.4)
+    assert rtt.srtt == pytest.approx(0.875 * 0.4 + 0.125 * 0.8)
+    assert rtt.backoff(0.25) == pytest.approx(rtt.srtt)
+
+
+def test_timeout_is_bounded() -> None:
+    """Fast links keep the minimum and slow links the maximum timeout."""
+    rtt = _estimator()
+    for _ in range(10):
+        rtt.sample(0.02)
+    assert rtt.timeout == 1
+
+    slow = _estimator()
+    slow.sample(10)
+    assert slow.timeout == 15
+
+
+def test_timeouts_back_off_until_next_sample() -> None:
+    """Each timeout doubles the timeout, a new sample resets it."""
+    rtt = _estimator()
+    rtt.sample(0.5)
+    base = rtt.timeout
+    rtt.timed_out()
+    assert rtt.timeout == pytest.approx(base * 2)
+    rtt.timed_out()
+    assert rtt.timeout == pytest.approx(base * 4)
+    for _ in range(5):
+        rtt.timed_out()
+    assert rtt.timeout == pytest.approx(base * MAX_BACKOFF)
+
+    rtt.sample(0.5)
+    assert rtt.timeout < base * 2
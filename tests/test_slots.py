@@ -0,0 +1,93 @@
+"""Tests for the connection slots of an adapter."""
+
+import asyncio
+
+import pytest
+
+from custom_components.ld2410.api.slots import ConnectionSlots
+
+
+async def _admitted(
+    slots: ConnectionSlots, waiters: dict[str, tuple[int, int]]
+) -> tuple[list[str], dict[str, asyncio.Task[None]]]:
+    order: list[str] = []
+
+    async def _acquire(address: str, rssi: int, priority: int) -> None:
+        await slots.acquire(address, rssi, priority)
+        order.append(address)
+
+    tasks = {
+        address: asyncio.create_task(_acquire(address, rssi, priority))
+        for address, (rssi, priority) in waiters.items()
+    }
+    await asyncio.sleep(0)
+    return order, tasks
+
+
+@pytest.mark.asyncio
+async def test_slots_bound_connections() -> None:
+    """Devices beyond the slot count wait for a release."""
+    slots = ConnectionSlots("proxy", slots=2, stagger=0)
+    order, tasks = await _admitted(slots, {"a": (-60, 1), "b": (-60, 1), "c": (-60, 1)})
+    await asyncio.sleep(0)
+    assert order == ["a", "b"]
+    assert slots.as_dict() == {
+        "source": "proxy",
+        "slots": 2,
+        "in_use": 2,
+        "waiting": 1,
+    }
+    slots.release("a")
+    await tasks["c"]
+    assert order == ["a", "b", "c"]
+    # Releasing twice or without a slot does nothing
+    slots.release("a")
+    slots.release("x")
+    assert slots.as_dict()["in_use"] == 2
+
+
+@pytest.mark.asyncio
+async def test_slots_admit_by_priority_then_rssi() -> None:
+    """The strongest device of the highest priority is admitted first."""
+    slots = ConnectionSlots("proxy", slots=1, stagger=0)
+    await slots.acquire("holder", -50, 1)
+    order, tasks = await _admitted(
+        slots,
+        {"weak": (-90, 1), "strong": (-40, 1), "interactive": (-95, 0)},
+    )
+    for _ in range(3):
+        slots.release(order[-1] if order else "holder")
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks.values())
+    assert order == ["interactive", "strong", "weak"]
+
+
+@pytest.mark.asyncio
+async def test_slots_stagger_admissions() -> None:
+    """Admissions through one adapter are spread out."""
+    slots = ConnectionSlots("proxy", slots=3, stagger=0.05)
+    loop = asyncio.get_running_loop()
+    admitted: list[float] = []
+
+    async def _acquire(address: str) -> None:
+        await slots.acquire(address, -60, 1)
+        admitted.append(loop.time())
+
+    await asyncio.gather(*(_acquire(address) for address in "abc"))
+    assert admitted[1] - admitted[0] >= 0.04
+    assert admitted[2] - admitted[1] >= 0.04
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_is_skipped() -> None:
+    """A waiter cancelled before admission does not take a slot."""
+    slots = ConnectionSlots("proxy", slots=1, stagger=0)
+    await slots.acquire("holder", -60, 1)
+    order, tasks = await _admitted(slots, {"gone": (-40, 1), "next": (-60, 1)})
+    tasks["gone"].cancel()
+    await asyncio.sleep(0)
+    assert slots.waiting == 1
+    slots.release("holder")
+    await tasks["next"]
+    assert order == ["next"]
+    assert slots.as_dict()["in_use"] == 1
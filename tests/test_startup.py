@@ -0,0 +1,117 @@
+"""Tests for the startup scheduler."""
+
+import asyncio
+from collections.abc import Callable
+from types import SimpleNamespace
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.ld2410.startup import StartupScheduler
+
+
+class _FakeDevice:
+    """Device whose connection completes when released by the test."""
+
+    def __init__(self, name: str, order: list[str], source: str | None = None) -> None:
+        self.name = name
+        self.receiving_frames = False
+        self.connection_slots = (
+            None if source is None else SimpleNamespace(source=source)
+        )
+        self.connected = asyncio.Event()
+        self._order = order
+        self._callbacks: list[Callable[[], None]] = []
+
+    async def _ensure_connected(self) -> bool:
+        self._order.append(self.name)
+        await self.connected.wait()
+        return True
+
+    def subscribe(self, callback: Callable[[], None]) -> Callable[[], None]:
+        self._callbacks.append(callback)
+        return lambda: self._callbacks.remove(callback)
+
+    def frame(self) -> None:
+        self.receiving_frames = True
+        for callback in list(self._callbacks):
+            callback()
+
+
+async def test_startup_order_and_concurrency(hass: HomeAssistant) -> None:
+    """Devices connect by priority and RSSI, a bounded number at a time."""
+    scheduler = StartupScheduler(hass)
+    order: list[str] = []
+    devices = {
+        name: _FakeDevice(name, order) for name in ("weak", "strong", "first", "mid")
+    }
+    # The first entry starts right away, the others queue behind it
+    for name, rssi, priority in (
+        ("mid", -70, 0),
+        ("weak", -90, 0),
+        ("strong", -40, 0),
+        ("first", -95, 1),
+    ):
+        scheduler.async_schedule(
+            name, devices[name], rssi=rssi, priority=priority, concurrency=1
+        )
+    await asyncio.sleep(0)
+    assert order == ["mid"]
+
+    for name in ("mid", "first", "strong"):
+        devices[name].connected.set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+    devices["weak"].connected.set()
+    await hass.async_block_till_done()
+    assert order == ["mid", "first", "strong", "weak"]
+
+
+async def test_startup_concurrency_per_proxy(hass: HomeAssistant) -> None:
+    """Devices behind a saturated proxy do not hold up other proxies."""
+    scheduler = StartupScheduler(hass)
+    order: list[str] = []
+    devices = {
+        name: _FakeDevice(name, order, source)
+        for name, source in (
+            ("stuck", "busy"),
+            ("queued", "busy"),
+            ("other", "idle"),
+        )
+    }
+    for name, rssi in (("stuck", -40), ("queued", -50), ("other", -60)):
+        scheduler.async_schedule(
+            name, devices[name], rssi=rssi, priority=0, concurrency=1
+        )
+    await asyncio.sleep(0)
+    assert order == ["stuck", "other"]
+
+    devices["stuck"].connected.set()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert order == ["stuck", "other", "queued"]
+    for device in devices.values():
+        device.connected.set()
+    await hass.async_block_till_done()
+
+
+async def test_startup_records_time_to_first_frame(hass: HomeAssistant) -> None:
+    """The time to the first frame is reported per entry."""
+    scheduler = StartupScheduler(hass)
+    device = _FakeDevice("device", [])
+    device.connected.set()
+    cancel = scheduler.async_schedule(
+        "entry", device, rssi=-60, priority=0, concurrency=3
+    )
+    await hass.async_block_till_done()
+    assert scheduler.async_diagnostics("entry") == {
+        "concurrency": 3,
+        "time_to_first_frame_s": None,
+    }
+
+    device.frame()
+    assert scheduler.async_diagnostics("entry")["time_to_first_frame_s"] is not None
+    # Later frames are not measured again
+    assert device._callbacks == []
+
+    cancel()
+    assert scheduler.concurrency == 2
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from array import array
+from unittest.mock import patch
+
 import pytest
 
 import logging
@@ -76,15 +79,14 @@ async def test_notification_handler_engineering_frame_updates_data(caplog) -> No
         "detect_distance_cm": 62,
         "max_move_gate": 8,
         "max_still_gate": 8,
-        "move_gate_energy": [18, 51, 24, 5, 4, 3, 5, 3, 6],
-        "still_gate_energy": [0, 0, 100, 32, 38, 39, 25, 15, 21],
+        "move_gate_energy": array("B", [18, 51, 24, 5, 4, 3, 5, 3, 6]),
+        "still_gate_energy": array("B", [0, 0, 100, 32, 38, 39, 25, 15, 21]),
         "photo_sensor": 1,
         "out_pin": True,
     }
     assert device.parsed_data == expected
     assert called
     assert await device.get_basic_info() == expected
-    device._cancel_disconnect_timer()
 
 
 @pytest.mark.asyncio
@@ -115,12 +117,159 @@ async def test_notification_handler_initializes_without_advertisement() -> None:
         "detect_distance_cm": 62,
         "max_move_gate": 8,
         "max_still_gate": 8,
-        "move_gate_energy": [18, 51, 24, 5, 4, 3, 5, 3, 6],
-        "still_gate_energy": [0, 0, 100, 32, 38, 39, 25, 15, 21],
+        "move_gate_energy": array("B", [18, 51, 24, 5, 4, 3, 5, 3, 6]),
+        "still_gate_energy": array("B", [0, 0, 100, 32, 38, 39, 25, 15, 21]),
         "photo_sensor": 1,
         "out_pin": True,
     }
 
     assert device.parsed_data == expected
     assert await device.get_basic_info() == expected
-    device._cancel_disconnect_timer()
+
+
+@pytest.mark.asyncio
+async def test_update_keeps_uplink_frame_out_of_advertisement_data() -> None:
+    """A full update does not copy the live frame into the base data."""
+    payload_hex = (
+        "01aa034e00334e00643e000808123318050403050306000064202627190f1501015500"
+    )
+    length = (len(payload_hex) // 2).to_bytes(2, "little").hex()
+    device = LD2410(
+        device=BLEDevice(address="AA:BB", name="test", details=None, rssi=-60)
+    )
+    device._update_parsed_data({"firmware_version": "2.0.0"})
+    device._notification_handler(
+        0, bytearray.fromhex(RX_HEADER + length + payload_hex + RX_FOOTER)
+    )
+
+    await device.update()
+
+    assert device.data["data"] == {"firmware_version": "2.0.0"}
+    assert device.parsed_data["move_energy"] == 51
+
+
+@pytest.mark.parametrize(
+    ("payload_hex", "message"),
+    [
+        ("03aa0101001402002803005500", "unknown frame type"),
+        ("02aa01010014020028030055ff", "missing frame footer"),
+        ("02aa01010014020028035500", "too short"),
+        ("01aa034e00334e00643e005500", "missing gate counts"),
+        ("01aa034e00334e00643e0008081233185500", "missing gate energy"),
+        (
+            "01aa034e00334e00643e000808123318050403050306000064202627190f155500",
+            "missing photo sensor",
+        ),
+    ],
+)
+def test_parse_uplink_frame_rejects_malformed(payload_hex: str, message: str) -> None:
+    """Malformed uplink payloads raise ValueError."""
+    device = LD2410(
+        device=BLEDevice(address="AA:BB", name="test", details=None, rssi=-60)
+    )
+    with pytest.raises(ValueError, match=message):
+        device._parse_uplink_frame(bytes.fromhex(payload_hex))
+
+
+def test_parse_uplink_frame_accepts_memoryview() -> None:
+    """The decoder works on zero-copy views of a larger buffer."""
+    payload = bytes.fromhex(
+        "01aa034e00334e00643e000808123318050403050306000064202627190f1501015500"
+    )
+    device = LD2410(
+        device=BLEDevice(address="AA:BB", name="test", details=None, rssi=-60)
+    )
+    buffer = bytearray(b"\xff" * 3 + payload + b"\xff")
+    view = memoryview(buffer)[3 : 3 + len(payload)]
+    assert device._parse_uplink_frame(view) == device._parse_uplink_frame(payload)
+    assert device._parse_uplink_frame(b"\x01\x00") is None
+
+
+def test_duplicate_uplink_frames_are_skipped() -> None:
+    """Byte-identical frames do not trigger parsing or callbacks."""
+    payload_hex = (
+        "01aa034e00334e00643e000808123318050403050306000064202627190f1501015500"
+    )
+    length = (len(payload_hex) // 2).to_bytes(2, "little").hex()
+    frame = bytearray.fromhex(RX_HEADER + length + payload_hex + RX_FOOTER)
+    device = LD2410(
+        device=BLEDevice(address="AA:BB", name="test", details=None, rssi=-60)
+    )
+    calls = 0
+
+    def _cb() -> None:
+        nonlocal calls
+        calls += 1
+
+    device.subscribe(_cb)
+    with patch.object(
+        device, "_parse_uplink_frame", wraps=device._parse_uplink_frame
+    ) as parse:
+        device._notification_handler(0, frame)
+        device._notification_handler(0, frame)
+        device._notification_handler(0, frame)
+
+    assert parse.call_count == 1
+    assert calls == 1
+    assert device.skipped_frames == 2
+    assert device.diagnostics["skipped_frames"] == 2
+
+    # The first frame after a reconnect is always published
+    device._reassembler.reset()
+    device._last_uplink_frame = None
+    device._notification_handler(0, frame)
+    assert calls == 2
+
+
+def test_keyed_subscribers_wake_on_their_keys_only() -> None:
+    """A single gate energy change wakes only that gate's subscriber."""
+    payload = bytearray.fromhex(
+        "01aa034e00334e00643e000808123318050403050306000064202627190f1501015500"
+    )
+    device = LD2410(
+        device=BLEDevice(address="AA:BB", name="test", details=None, rssi=-60)
+    )
+    woken: list[str] = []
+    for key in ("move_gate_energy_3", "move_gate_energy_4", "occupancy"):
+        device.subscribe(lambda key=key: woken.append(key), keys=(key,))
+    device.subscribe(lambda: woken.append("all"))
+    device.subscribe(lambda: woken.append("none"), keys=())
+
+    def _frame() -> bytearray:
+        length = len(payload).to_bytes(2, "little").hex()
+        return bytearray.fromhex(RX_HEADER + length + payload.hex() + RX_FOOTER)
+
+    device._notification_handler(0, _frame())
+    assert woken == [
+        "move_gate_energy_3",
+        "move_gate_energy_4",
+        "occupancy",
+        "all",
+        "none",
+    ]
+
+    woken.clear()
+    # move_gate_energy[3] is at payload offset 16
+    payload[16] += 1
+    device._notification_handler(0, _frame())
+    assert woken == ["all", "move_gate_energy_3"]
+
+
+def test_update_parsed_data_reports_changed_keys() -> None:
+    """Configuration updates report changed keys including list items."""
+    device = LD2410(
+        device=BLEDevice(address="AA:BB", name="test", details=None, rssi=-60)
+    )
+    assert device._update_parsed_data(
+        {"absence_delay": 5, "move_gate_sensitivity": [10, 20]}
+    ) == {
+        "absence_delay",
+        "move_gate_sensitivity",
+        "move_gate_sensitivity_0",
+        "move_gate_sensitivity_1",
+    }
+    assert device._update_parsed_data({"absence_delay": 5}) == set()
+    assert device._update_parsed_data({"move_gate_sensitivity": [10, 30]}) == {
+        "move_gate_sensitivity",
+        "move_gate_sensitivity_1",
+    }